@@ -1,7 +1,23 @@
+try:
+   import numpy as np
+   from numpy.lib.stride_tricks import as_strided
+except ImportError:
+   np = None
+
+# ----------------------------------------------------------------------
+# Tabela com os 8 bits de cada valor de byte (0 -> '00000000', ...,
+# 255 -> '11111111'): a conversão vira uma consulta por byte
+TABELA_BITS = tuple(f'{intByte:08b}' for intByte in range(256))
+
+if np is not None:
+   # A mesma tabela como matriz 256 x 8 de códigos ASCII ('0' e '1')
+   ARR_TABELA_BITS = np.frombuffer(''.join(TABELA_BITS).encode('ascii'), dtype=np.uint8).reshape(256, 8)
+
+
 # ----------------------------------------------------------------------
 def dec2bin(numero: int) -> str:
    """Converte um número decimal para binário, retornando uma string
-   com o valor binário completo em bytes (8 bits).
+   com o prefixo '0b' e o valor binário completo em bytes (8 bits).
 
    Args:
       numero (int): Número decimal a ser convertido.
@@ -11,20 +27,109 @@ def dec2bin(numero: int) -> str:
    """
    if not isinstance(numero, int):
       raise TypeError('\nERRO: O valor deve ser um número inteiro...\n')
-   
+
    if numero < 0:
       raise ValueError('\nERRO: Número deve ser não negativo...\n')
 
-   # Converter para binário e remover o prefixo '0b'
-   binRetorno = bin(numero)[2:]  
+   # bin() já é feito em C: basta completar com zeros à esquerda até um
+   # múltiplo de 8 bits (mais rápido que montar o texto pela tabela)
+   binRetorno = bin(numero)
+   intResto = (len(binRetorno) - 2) % 8
+   return binRetorno if not intResto else '0b' + '00000000'[intResto:] + binRetorno[2:]
 
-   if len(binRetorno) % 8 != 0:
-      # Calcular quantos zeros são necessários para completar o byte
-      intZeros = 8 - len(binRetorno) % 8
 
-      # Adicionar os zeros à esquerda
-      binRetorno = '0b' + ('0' * intZeros) + binRetorno
+# ----------------------------------------------------------------------
+def formatarBinario(valor, separador: str = '') -> str:
+   """Converte um inteiro não negativo (ou bytes) para binário, com 8
+   bits por byte, consultando a tabela TABELA_BITS.
+
+   Args:
+      valor (int | bytes): Valor a ser convertido.
+      separador (str): Texto colocado entre os octetos (ex: ' ' ou '.').
+
+   Returns:
+      str: Representação binária do valor (sem o prefixo '0b').
+   """
+   if isinstance(valor, int):
+      if valor < 0:
+         raise ValueError('\nERRO: Número deve ser não negativo...\n')
+      valor = valor.to_bytes(max(1, (valor.bit_length() + 7) // 8), 'big')
+
+   return separador.join([TABELA_BITS[intByte] for intByte in valor])
+
 
-   return binRetorno
 # ----------------------------------------------------------------------
+def formatarBinarioLote(dados, largura: int = None, separador: str = ' ', fim: str = '\n') -> bytes:
+   """Converte, de uma só vez, um buffer de bytes (ex: um pacote) ou um
+   array de inteiros para texto binário, uma linha por grupo de
+   'largura' bytes. O resultado é montado em um único buffer alocado
+   antecipadamente (sem criar uma string por número).
 
+   Args:
+      dados (bytes | np.ndarray): Bytes ou array de inteiros sem sinal
+         (cada inteiro é escrito com todos os seus bytes, big-endian).
+      largura (int): Bytes por linha (padrão: 1 para bytes e o tamanho
+         do tipo para arrays, ex: 4 para uint32).
+      separador (str): Texto colocado entre os octetos de uma linha.
+      fim (str): Texto colocado ao final de cada linha (1 caractere).
+
+   Returns:
+      bytes: O texto binário (ASCII), pronto para ser gravado.
+   """
+   if len(fim) != 1:
+      raise ValueError('\nERRO: O fim de linha deve ter exatamente 1 caractere...\n')
+
+   if np is None:
+      return _formatarBinarioLotePython(dados, largura or 1, separador, fim)
+
+   if isinstance(dados, np.ndarray):
+      if dados.dtype.kind != 'u':
+         raise TypeError('\nERRO: O array deve ser de inteiros sem sinal...\n')
+      largura = largura or dados.dtype.itemsize
+      arrBytes = dados.astype(dados.dtype.newbyteorder('>'), copy=False).reshape(-1).view(np.uint8)
+   else:
+      largura = largura or 1
+      arrBytes = np.frombuffer(dados, dtype=np.uint8)
+   if largura < 1:
+      raise ValueError('\nERRO: A largura deve ser maior que zero...\n')
+   if not arrBytes.size: return b''
+
+   # Completa a última linha com zeros (o excesso é cortado no final)
+   intQtLinhas = -(-arrBytes.size // largura)
+   arrMatriz = np.zeros(intQtLinhas * largura, dtype=np.uint8)
+   arrMatriz[:arrBytes.size] = arrBytes
+   arrMatriz = arrMatriz.reshape(intQtLinhas, largura)
+
+   # Linha: octeto (separador octeto)* fim
+   bytSeparador = separador.encode('ascii')
+   intPasso  = 8 + len(bytSeparador)
+   intLinha  = largura * intPasso - len(bytSeparador) + 1
+   arrBuffer = np.empty(intQtLinhas * intLinha, dtype=np.uint8)
+
+   # Visões (sem cópia) das posições de bits, separadores e fins de linha
+   arrBits = as_strided(arrBuffer, shape=(intQtLinhas, largura, 8), strides=(intLinha, intPasso, 1))
+   np.take(ARR_TABELA_BITS, arrMatriz, axis=0, out=arrBits, mode='clip')
+   if bytSeparador and largura > 1:
+      arrSeparadores = as_strided(arrBuffer[8:], shape=(intQtLinhas, largura - 1, len(bytSeparador)),
+                                  strides=(intLinha, intPasso, 1))
+      arrSeparadores[...] = np.frombuffer(bytSeparador, dtype=np.uint8)
+   arrBuffer[intLinha - 1::intLinha] = ord(fim)
+
+   # Remove os octetos de preenchimento da última linha
+   intResto = arrBytes.size - (intQtLinhas - 1) * largura
+   intTamanho = (intQtLinhas - 1) * intLinha + intResto * intPasso - len(bytSeparador) + 1
+   arrBuffer[intTamanho - 1] = ord(fim)
+   return arrBuffer[:intTamanho].tobytes()
+
+
+# ----------------------------------------------------------------------
+def _formatarBinarioLotePython(dados, largura: int, separador: str, fim: str) -> bytes:
+   """Versão sem NumPy de formatarBinarioLote (apenas bytes ou listas
+   de inteiros de 0 a 255).
+   """
+   bytDados = bytes(dados)
+   return ''.join(
+      formatarBinario(bytDados[intPos:intPos + largura], separador) + fim
+      for intPos in range(0, len(bytDados), largura)
+   ).encode('ascii')
+# ----------------------------------------------------------------------
@@ -0,0 +1,209 @@
+'''
+   Operações Bit a Bit (AND, OR, XOR, NOT, Deslocamento e Contagem)
+   sobre Buffers Inteiros
+
+   Os exemplos exemplo_05_and.py e exemplo_05_or.py aplicam os operadores
+   &, | e ^ a um número por vez. As funções abaixo aplicam a mesma
+   operação a um buffer inteiro (bytes, bytearray ou array NumPy) em uma
+   única chamada, sem laço em Python por byte:
+
+      - Com NumPy: cada operação é um único laço em C sobre o buffer
+        (limitado pela velocidade da memória);
+      - Sem NumPy: o buffer é convertido em um único inteiro grande
+        (int.from_bytes), a operação é feita nesse inteiro e o resultado
+        volta para bytes.
+
+   Regras:
+      - bytes/bytearray/memoryview são tratados como uma única sequência
+        de bits (big-endian, o primeiro byte contém os bits mais altos) e
+        o resultado é bytes;
+      - arrays NumPy (inteiros sem sinal) são tratados elemento a elemento
+        e o resultado é um array (ou o array 'saida', se informado).
+
+   Exemplo:
+      bytPacote = bytes.fromhex('45000054')
+      print(andBits(bytPacote, 0xF0).hex())     # -> 40000050
+      print(contarBits(bytPacote))               # -> 6
+      print(mascaraContigua(b'\\xff\\xff\\xff\\x00'))  # -> True
+'''
+try:
+   import numpy as np
+except ImportError:
+   np = None
+
+
+# ----------------------------------------------------------------------
+def _ehBuffer(dados) -> bool:
+   return isinstance(dados, (bytes, bytearray, memoryview))
+
+
+# ----------------------------------------------------------------------
+def _paraArray(dados):
+   """Retorna um array NumPy (sem cópia quando possível) com os dados.
+   """
+   if _ehBuffer(dados): return np.frombuffer(dados, dtype=np.uint8)
+   if not isinstance(dados, np.ndarray) or dados.dtype.kind != 'u':
+      raise TypeError('\nERRO: Os dados devem ser bytes ou um array NumPy de inteiros sem sinal...\n')
+   return dados
+
+
+# ----------------------------------------------------------------------
+def _operarBinario(funcao, operador, a, b, saida):
+   """Aplica uma operação de dois operandos (AND, OR ou XOR). O operando
+   'b' pode ser um inteiro, repetido sobre todos os bytes/elementos.
+   """
+   if isinstance(b, int) and _ehBuffer(a) and not 0 <= b <= 0xFF:
+      raise ValueError('\nERRO: A máscara inteira deve estar entre 0 e 255...\n')
+   if isinstance(b, int) and np is not None and isinstance(a, np.ndarray) and a.dtype.kind == 'u':
+      intMaximo = np.iinfo(a.dtype).max
+      if not 0 <= b <= intMaximo:
+         raise ValueError(f'\nERRO: A máscara inteira deve estar entre 0 e {intMaximo} ({a.dtype})...\n')
+   if not isinstance(b, int) and len(a) != len(b):
+      raise ValueError('\nERRO: Os dois operandos devem ter o mesmo tamanho...\n')
+
+   if np is None:
+      if not _ehBuffer(a):
+         raise TypeError('\nERRO: Sem NumPy, os dados devem ser bytes...\n')
+      intB = int.from_bytes(bytes([b]) * len(a) if isinstance(b, int) else b, 'big')
+      return operador(int.from_bytes(a, 'big'), intB).to_bytes(len(a), 'big')
+
+   arrA = _paraArray(a)
+   arrB = b if isinstance(b, int) else _paraArray(b)
+   arrResultado = funcao(arrA, arrB, out=saida)
+   return arrResultado.tobytes() if _ehBuffer(a) and saida is None else arrResultado
+
+
+# ----------------------------------------------------------------------
+def andBits(a, b, saida = None):
+   """Calcula a AND b (bit a bit) sobre todo o buffer.
+
+   Args:
+      a (bytes | np.ndarray): Primeiro operando.
+      b (bytes | np.ndarray | int): Segundo operando (ou máscara repetida).
+      saida (np.ndarray): Array onde o resultado é gravado (opcional).
+
+   Returns:
+      bytes | np.ndarray: O resultado.
+   """
+   return _operarBinario(np and np.bitwise_and, lambda x, y: x & y, a, b, saida)
+
+
+# ----------------------------------------------------------------------
+def orBits(a, b, saida = None):
+   """Calcula a OR b (bit a bit) sobre todo o buffer.
+   """
+   return _operarBinario(np and np.bitwise_or, lambda x, y: x | y, a, b, saida)
+
+
+# ----------------------------------------------------------------------
+def xorBits(a, b, saida = None):
+   """Calcula a XOR b (bit a bit) sobre todo o buffer.
+   """
+   return _operarBinario(np and np.bitwise_xor, lambda x, y: x ^ y, a, b, saida)
+
+
+# ----------------------------------------------------------------------
+def notBits(dados, saida = None):
+   """Inverte todos os bits do buffer (NOT).
+   """
+   if np is None:
+      intMascara = (1 << (8 * len(dados))) - 1
+      return (int.from_bytes(dados, 'big') ^ intMascara).to_bytes(len(dados), 'big')
+
+   arrResultado = np.invert(_paraArray(dados), out=saida)
+   return arrResultado.tobytes() if _ehBuffer(dados) and saida is None else arrResultado
+
+
+# ----------------------------------------------------------------------
+def deslocarBits(dados, bits: int):
+   """Desloca os bits para a esquerda (bits > 0) ou para a direita
+   (bits < 0). O tamanho não muda: os bits que saem são descartados e
+   os que entram são zeros.
+
+   Em bytes, o buffer inteiro é uma única sequência de bits (os bits
+   passam de um byte para o vizinho); em arrays, cada elemento é
+   deslocado separadamente.
+
+   Args:
+      dados (bytes | np.ndarray): Os dados.
+      bits (int): Quantidade de bits (positivo: esquerda, negativo: direita).
+
+   Returns:
+      bytes | np.ndarray: O resultado.
+   """
+   if np is not None and not _ehBuffer(dados):
+      arrDados = _paraArray(dados)
+      intLargura = 8 * arrDados.dtype.itemsize
+      if abs(bits) >= intLargura: return np.zeros_like(arrDados)
+      return arrDados << bits if bits >= 0 else arrDados >> -bits
+
+   intTamanho = len(dados)
+   if np is None:
+      intValor = int.from_bytes(dados, 'big')
+      intValor = intValor << bits if bits >= 0 else intValor >> -bits
+      return (intValor & ((1 << (8 * intTamanho)) - 1)).to_bytes(intTamanho, 'big')
+
+   # Com NumPy: desloca bytes inteiros e, depois, o resto (0 a 7 bits),
+   # juntando cada byte com os bits que vêm do vizinho
+   arrDados = _paraArray(dados)
+   intBytes, intResto = divmod(abs(bits), 8)
+   arrResultado = np.zeros(intTamanho, dtype=np.uint8)
+   if intBytes >= intTamanho: return arrResultado.tobytes()
+
+   if bits >= 0:
+      arrOrigem = arrDados[intBytes:]
+      arrDestino = arrResultado[:intTamanho - intBytes]
+      if not intResto:
+         arrDestino[:] = arrOrigem
+      else:
+         np.left_shift(arrOrigem, intResto, out=arrDestino)
+         arrDestino[:-1] |= arrOrigem[1:] >> (8 - intResto)
+   else:
+      arrOrigem = arrDados[:intTamanho - intBytes]
+      arrDestino = arrResultado[intBytes:]
+      if not intResto:
+         arrDestino[:] = arrOrigem
+      else:
+         np.right_shift(arrOrigem, intResto, out=arrDestino)
+         arrDestino[1:] |= arrOrigem[:-1] << (8 - intResto)
+   return arrResultado.tobytes()
+
+
+# ----------------------------------------------------------------------
+def contarBits(dados):
+   """Conta os bits 1 (popcount).
+
+   Returns:
+      int | np.ndarray: Total de bits 1 do buffer (bytes) ou a contagem
+         de cada elemento (arrays).
+   """
+   if np is None:
+      return int.from_bytes(dados, 'big').bit_count()
+
+   arrDados = _paraArray(dados)
+   if hasattr(np, 'bitwise_count'):
+      arrContagem = np.bitwise_count(arrDados)
+   else:
+      arrContagem = np.unpackbits(arrDados.view(np.uint8)).reshape(arrDados.size, -1).sum(axis=1)
+   return int(arrContagem.sum(dtype=np.int64)) if _ehBuffer(dados) else arrContagem
+
+
+# ----------------------------------------------------------------------
+def mascaraContigua(dados):
+   """Verifica se os bits formam uma máscara de rede válida: todos os 1
+   à esquerda e todos os 0 à direita (ex: 255.255.255.0).
+
+   O teste usa o complemento da máscara: ~m deve ser da forma 0...01...1,
+   ou seja, ~m & (~m + 1) == 0.
+
+   Returns:
+      bool | np.ndarray: Resultado para o buffer (bytes) ou para cada
+         elemento (arrays).
+   """
+   if np is None or _ehBuffer(dados):
+      intBits = 8 * len(dados)
+      intInvertido = int.from_bytes(dados, 'big') ^ ((1 << intBits) - 1)
+      return intInvertido & (intInvertido + 1) == 0
+
+   arrInvertido = np.invert(_paraArray(dados))
+   return (arrInvertido & (arrInvertido + 1)) == 0
@@ -0,0 +1,35 @@
+'''
+   Testes de regressão do funcoes.py
+
+   Exemplo de uso:
+      python -m unittest test_funcoes.py
+'''
+import random, unittest
+
+from funcoes import dec2bin, formatarBinario
+
+
+# ----------------------------------------------------------------------
+class TesteDec2bin(unittest.TestCase):
+
+   def testBytesCompletos(self):
+      self.assertEqual(dec2bin(0), '0b00000000')
+      self.assertEqual(dec2bin(5), '0b00000101')
+      self.assertEqual(dec2bin(255), '0b11111111')
+      self.assertEqual(dec2bin(256), '0b0000000100000000')
+
+   def testIgualAFormatarBinario(self):
+      rndGerador = random.Random(2025)
+      for _ in range(2000):
+         intNumero = rndGerador.getrandbits(rndGerador.randint(1, 80))
+         self.assertEqual(dec2bin(intNumero), '0b' + formatarBinario(intNumero))
+
+   def testInvalidos(self):
+      with self.assertRaises(ValueError):
+         dec2bin(-1)
+      with self.assertRaises(TypeError):
+         dec2bin(1.0)
+
+
+if __name__ == '__main__':
+   unittest.main()
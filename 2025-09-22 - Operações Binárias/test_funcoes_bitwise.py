@@ -0,0 +1,36 @@
+'''
+   Testes de regressão do funcoes_bitwise.py
+
+   Exemplo de uso:
+      python -m unittest test_funcoes_bitwise.py
+'''
+import unittest
+
+import numpy as np
+
+from funcoes_bitwise import andBits, orBits, xorBits
+
+
+# ----------------------------------------------------------------------
+class TesteMascaraInteira(unittest.TestCase):
+
+   def testMascaraForaDoTipo(self):
+      # Em arrays, a máscara fora do intervalo do dtype gerava OverflowError do NumPy
+      for funcao in (andBits, orBits, xorBits):
+         for intMascara in (256, -1):
+            with self.subTest(funcao=funcao.__name__, mascara=intMascara), self.assertRaises(ValueError):
+               funcao(np.array([1, 2, 255], dtype=np.uint8), intMascara)
+
+   def testMascaraNoLimite(self):
+      arrDados = np.array([0x12345678], dtype=np.uint32)
+      self.assertEqual(andBits(arrDados, 0xFFFF0000).tolist(), [0x12340000])
+      self.assertEqual(xorBits(arrDados, 0xFFFFFFFF).tolist(), [0xEDCBA987])
+
+   def testMascaraEmBytes(self):
+      self.assertEqual(andBits(bytes.fromhex('45000054'), 0xF0).hex(), '40000050')
+      with self.assertRaises(ValueError):
+         orBits(b'\x01', 256)
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,269 @@
+'''
+   Benchmark das Funções do IP-CALC e das Operações Binárias
+
+   Mede a vazão (operações por segundo) e o pico de memória alocada
+   (tracemalloc) de:
+      - validarIP, validarCIDR e classificarIP (ip_calc_v2_funcoes.py),
+        a partir dos endereços em texto, como chegam ao programa;
+      - ip2int, quando existir nesta versão;
+      - dec2bin (2025-09-22 - Operações Binárias/funcoes.py);
+      - as contas de máscara, rede, 1º host, broadcast e último host do
+        ip_calc_v2.py, uma por vez (escalar) e em lote (NumPy, quando o
+        ip_calc_v2_vetorizado.py existir), inclusive a partir do texto.
+
+   Apenas as funções da versão original do IP-CALC são obrigatórias: as
+   demais são detectadas, para que o mesmo benchmark possa ser executado
+   em commits antigos e comparado com os atuais.
+
+   Os dados são sintéticos e reprodutíveis (mesma semente -> mesmos
+   endereços). O tempo de cada caso é o melhor de N repetições; a
+   memória é medida em uma execução separada, pois o tracemalloc deixa
+   o código mais lento.
+
+   O resultado pode ser gravado em JSON e comparado com o de outro
+   commit: os casos que ficaram mais lentos que a tolerância são
+   marcados como REGRESSÃO (e o programa termina com código 1).
+
+   Exemplos de uso:
+      python benchmark_ip_calc.py -n 1000 100000 1000000 -o antes.json
+      python benchmark_ip_calc.py -n 1000 100000 1000000 -o depois.json --comparar antes.json
+'''
+import argparse, importlib.util, json, os, platform, random, subprocess, sys, time, tracemalloc
+
+import ip_calc_v2_funcoes
+from ip_calc_v2_funcoes import validarIP, validarCIDR, classificarIP
+
+try:
+   import numpy as np
+except ImportError:
+   np = None
+
+try:
+   from ip_calc_v2_vetorizado import calcularRedesLote
+except ImportError:
+   calcularRedesLote = None
+
+# ----------------------------------------------------------------------
+TAMANHOS    = (1_000, 100_000, 1_000_000)
+REPETICOES  = 3
+SEMENTE     = 2025
+TOLERANCIA  = 0.10
+
+DIR_BINARIAS = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                            '2025-09-22 - Operações Binárias')
+
+
+# ----------------------------------------------------------------------
+def carregarDec2bin():
+   """
+      Importa a função dec2bin da pasta das Operações Binárias (o módulo
+      se chama funcoes.py, então é carregado pelo caminho do arquivo).
+   """
+   specModulo = importlib.util.spec_from_file_location('funcoes_binarias', os.path.join(DIR_BINARIAS, 'funcoes.py'))
+   modFuncoes = importlib.util.module_from_spec(specModulo)
+   specModulo.loader.exec_module(modFuncoes)
+   return modFuncoes.dec2bin
+
+
+# ----------------------------------------------------------------------
+def gerarDados(quantidade: int, semente: int = SEMENTE) -> dict:
+   """
+      Gera os dados sintéticos: endereços (str e int) e CIDRs.
+
+      Returns:
+         dict: {'ips': list[str], 'ints': list[int], 'cidrs': list[int]}.
+   """
+   rndGerador = random.Random(semente)
+   lstInts  = [rndGerador.getrandbits(32) for _ in range(quantidade)]
+   lstCIDRs = [rndGerador.randint(0, 32) for _ in range(quantidade)]
+   lstIPs   = ['.'.join(map(str, i.to_bytes(4, 'big'))) for i in lstInts]
+   dictDados = {'ips': lstIPs, 'ints': lstInts, 'cidrs': lstCIDRs}
+   if np is not None:
+      dictDados['arr_ints']  = np.array(lstInts, dtype=np.uint32)
+      dictDados['arr_cidrs'] = np.array(lstCIDRs, dtype=np.uint8)
+   return dictDados
+
+
+# ----------------------------------------------------------------------
+def calcularRedeEscalar(intIP: int, intCIDR: int) -> tuple:
+   """
+      As mesmas contas do ip_calc_v2.py para um único endereço.
+   """
+   intMascara = 0xFFFFFFFF >> (32 - intCIDR) << (32 - intCIDR)
+   intIPRede = intIP & intMascara
+   intIPBroadcast = intIPRede | (~intMascara & 0xFFFFFFFF)
+   return intIPRede, intIPRede | 0x00000001, intIPBroadcast, intIPBroadcast & 0xFFFFFFFE
+
+
+# ----------------------------------------------------------------------
+def montarCasos() -> dict:
+   """
+      Retorna os casos do benchmark: {nome: função(dados)}.
+   """
+   dec2bin = carregarDec2bin()
+
+   def casoValidarIP(d):
+      for strIP in d['ips']: validarIP(strIP)
+
+   def casoValidarCIDR(d):
+      for intCIDR in d['cidrs']: validarCIDR(intCIDR)
+
+   def casoClassificarIP(d):
+      for strIP in d['ips']: classificarIP(strIP)
+
+   def casoDec2bin(d):
+      for intIP in d['ints']: dec2bin(intIP)
+
+   def casoRedeEscalar(d):
+      for intIP, intCIDR in zip(d['ints'], d['cidrs']): calcularRedeEscalar(intIP, intCIDR)
+
+   dictCasos = {
+      'validarIP': casoValidarIP,
+      'validarCIDR': casoValidarCIDR,
+      'classificarIP': casoClassificarIP,
+      'dec2bin': casoDec2bin,
+      'rede_escalar': casoRedeEscalar,
+   }
+   ip2int = getattr(ip_calc_v2_funcoes, 'ip2int', None)
+   if ip2int is not None:
+      def casoIp2int(d):
+         for strIP in d['ips']: ip2int(strIP)
+      dictCasos['ip2int'] = casoIp2int
+   if np is not None and calcularRedesLote is not None:
+      dictCasos['rede_lote'] = lambda d: calcularRedesLote(d['arr_ints'], d['arr_cidrs'])
+      dictCasos['rede_lote_texto'] = lambda d: calcularRedesLote(d['ips'], d['arr_cidrs'])
+   return dictCasos
+
+
+# ----------------------------------------------------------------------
+def medirCaso(funcao, dados: dict, repeticoes: int = REPETICOES) -> dict:
+   """
+      Mede o melhor tempo de 'repeticoes' execuções e o pico de memória.
+
+      Returns:
+         dict: {'segundos', 'ops_s', 'pico_bytes'}. 'ops_s' é None quando o
+            tempo medido é zero (o JSON não tem infinito).
+   """
+   intQtOperacoes = len(dados['ints'])
+   fltMelhor = float('inf')
+   for _ in range(repeticoes):
+      fltInicio = time.perf_counter()
+      funcao(dados)
+      fltMelhor = min(fltMelhor, time.perf_counter() - fltInicio)
+
+   tracemalloc.start()
+   funcao(dados)
+   _, intPico = tracemalloc.get_traced_memory()
+   tracemalloc.stop()
+
+   return {'segundos': fltMelhor, 'ops_s': intQtOperacoes / fltMelhor if fltMelhor else None,
+           'pico_bytes': intPico}
+
+
+# ----------------------------------------------------------------------
+def obterCommit() -> str | None:
+   """
+      Retorna o commit atual do repositório (ou None fora de um repositório git).
+   """
+   try:
+      return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+   except (OSError, subprocess.CalledProcessError):
+      return None
+
+
+# ----------------------------------------------------------------------
+def executarBenchmark(tamanhos = TAMANHOS, casos: list = None, repeticoes: int = REPETICOES,
+                      semente: int = SEMENTE, saida = sys.stdout) -> dict:
+   """
+      Executa todos os casos para cada tamanho de dados.
+
+      Returns:
+         dict: {'ambiente': {...}, 'resultados': [{caso, n, segundos, ops_s, pico_bytes}, ...]}.
+   """
+   dictCasos = montarCasos()
+   if casos:
+      lstInvalidos = [c for c in casos if c not in dictCasos]
+      if lstInvalidos:
+         raise ValueError(f'ERRO...: Caso(s) desconhecido(s): {", ".join(lstInvalidos)}.')
+      dictCasos = {c: dictCasos[c] for c in casos}
+
+   dictResultado = {
+      'ambiente': {
+         'commit': obterCommit(),
+         'python': platform.python_version(),
+         'numpy': None if np is None else np.__version__,
+         'plataforma': platform.platform(),
+         'data': time.strftime('%Y-%m-%d %H:%M:%S'),
+         'repeticoes': repeticoes,
+         'semente': semente,
+      },
+      'resultados': [],
+   }
+   for intTamanho in tamanhos:
+      dictDados = gerarDados(intTamanho, semente)
+      for strCaso, funcao in dictCasos.items():
+         dictMedida = medirCaso(funcao, dictDados, repeticoes)
+         dictResultado['resultados'].append({'caso': strCaso, 'n': intTamanho, **dictMedida})
+         if saida is not None:
+            print(f'{strCaso:<15} {intTamanho:>10} {dictMedida["ops_s"] or float("inf"):>16,.0f} ops/s '
+                  f'{dictMedida["pico_bytes"] / 1024:>12,.1f} KiB', file=saida, flush=True)
+      del dictDados
+   return dictResultado
+
+
+# ----------------------------------------------------------------------
+def compararResultados(base: dict, atual: dict, tolerancia: float = TOLERANCIA) -> list:
+   """
+      Compara dois resultados (casos com mesmo nome e tamanho).
+
+      Returns:
+         list: Tuplas (caso, n, ops/s base, ops/s atual, variação, situação),
+               onde situação é 'REGRESSÃO', 'MELHORIA' ou 'OK'.
+   """
+   dictBase = {(r['caso'], r['n']): r for r in base['resultados']}
+   lstComparacao = []
+   for dictAtual in atual['resultados']:
+      dictAnterior = dictBase.get((dictAtual['caso'], dictAtual['n']))
+      # Sem medida válida (tempo zero) em um dos lados, não há comparação
+      if dictAnterior is None or not dictAnterior['ops_s'] or not dictAtual['ops_s']: continue
+      fltVariacao = dictAtual['ops_s'] / dictAnterior['ops_s'] - 1
+      strSituacao = 'REGRESSÃO' if fltVariacao < -tolerancia else 'MELHORIA' if fltVariacao > tolerancia else 'OK'
+      lstComparacao.append((dictAtual['caso'], dictAtual['n'], dictAnterior['ops_s'], dictAtual['ops_s'],
+                            fltVariacao, strSituacao))
+   return lstComparacao
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Benchmark das funções do IP-CALC e das operações binárias.')
+   parser.add_argument('-n', '--tamanhos', type=int, nargs='+', default=TAMANHOS, help='quantidades de endereços (ex: 1000 10000000)')
+   parser.add_argument('-c', '--casos', nargs='+', default=None, help='casos a executar (padrão: todos)')
+   parser.add_argument('-r', '--repeticoes', type=int, default=REPETICOES, help='repetições por caso (vale a melhor)')
+   parser.add_argument('-s', '--semente', type=int, default=SEMENTE, help='semente dos dados sintéticos')
+   parser.add_argument('-o', '--saida', default=None, help='arquivo JSON com os resultados')
+   parser.add_argument('--comparar', default=None, help='JSON de uma execução anterior para comparação')
+   parser.add_argument('--tolerancia', type=float, default=TOLERANCIA, help='queda tolerada de ops/s (padrão: 0.10)')
+   args = parser.parse_args()
+
+   try:
+      dictResultado = executarBenchmark(args.tamanhos, args.casos, args.repeticoes, args.semente)
+      if args.saida:
+         with open(args.saida, 'w', encoding='utf-8') as arqSaida:
+            json.dump(dictResultado, arqSaida, indent=2, ensure_ascii=False, allow_nan=False)
+
+      intQtRegressoes = 0
+      if args.comparar:
+         with open(args.comparar, 'r', encoding='utf-8') as arqBase:
+            dictBase = json.load(arqBase)
+         print(f'\nComparação com {args.comparar} (commit {dictBase["ambiente"].get("commit")}):')
+         for strCaso, intN, fltBase, fltAtual, fltVariacao, strSituacao in compararResultados(dictBase, dictResultado, args.tolerancia):
+            print(f'{strCaso:<15} {intN:>10} {fltBase:>14,.0f} -> {fltAtual:>14,.0f} ops/s {fltVariacao:>+8.1%}  {strSituacao}')
+            intQtRegressoes += strSituacao == 'REGRESSÃO'
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+
+   if intQtRegressoes:
+      sys.exit(f'\n{intQtRegressoes} regressão(ões) de desempenho encontrada(s).\n')
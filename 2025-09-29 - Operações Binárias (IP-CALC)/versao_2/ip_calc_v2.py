@@ -23,13 +23,14 @@ while True:
       except ValueError:
          raise ValueError('ERRO...: O CIDR deve ser um número inteiro.')
       else:
-         if validarIP(strIP) and validarCIDR(intCIDR): break
+         # ip2int valida e converte o endereço em uma única passada
+         intIP = ip2int(strIP)
+         if validarCIDR(intCIDR): break
    except Exception as e:
       print(f'\n{e}.\nTente novamente...\n')
          
 # ----------------------------------------------------------------------
 # 1 - Convertendo o Endereço IPv4 e a Máscara CIDR para Binário
-intIP      = int.from_bytes(bytes([int(x) for x in strIP.split('.')]), 'big')
 intMascara = 0xFFFFFFFF >> (32 - intCIDR) << (32 - intCIDR)
 
 # ----------------------------------------------------------------------
@@ -67,7 +68,7 @@ print(f'O Endereço é (IPV4).........................: {strIP:>15} -> {intIP:03
 print(f'O IP da Máscara para o CIDR /{intCIDR:<2} é...........: {strIPMascara:>15} -> {intMascara:032b}\n')
 
 # Classificação do IP
-strClasse, strTipo = classificarIP(strIP)
+strClasse, strTipo = classificarIP(intIP)
 print(f'A Classe do Endereço IP é...................: {strClasse}')
 print(f'O Tipo do Endereço IP é.....................: {strTipo}\n')
 
@@ -0,0 +1,252 @@
+'''
+   Motor de ACL (Lista de Controle de Acesso) IPv4 Compilado
+
+   Uma ACL é uma lista ordenada de regras (ação, prefixo de origem,
+   prefixo de destino); para cada fluxo vale a PRIMEIRA regra cujos dois
+   prefixos contêm os endereços (ou a ação padrão, se nenhuma casar).
+
+   Em vez de testar as regras uma a uma (O(regras) por fluxo), a lista é
+   compilada em uma tabela hash por par de tamanhos de prefixo
+   (CIDR de origem, CIDR de destino). Cada tabela usa como chave as duas
+   redes juntas em um inteiro de 64 bits:
+
+      chave = (origem & mascara_origem) << 32 | (destino & mascara_destino)
+
+   e guarda o menor índice de regra com aquela chave. Avaliar um fluxo
+   custa uma consulta por par de tamanhos existente na ACL (normalmente
+   poucas dezenas, mesmo com dezenas de milhares de regras), e os pares
+   cuja menor regra já perde para a melhor encontrada são pulados.
+
+   Na avaliação em lote, cada tabela vira um array ordenado de chaves
+   (uint64) consultado com busca binária (NumPy) para todos os fluxos.
+
+   Exemplo de arquivo de regras (uma por linha):
+      permitir 10.0.0.0/8     192.168.1.10/32
+      negar    10.66.0.0/16   any
+      permitir any            8.8.8.8
+
+   Exemplo de uso:
+      python ip_calc_v2_acl.py regras.txt fluxos.txt -o decisoes.csv
+'''
+import argparse, csv, sys
+from contextlib import ExitStack
+
+import numpy as np
+
+from ip_calc_v2_funcoes import *
+from ip_calc_v2_vetorizado import ips2array
+from ip_calc_v2_fluxo import interpretarLinha, lerLinhas
+
+# ----------------------------------------------------------------------
+ACAO_PADRAO = 'negar'
+
+
+# ----------------------------------------------------------------------
+def interpretarPrefixo(prefixo: str) -> tuple:
+   """
+      Interpreta um prefixo 'ip/cidr', 'ip' (equivale a /32) ou 'any'.
+
+      Returns:
+         tuple: (rede como inteiro, CIDR).
+   """
+   if prefixo.lower() == 'any': return 0, 0
+   strIP, intCIDR = interpretarLinha(prefixo, cidr_padrao=32)
+   return ip2int(strIP) & cidr2mascara(intCIDR), intCIDR
+
+
+# ----------------------------------------------------------------------
+class MotorACL:
+   """
+      ACL de regras (ação, origem, destino) com semântica de primeira
+      regra que casa, compilada em tabelas hash por par de CIDRs.
+   """
+
+   def __init__(self, regras = (), padrao: str = ACAO_PADRAO):
+      """
+         Args:
+            regras (Iterable[tuple]): Regras (ação, prefixo de origem, prefixo de destino).
+            padrao (str): Ação usada quando nenhuma regra casa.
+      """
+      self.padrao = padrao
+      self.acoes  = []
+      # {(cidr origem, cidr destino): {chave: menor índice de regra}}
+      self._dictTabelas = {}
+      self._lstGrupos = self._lstLotes = None
+      for strAcao, strOrigem, strDestino in regras:
+         self.adicionar(strAcao, strOrigem, strDestino)
+
+
+   # ----------------------------------------------------------------------
+   def adicionar(self, acao: str, origem: str, destino: str) -> int:
+      """
+         Acrescenta uma regra ao final da ACL.
+
+         Returns:
+            int: O índice (posição) da regra.
+      """
+      intRedeOrigem, intCIDROrigem   = interpretarPrefixo(origem)
+      intRedeDestino, intCIDRDestino = interpretarPrefixo(destino)
+
+      intIndice = len(self.acoes)
+      self.acoes.append(acao)
+      # setdefault mantém o índice da primeira regra com a mesma chave:
+      # as repetições posteriores nunca são alcançadas
+      self._dictTabelas.setdefault((intCIDROrigem, intCIDRDestino), {}) \
+                       .setdefault(intRedeOrigem << 32 | intRedeDestino, intIndice)
+      self._lstGrupos = self._lstLotes = None
+      return intIndice
+
+
+   # ----------------------------------------------------------------------
+   def _compilar(self):
+      """
+         Ordena os pares de CIDRs pela sua menor regra (para que a busca
+         possa parar cedo) e pré-calcula as máscaras de cada par.
+      """
+      self._lstGrupos = sorted(
+         (min(dictTabela.values()), cidr2mascara(intCIDROrigem), cidr2mascara(intCIDRDestino), dictTabela)
+         for (intCIDROrigem, intCIDRDestino), dictTabela in self._dictTabelas.items()
+      )
+
+
+   # ----------------------------------------------------------------------
+   def regra(self, origem, destino) -> int:
+      """
+         Retorna o índice da primeira regra que casa com o fluxo (ou -1).
+
+         Args:
+            origem (str | int): O endereço de origem.
+            destino (str | int): O endereço de destino.
+      """
+      if self._lstGrupos is None: self._compilar()
+      intOrigem  = ip2int(origem) if isinstance(origem, (str, bytes)) else origem
+      intDestino = ip2int(destino) if isinstance(destino, (str, bytes)) else destino
+
+      intMelhor = len(self.acoes)
+      for intMenor, intMascOrigem, intMascDestino, dictTabela in self._lstGrupos:
+         if intMenor >= intMelhor: break
+         intIndice = dictTabela.get((intOrigem & intMascOrigem) << 32 | (intDestino & intMascDestino))
+         if intIndice is not None and intIndice < intMelhor: intMelhor = intIndice
+      return intMelhor if intMelhor < len(self.acoes) else -1
+
+
+   # ----------------------------------------------------------------------
+   def avaliar(self, origem, destino) -> str:
+      """
+         Retorna a ação aplicada ao fluxo (origem -> destino).
+      """
+      intIndice = self.regra(origem, destino)
+      return self.padrao if intIndice < 0 else self.acoes[intIndice]
+
+
+   # ----------------------------------------------------------------------
+   def _compilarLote(self):
+      """
+         Converte cada tabela hash em arrays ordenados (chaves uint64 e
+         índices) para a busca binária em lote.
+      """
+      if self._lstGrupos is None: self._compilar()
+      self._lstLotes = []
+      for intMenor, intMascOrigem, intMascDestino, dictTabela in self._lstGrupos:
+         arrChaves  = np.fromiter(dictTabela.keys(), dtype=np.uint64, count=len(dictTabela))
+         arrIndices = np.fromiter(dictTabela.values(), dtype=np.int64, count=len(dictTabela))
+         arrOrdem   = np.argsort(arrChaves)
+         self._lstLotes.append((intMenor, np.uint64(intMascOrigem), np.uint64(intMascDestino),
+                                 arrChaves[arrOrdem], arrIndices[arrOrdem]))
+
+
+   # ----------------------------------------------------------------------
+   def regrasLote(self, origens, destinos) -> np.ndarray:
+      """
+         Retorna, em lote, o índice da primeira regra que casa com cada
+         fluxo (-1 quando nenhuma casa).
+
+         Args:
+            origens (list[str] | np.ndarray): Endereços de origem ('A.B.C.D' ou uint32).
+            destinos (list[str] | np.ndarray): Endereços de destino ('A.B.C.D' ou uint32).
+      """
+      if self._lstLotes is None: self._compilarLote()
+      arrOrigens  = ips2array(origens).astype(np.uint64)
+      arrDestinos = ips2array(destinos).astype(np.uint64)
+      if arrOrigens.shape != arrDestinos.shape:
+         raise ValueError('ERRO...: A quantidade de origens e de destinos deve ser a mesma.')
+
+      intSemRegra = len(self.acoes)
+      arrMelhor = np.full(arrOrigens.shape, intSemRegra, dtype=np.int64)
+      for intMenor, intMascOrigem, intMascDestino, arrChaves, arrIndices in self._lstLotes:
+         # Pares cuja menor regra não melhora nenhum fluxo são pulados
+         if intMenor >= arrMelhor.max(initial=0): break
+         arrConsulta = ((arrOrigens & intMascOrigem) << np.uint64(32)) | (arrDestinos & intMascDestino)
+         arrPos = np.searchsorted(arrChaves, arrConsulta).clip(max=arrChaves.size - 1)
+         arrCasou = arrChaves[arrPos] == arrConsulta
+         np.minimum(arrMelhor, np.where(arrCasou, arrIndices[arrPos], intSemRegra), out=arrMelhor)
+
+      arrMelhor[arrMelhor == intSemRegra] = -1
+      return arrMelhor
+
+
+   # ----------------------------------------------------------------------
+   def avaliarLote(self, origens, destinos) -> np.ndarray:
+      """
+         Retorna, em lote, a ação aplicada a cada fluxo.
+
+         Returns:
+            np.ndarray: Array (object) com a ação de cada fluxo.
+      """
+      arrAcoes = np.array(self.acoes + [self.padrao], dtype=object)
+      return arrAcoes[self.regrasLote(origens, destinos)]
+
+
+   def __len__(self) -> int:
+      return len(self.acoes)
+
+
+# ----------------------------------------------------------------------
+def lerRegras(entrada, padrao: str = ACAO_PADRAO) -> MotorACL:
+   """
+      Lê uma ACL de um arquivo com uma regra 'ação origem destino' por linha.
+   """
+   aclRegras = MotorACL(padrao=padrao)
+   for intNumLinha, strLinha in lerLinhas(entrada):
+      lstCampos = strLinha.replace(',', ' ').split()
+      if len(lstCampos) != 3:
+         raise ValueError(f'ERRO...: Linha {intNumLinha} da ACL deve ter o formato: ação origem destino.')
+      aclRegras.adicionar(*lstCampos)
+   return aclRegras
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Avalia fluxos (origem destino) contra uma ACL IPv4.')
+   parser.add_argument('regras', help='arquivo com as regras (ação origem destino)')
+   parser.add_argument('fluxos', nargs='?', default='-', help='arquivo com os fluxos (origem destino; padrão: stdin)')
+   parser.add_argument('-o', '--saida', default='-', help='arquivo CSV de saída (padrão: stdout)')
+   parser.add_argument('-p', '--padrao', default=ACAO_PADRAO, help='ação quando nenhuma regra casa')
+   args = parser.parse_args()
+
+   try:
+      with open(args.regras, 'r', encoding='utf-8') as arqRegras:
+         aclRegras = lerRegras(arqRegras, args.padrao)
+
+      with ExitStack() as pilhaArquivos:
+         arqFluxos = sys.stdin if args.fluxos == '-' else \
+                     pilhaArquivos.enter_context(open(args.fluxos, 'r', encoding='utf-8'))
+         lstOrigens, lstDestinos = [], []
+         for _, strLinha in lerLinhas(arqFluxos):
+            strOrigem, strDestino = strLinha.replace(',', ' ').split()[:2]
+            lstOrigens.append(strOrigem)
+            lstDestinos.append(strDestino)
+
+         arrRegras = aclRegras.regrasLote(lstOrigens, lstDestinos)
+         arqSaida  = sys.stdout if args.saida == '-' else \
+                     pilhaArquivos.enter_context(open(args.saida, 'w', encoding='utf-8', newline=''))
+         escritorCSV = csv.writer(arqSaida, lineterminator='\n')
+         escritorCSV.writerow(('origem', 'destino', 'acao', 'regra'))
+         escritorCSV.writerows(
+            (o, d, args.padrao if r < 0 else aclRegras.acoes[r], r)
+            for o, d, r in zip(lstOrigens, lstDestinos, arrRegras.tolist())
+         )
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
@@ -0,0 +1,145 @@
+'''
+   Agregação (Sumarização) de Redes IPv4
+
+   Este módulo recebe uma lista de redes (endereço de rede + CIDR),
+   calculadas da mesma forma que no script ip_calc_v2.py, e a reduz ao
+   menor conjunto equivalente de prefixos: redes contidas em outras são
+   descartadas e redes vizinhas (irmãs) são unidas em um prefixo maior.
+
+   O processamento é feito com NumPy em O(n log n) (dominado pela
+   ordenação):
+      1. Cada rede vira um intervalo [rede, broadcast];
+      2. Os intervalos são ordenados e os sobrepostos/adjacentes unidos;
+      3. Cada intervalo resultante é decomposto no menor número de
+         blocos CIDR alinhados.
+
+   Exemplo:
+      arrRedes, arrCIDRs = agregarRedes(ips2array(['10.0.0.0', '10.0.1.0']), [24, 24])
+      print(array2ips(arrRedes), arrCIDRs)  # -> ['10.0.0.0'] [23]
+'''
+import numpy as np
+
+from ip_calc_v2_vetorizado import calcularMascarasLote, ips2array
+
+
+# ----------------------------------------------------------------------
+def redes2faixas(redes, cidrs) -> tuple:
+   """
+      Converte redes (IP + CIDR) em intervalos [início, fim] de endereços.
+
+      Args:
+         redes (list[str] | np.ndarray): Endereços das redes ('A.B.C.D' ou
+            uint32). Os bits de host são ignorados.
+         cidrs (int | list[int] | np.ndarray): Os valores CIDR.
+
+      Returns:
+         tuple: (array de inícios, array de fins), ambos uint64.
+   """
+   arrRedes = ips2array(redes)
+   try:
+      arrMascaras = calcularMascarasLote(np.broadcast_to(np.asarray(cidrs), arrRedes.shape))
+   except ValueError as e:
+      if 'CIDR' in str(e): raise
+      raise ValueError('ERRO...: A quantidade de redes e de CIDRs deve ser a mesma.')
+
+   arrInicios = (arrRedes & arrMascaras).astype(np.uint64)
+   arrFins    = arrInicios | (~arrMascaras).astype(np.uint64)
+   return arrInicios, arrFins
+
+
+# ----------------------------------------------------------------------
+def unirFaixas(inicios: np.ndarray, fins: np.ndarray, ordenado: bool = False) -> tuple:
+   """
+      Une intervalos [início, fim] sobrepostos ou adjacentes.
+
+      Args:
+         inicios (np.ndarray): Início de cada intervalo.
+         fins (np.ndarray): Fim (inclusive) de cada intervalo.
+         ordenado (bool): True se os intervalos já estão ordenados pelo
+            início (dispensa a ordenação, tornando a união O(n)).
+
+      Returns:
+         tuple: (inícios, fins) ordenados e sem sobreposição (uint64).
+   """
+   arrInicios = np.asarray(inicios, dtype=np.uint64)
+   arrFins    = np.asarray(fins, dtype=np.uint64)
+   if not arrInicios.size: return arrInicios, arrFins
+
+   if not ordenado:
+      arrOrdem   = np.argsort(arrInicios, kind='stable')
+      arrInicios = arrInicios[arrOrdem]
+      arrFins    = arrFins[arrOrdem]
+   arrFins = np.maximum.accumulate(arrFins)
+
+   # Um novo grupo começa quando o intervalo não encosta no maior fim
+   # visto até o intervalo anterior
+   arrNovoGrupo = np.empty(arrInicios.size, dtype=bool)
+   arrNovoGrupo[0]  = True
+   arrNovoGrupo[1:] = arrInicios[1:] > arrFins[:-1] + np.uint64(1)
+
+   arrPosInicio = np.flatnonzero(arrNovoGrupo)
+   arrPosFim    = np.append(arrPosInicio[1:], arrInicios.size) - 1
+   return arrInicios[arrPosInicio], arrFins[arrPosFim]
+
+
+# ----------------------------------------------------------------------
+def faixas2cidrs(inicios: np.ndarray, fins: np.ndarray) -> tuple:
+   """
+      Decompõe intervalos [início, fim] no menor conjunto de blocos CIDR.
+
+      A cada passo, cada intervalo emite o maior bloco que está alinhado
+      no seu início atual e que cabe no que resta do intervalo. São no
+      máximo 64 passos, cada um vetorizado sobre todos os intervalos.
+
+      Args:
+         inicios (np.ndarray): Início de cada intervalo.
+         fins (np.ndarray): Fim (inclusive) de cada intervalo.
+
+      Returns:
+         tuple: (array de redes uint32, array de CIDRs uint8), ordenados.
+   """
+   arrAtual = np.asarray(inicios, dtype=np.int64).copy()
+   arrFins  = np.asarray(fins, dtype=np.int64)
+   lstRedes, lstBits = [], []
+
+   while arrAtual.size:
+      # Maior bloco alinhado no início: o bit 1 menos significativo
+      # (o endereço 0 está alinhado a qualquer tamanho, até 2^32)
+      arrAlinhado = arrAtual & -arrAtual
+      arrAlinhado[arrAtual == 0] = 1 << 32
+      _, arrExpAlinhado = np.frexp(arrAlinhado.astype(np.float64))
+
+      # Maior potência de 2 que cabe no restante do intervalo
+      _, arrExpRestante = np.frexp((arrFins - arrAtual + 1).astype(np.float64))
+
+      arrBits = np.minimum(arrExpAlinhado, arrExpRestante) - 1
+      lstRedes.append(arrAtual)
+      lstBits.append(arrBits)
+
+      arrAtual   = arrAtual + (np.int64(1) << arrBits.astype(np.int64))
+      arrAtivos  = arrAtual <= arrFins
+      arrAtual   = arrAtual[arrAtivos]
+      arrFins    = arrFins[arrAtivos]
+
+   if not lstRedes: return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.uint8)
+
+   arrRedes = np.concatenate(lstRedes)
+   arrCIDRs = 32 - np.concatenate(lstBits)
+   arrOrdem = np.argsort(arrRedes, kind='stable')
+   return arrRedes[arrOrdem].astype(np.uint32), arrCIDRs[arrOrdem].astype(np.uint8)
+
+
+# ----------------------------------------------------------------------
+def agregarRedes(redes, cidrs) -> tuple:
+   """
+      Reduz uma lista de redes ao menor conjunto equivalente de prefixos
+      (une redes irmãs e descarta redes já cobertas por outras).
+
+      Args:
+         redes (list[str] | np.ndarray): Endereços das redes ('A.B.C.D' ou uint32).
+         cidrs (int | list[int] | np.ndarray): Os valores CIDR.
+
+      Returns:
+         tuple: (array de redes uint32, array de CIDRs uint8), ordenados.
+   """
+   return faixas2cidrs(*unirFaixas(*redes2faixas(redes, cidrs)))
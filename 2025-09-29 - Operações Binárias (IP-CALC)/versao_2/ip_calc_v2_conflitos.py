@@ -0,0 +1,143 @@
+'''
+   Detector de Sobreposição e Conflito de Sub-redes IPv4
+
+   Recebe um inventário de sub-redes (dono + rede/CIDR, como em uma
+   exportação de IPAM) e informa todas as alocações duplicadas ou
+   sobrepostas, usando uma varredura (sweep line) em O(n log n):
+
+      1. Cada sub-rede vira um intervalo [rede, broadcast] (ip_calc_v2.py);
+      2. Os intervalos são ordenados pelo início (e, no empate, do maior
+         para o menor);
+      3. Com NumPy, são descartados de uma vez os grupos de intervalos que
+         não encostam em nenhum outro (a grande maioria em um inventário
+         saudável);
+      4. Nos grupos restantes, uma pilha guarda as redes "abertas". Como
+         dois prefixos CIDR ou são disjuntos ou um contém o outro, toda
+         rede na pilha contém a rede atual, e cada par é um conflito.
+
+   Os conflitos são gerados (yield) à medida que são encontrados.
+
+   Exemplo de uso (arquivo CSV com as colunas dono,prefixo):
+      python ip_calc_v2_conflitos.py inventario.csv > conflitos.csv
+'''
+import argparse, csv, sys
+from contextlib import ExitStack
+
+import numpy as np
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_agregacao import redes2faixas
+from ip_calc_v2_fluxo import interpretarLinha, lerLinhas
+
+
+# ----------------------------------------------------------------------
+def detectarConflitos(rotulos: list, redes, cidrs):
+   """
+      Detecta todas as sub-redes duplicadas ou sobrepostas.
+
+      Args:
+         rotulos (list): O dono (ou identificador) de cada sub-rede.
+         redes (list[str] | np.ndarray): Endereços das redes ('A.B.C.D' ou uint32).
+         cidrs (int | list[int] | np.ndarray): Os valores CIDR.
+
+      Yields:
+         tuple: (tipo, dono A, prefixo A, dono B, prefixo B), onde tipo é
+                'DUPLICADO' (mesmo prefixo) ou 'SOBREPOSTO' (B contido em A).
+   """
+   arrInicios, arrFins = redes2faixas(redes, cidrs)
+   if len(rotulos) != arrInicios.size:
+      raise ValueError('ERRO...: A quantidade de rótulos e de redes deve ser a mesma.')
+   if not arrInicios.size: return
+
+   # Ordena pelo início e, no empate, pela rede maior (fim maior) primeiro
+   arrOrdem   = np.lexsort((-arrFins.astype(np.int64), arrInicios))
+   arrInicios = arrInicios[arrOrdem]
+   arrFins    = arrFins[arrOrdem]
+   arrCIDRs   = np.broadcast_to(np.asarray(cidrs), arrOrdem.shape)[arrOrdem]
+
+   # Agrupa os intervalos que se sobrepõem (início <= maior fim anterior)
+   arrMaiorFim  = np.maximum.accumulate(arrFins)
+   arrNovoGrupo = np.ones(arrInicios.size, dtype=bool)
+   arrNovoGrupo[1:] = arrInicios[1:] > arrMaiorFim[:-1]
+   arrTamGrupo  = np.diff(np.append(np.flatnonzero(arrNovoGrupo), arrInicios.size))
+
+   # Apenas os grupos com mais de uma rede possuem conflitos: só as
+   # redes desses grupos são levadas para a varredura em Python
+   arrEmGrupo = np.repeat(arrTamGrupo > 1, arrTamGrupo)
+   arrPosConflito = np.flatnonzero(arrEmGrupo)
+   lstInicios   = arrInicios[arrPosConflito].tolist()
+   lstFins      = arrFins[arrPosConflito].tolist()
+   lstCIDRs     = arrCIDRs[arrPosConflito].tolist()
+   lstOriginais = arrOrdem[arrPosConflito].tolist()
+   lstNovoGrupo = arrNovoGrupo[arrPosConflito].tolist()
+
+   def prefixo(intPos: int) -> tuple:
+      return rotulos[lstOriginais[intPos]], f'{int2ip(lstInicios[intPos])}/{lstCIDRs[intPos]}'
+
+   lstAbertas = []
+   for intPos, intInicio in enumerate(lstInicios):
+      intFim = lstFins[intPos]
+      if lstNovoGrupo[intPos]:
+         lstAbertas.clear()
+      while lstAbertas and lstFins[lstAbertas[-1]] < intInicio:
+         lstAbertas.pop()
+      for intPosAberta in lstAbertas:
+         bolDuplicado = lstInicios[intPosAberta] == intInicio and lstFins[intPosAberta] == intFim
+         yield ('DUPLICADO' if bolDuplicado else 'SOBREPOSTO', *prefixo(intPosAberta), *prefixo(intPos))
+      lstAbertas.append(intPos)
+
+
+# ----------------------------------------------------------------------
+def lerInventario(entrada, erros = sys.stderr) -> tuple:
+   """
+      Lê um inventário CSV com as colunas dono,prefixo (ex: 'rh,10.0.0.0/24').
+      Linhas inválidas (inclusive um cabeçalho) são informadas em 'erros'.
+
+      Args:
+         entrada (Iterable[str]): Arquivo (ou iterável) com as linhas.
+         erros (TextIO): Canal onde as linhas inválidas são informadas.
+
+      Returns:
+         tuple: (lista de donos, lista de redes 'A.B.C.D', lista de CIDRs).
+   """
+   lstRotulos, lstRedes, lstCIDRs = [], [], []
+   for intNumLinha, strLinha in lerLinhas(entrada):
+      strRotulo, _, strPrefixo = strLinha.rpartition(',')
+      try:
+         strIP, intCIDR = interpretarLinha(strPrefixo.strip())
+      except Exception as e:
+         if erros is not None: erros.write(f'Linha {intNumLinha}: {strLinha} -> {e}\n')
+      else:
+         lstRotulos.append(strRotulo.strip())
+         lstRedes.append(strIP)
+         lstCIDRs.append(intCIDR)
+   return lstRotulos, lstRedes, lstCIDRs
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Detecta sub-redes IPv4 duplicadas ou sobrepostas (CSV dono,prefixo).')
+   parser.add_argument('entrada', nargs='?', default='-', help='arquivo CSV de entrada (padrão: stdin)')
+   parser.add_argument('-o', '--saida', default='-', help='arquivo CSV de saída (padrão: stdout)')
+   args = parser.parse_args()
+
+   try:
+      # Os arquivos abertos aqui são fechados (e gravados) também em caso de erro
+      with ExitStack() as pilhaArquivos:
+         arqEntrada = sys.stdin if args.entrada == '-' else \
+                      pilhaArquivos.enter_context(open(args.entrada, 'r', encoding='utf-8'))
+         arqSaida   = sys.stdout if args.saida == '-' else \
+                      pilhaArquivos.enter_context(open(args.saida, 'w', encoding='utf-8', newline=''))
+
+         escritorCSV = csv.writer(arqSaida, lineterminator='\n')
+         escritorCSV.writerow(('tipo', 'dono_a', 'prefixo_a', 'dono_b', 'prefixo_b'))
+         intQtConflitos = 0
+         for tuplaConflito in detectarConflitos(*lerInventario(arqEntrada)):
+            escritorCSV.writerow(tuplaConflito)
+            intQtConflitos += 1
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'Conflitos encontrados: {intQtConflitos}', file=sys.stderr)
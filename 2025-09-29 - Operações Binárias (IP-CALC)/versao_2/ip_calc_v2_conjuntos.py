@@ -0,0 +1,216 @@
+'''
+   Conjunto de Faixas de Endereços IPv4 (IPRangeSet)
+
+   Um IPRangeSet guarda um conjunto de endereços IPv4 como intervalos
+   [início, fim] ordenados e sem sobreposição, em dois arrays NumPy. Os
+   intervalos vêm das mesmas contas de rede/broadcast do ip_calc_v2.py.
+
+   Operações:
+      - Pertinência (ip in conjunto) e continência (A >= B): busca binária,
+        O(log n) por consulta;
+      - União, interseção, diferença e diferença simétrica: O(n + m), pois
+        os dois conjuntos já estão ordenados e são apenas intercalados.
+
+   Exemplo:
+      setPermitidos = IPRangeSet.deRedes(['10.0.0.0', '192.168.0.0'], [8, 16])
+      setNovos      = IPRangeSet.deRedes(['10.1.0.0', '172.16.0.0'], [16, 12])
+      print((setNovos - setPermitidos).paraCIDRs())
+'''
+import numpy as np
+
+from ip_calc_v2_funcoes import ip2int
+from ip_calc_v2_vetorizado import ips2array
+from ip_calc_v2_agregacao import faixas2cidrs, redes2faixas, unirFaixas
+
+# ----------------------------------------------------------------------
+ULTIMO_IP = 0xFFFFFFFF
+
+
+# ----------------------------------------------------------------------
+class IPRangeSet:
+   """
+      Conjunto de endereços IPv4 guardado como intervalos ordenados.
+   """
+
+   def __init__(self, inicios = (), fins = ()):
+      """
+         Args:
+            inicios (Iterable[int]): Início de cada intervalo.
+            fins (Iterable[int]): Fim (inclusive) de cada intervalo.
+      """
+      arrInicios = np.asarray(inicios, dtype=np.uint64)
+      arrFins    = np.asarray(fins, dtype=np.uint64)
+      if arrInicios.shape != arrFins.shape:
+         raise ValueError('ERRO...: A quantidade de inícios e de fins deve ser a mesma.')
+      if arrInicios.size and (np.any(arrInicios > arrFins) or arrFins.max() > ULTIMO_IP):
+         raise ValueError('ERRO...: Intervalo inválido (início maior que o fim ou fora do IPv4).')
+      self._arrInicios, self._arrFins = unirFaixas(arrInicios, arrFins)
+
+
+   # ----------------------------------------------------------------------
+   @classmethod
+   def _criar(cls, inicios: np.ndarray, fins: np.ndarray) -> 'IPRangeSet':
+      """
+         Cria o conjunto a partir de intervalos já normalizados (sem validar).
+      """
+      setNovo = cls.__new__(cls)
+      setNovo._arrInicios, setNovo._arrFins = inicios, fins
+      return setNovo
+
+
+   # ----------------------------------------------------------------------
+   @classmethod
+   def deRedes(cls, redes, cidrs) -> 'IPRangeSet':
+      """
+         Cria o conjunto a partir de redes (IP + CIDR).
+
+         Args:
+            redes (list[str] | np.ndarray): Endereços das redes ('A.B.C.D' ou uint32).
+            cidrs (int | list[int] | np.ndarray): Os valores CIDR.
+      """
+      return cls._criar(*unirFaixas(*redes2faixas(redes, cidrs)))
+
+
+   # ----------------------------------------------------------------------
+   @property
+   def inicios(self) -> np.ndarray:
+      return self._arrInicios
+
+
+   @property
+   def fins(self) -> np.ndarray:
+      return self._arrFins
+
+
+   # ----------------------------------------------------------------------
+   def complemento(self) -> 'IPRangeSet':
+      """
+         Retorna todos os endereços IPv4 que não estão no conjunto.
+      """
+      # As lacunas vão do fim de cada intervalo + 1 até o início do próximo - 1
+      arrInicios = np.concatenate((np.zeros(1, dtype=np.int64), self._arrFins.astype(np.int64) + 1))
+      arrFins    = np.concatenate((self._arrInicios.astype(np.int64) - 1, np.full(1, ULTIMO_IP, dtype=np.int64)))
+      arrMantem  = arrInicios <= arrFins
+      return self._criar(arrInicios[arrMantem].astype(np.uint64), arrFins[arrMantem].astype(np.uint64))
+
+
+   # ----------------------------------------------------------------------
+   def uniao(self, outro: 'IPRangeSet') -> 'IPRangeSet':
+      """
+         Retorna a união dos dois conjuntos, intercalando os intervalos já
+         ordenados (sem reordenar): O(n + m).
+      """
+      intQtOutro = outro._arrInicios.size
+      arrPosOutro = np.searchsorted(self._arrInicios, outro._arrInicios, side='right') + np.arange(intQtOutro)
+
+      intTotal   = self._arrInicios.size + intQtOutro
+      arrInicios = np.empty(intTotal, dtype=np.uint64)
+      arrFins    = np.empty(intTotal, dtype=np.uint64)
+      arrDoOutro = np.zeros(intTotal, dtype=bool)
+      arrDoOutro[arrPosOutro] = True
+
+      arrInicios[arrPosOutro], arrFins[arrPosOutro] = outro._arrInicios, outro._arrFins
+      arrInicios[~arrDoOutro], arrFins[~arrDoOutro] = self._arrInicios, self._arrFins
+      return self._criar(*unirFaixas(arrInicios, arrFins, ordenado=True))
+
+
+   # ----------------------------------------------------------------------
+   def intersecao(self, outro: 'IPRangeSet') -> 'IPRangeSet':
+      """
+         Retorna os endereços presentes nos dois conjuntos (A ∩ B = ¬(¬A ∪ ¬B)).
+      """
+      return self.complemento().uniao(outro.complemento()).complemento()
+
+
+   # ----------------------------------------------------------------------
+   def diferenca(self, outro: 'IPRangeSet') -> 'IPRangeSet':
+      """
+         Retorna os endereços deste conjunto que não estão no outro (A ∩ ¬B).
+      """
+      return self.intersecao(outro.complemento())
+
+
+   # ----------------------------------------------------------------------
+   def diferencaSimetrica(self, outro: 'IPRangeSet') -> 'IPRangeSet':
+      """
+         Retorna os endereços que estão em apenas um dos dois conjuntos.
+      """
+      return self.diferenca(outro).uniao(outro.diferenca(self))
+
+
+   # ----------------------------------------------------------------------
+   def contem(self, ips) -> np.ndarray:
+      """
+         Testa, em lote, se cada endereço pertence ao conjunto.
+
+         Args:
+            ips (list[str] | np.ndarray): Os endereços IP ('A.B.C.D' ou uint32).
+
+         Returns:
+            np.ndarray: Array bool com o resultado para cada endereço.
+      """
+      arrIPs = ips2array(ips).astype(np.uint64)
+      if not self._arrInicios.size: return np.zeros(arrIPs.shape, dtype=bool)
+      arrPos = np.searchsorted(self._arrInicios, arrIPs, side='right') - 1
+      return (arrPos >= 0) & (arrIPs <= self._arrFins[arrPos.clip(0)])
+
+
+   # ----------------------------------------------------------------------
+   def contemConjunto(self, outro: 'IPRangeSet') -> bool:
+      """
+         Retorna True se todos os endereços do outro conjunto estão neste
+         (cada intervalo do outro deve caber em um único intervalo deste).
+      """
+      if not outro._arrInicios.size: return True
+      if not self._arrInicios.size: return False
+      arrPos = np.searchsorted(self._arrInicios, outro._arrInicios, side='right') - 1
+      return bool(np.all((arrPos >= 0) & (outro._arrFins <= self._arrFins[arrPos.clip(0)])))
+
+
+   # ----------------------------------------------------------------------
+   def qtEnderecos(self) -> int:
+      """
+         Retorna a quantidade total de endereços no conjunto.
+      """
+      return int((self._arrFins - self._arrInicios + np.uint64(1)).sum())
+
+
+   # ----------------------------------------------------------------------
+   def paraCIDRs(self) -> tuple:
+      """
+         Retorna o conjunto como o menor número de blocos CIDR.
+
+         Returns:
+            tuple: (array de redes uint32, array de CIDRs uint8).
+      """
+      return faixas2cidrs(self._arrInicios, self._arrFins)
+
+
+   # ----------------------------------------------------------------------
+   def __contains__(self, ip) -> bool:
+      intIP  = ip2int(ip) if isinstance(ip, (str, bytes)) else int(ip)
+      intPos = int(np.searchsorted(self._arrInicios, intIP, side='right')) - 1
+      return intPos >= 0 and intIP <= int(self._arrFins[intPos])
+
+   def __len__(self) -> int:
+      return int(self._arrInicios.size)
+
+   def __iter__(self):
+      return zip(self._arrInicios.tolist(), self._arrFins.tolist())
+
+   def __eq__(self, outro) -> bool:
+      if not isinstance(outro, IPRangeSet): return NotImplemented
+      return np.array_equal(self._arrInicios, outro._arrInicios) and np.array_equal(self._arrFins, outro._arrFins)
+
+   def __repr__(self) -> str:
+      return f'IPRangeSet({len(self)} faixas, {self.qtEnderecos()} endereços)'
+
+   __or__  = uniao
+   __and__ = intersecao
+   __sub__ = diferenca
+   __xor__ = diferencaSimetrica
+   __ge__  = contemConjunto
+   __invert__ = complemento
+
+   def __le__(self, outro: 'IPRangeSet') -> bool:
+      return outro.contemConjunto(self)
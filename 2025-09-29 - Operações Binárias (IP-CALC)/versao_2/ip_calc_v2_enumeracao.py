@@ -0,0 +1,140 @@
+'''
+   Enumeração Preguiçosa de Hosts e Sub-redes IPv4
+
+   O script ip_calc_v2.py mostra apenas o primeiro e o último host de uma
+   rede. Este módulo permite percorrer todos os hosts (ou todas as
+   sub-redes de um tamanho maior, ex: todas as /24 de uma /8) sem montar
+   listas na memória.
+
+   As faixas são representadas por objetos range do Python, que ocupam
+   memória constante, sabem o seu tamanho (len) e permitem acesso direto
+   a qualquer posição (indice) em O(1).
+
+   Exemplo:
+      for strHost in gerarHosts('192.168.1.0', 30): print(strHost)
+      print(obterSubRede('10.0.0.0', 8, 24, 1000))  # -> ('10.3.232.0', 24)
+'''
+from ip_calc_v2_funcoes import *
+
+
+# ----------------------------------------------------------------------
+def _calcularRede(rede, cidr: int) -> tuple:
+   """
+      Valida o CIDR e retorna (rede, broadcast) como inteiros.
+   """
+   validarCIDR(cidr)
+   intIP      = ip2int(rede) if isinstance(rede, str) else rede
+   intMascara = cidr2mascara(cidr)
+   intIPRede  = intIP & intMascara
+   return intIPRede, intIPRede | (~intMascara & 0xFFFFFFFF)
+
+
+# ----------------------------------------------------------------------
+def faixaHosts(rede, cidr: int) -> range:
+   """
+      Retorna a faixa de hosts válidos da rede (do 1º ao último host),
+      como inteiros.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR (0-32).
+
+      Returns:
+         range: Faixa preguiçosa com os hosts (vazia para /31 e /32).
+   """
+   intIPRede, intIPBroadcast = _calcularRede(rede, cidr)
+   intIPPrimeiroHost = intIPRede | 0x00000001
+   intIPUltimoHost   = intIPBroadcast & 0xFFFFFFFE
+   return range(intIPPrimeiroHost, max(intIPUltimoHost + 1, intIPPrimeiroHost))
+
+
+# ----------------------------------------------------------------------
+def faixaSubRedes(rede, cidr: int, novo_cidr: int) -> range:
+   """
+      Retorna a faixa com os endereços de todas as sub-redes /novo_cidr
+      contidas na rede, como inteiros.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR da rede (0-32).
+         novo_cidr (int): O CIDR das sub-redes (de cidr até 32).
+
+      Returns:
+         range: Faixa preguiçosa com os endereços das sub-redes.
+   """
+   validarCIDR(novo_cidr)
+   if novo_cidr < cidr:
+      raise ValueError('ERRO...: O CIDR das sub-redes deve ser maior ou igual ao CIDR da rede.')
+   intIPRede, intIPBroadcast = _calcularRede(rede, cidr)
+   return range(intIPRede, intIPBroadcast + 1, 1 << (32 - novo_cidr))
+
+
+# ----------------------------------------------------------------------
+def gerarHosts(rede, cidr: int):
+   """
+      Gera, um a um, os hosts válidos da rede no formato 'A.B.C.D'.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR (0-32).
+
+      Yields:
+         str: O endereço de cada host.
+   """
+   yield from map(int2ip, faixaHosts(rede, cidr))
+
+
+# ----------------------------------------------------------------------
+def gerarSubRedes(rede, cidr: int, novo_cidr: int):
+   """
+      Gera, uma a uma, as sub-redes /novo_cidr contidas na rede.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR da rede (0-32).
+         novo_cidr (int): O CIDR das sub-redes (de cidr até 32).
+
+      Yields:
+         tuple: (endereço da sub-rede 'A.B.C.D', novo_cidr).
+   """
+   for intIPSubRede in faixaSubRedes(rede, cidr, novo_cidr):
+      yield int2ip(intIPSubRede), novo_cidr
+
+
+# ----------------------------------------------------------------------
+def obterHost(rede, cidr: int, indice: int) -> str:
+   """
+      Retorna o host na posição informada, sem percorrer a faixa.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR (0-32).
+         indice (int): A posição do host (0 = 1º host; negativos contam do fim).
+
+      Returns:
+         str: O endereço do host ou uma Exception (IndexError).
+   """
+   try:
+      return int2ip(faixaHosts(rede, cidr)[indice])
+   except IndexError:
+      raise IndexError(f'ERRO...: A rede não possui o host de índice {indice}.')
+
+
+# ----------------------------------------------------------------------
+def obterSubRede(rede, cidr: int, novo_cidr: int, indice: int) -> tuple:
+   """
+      Retorna a sub-rede /novo_cidr na posição informada, sem percorrer a faixa.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR da rede (0-32).
+         novo_cidr (int): O CIDR das sub-redes (de cidr até 32).
+         indice (int): A posição da sub-rede (negativos contam do fim).
+
+      Returns:
+         tuple: (endereço da sub-rede 'A.B.C.D', novo_cidr) ou uma Exception (IndexError).
+   """
+   try:
+      return int2ip(faixaSubRedes(rede, cidr, novo_cidr)[indice]), novo_cidr
+   except IndexError:
+      raise IndexError(f'ERRO...: A rede não possui a sub-rede de índice {indice}.')
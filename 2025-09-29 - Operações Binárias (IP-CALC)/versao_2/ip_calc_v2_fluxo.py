@@ -0,0 +1,197 @@
+'''
+   Cálculo de Faixa de Rede IPv4 em Modo Fluxo (Não Interativo)
+
+   Este script lê linhas no formato 'ip/cidr' (ex: '192.168.1.10/24') da
+   entrada padrão ou de um arquivo, processa-as em lotes de tamanho fixo
+   e grava os resultados de forma incremental em CSV ou JSONL, mantendo
+   o uso de memória constante mesmo para arquivos de vários GB.
+
+   Linhas inválidas não interrompem o processamento: elas são informadas
+   em um canal separado (por padrão, a saída de erros - stderr).
+
+   Exemplos de uso:
+      python ip_calc_v2_fluxo.py enderecos.txt -f jsonl -o resultado.jsonl
+      cat enderecos.txt | python ip_calc_v2_fluxo.py -e invalidos.txt > resultado.csv
+'''
+import argparse, csv, json, sys
+from contextlib import ExitStack
+from itertools import islice
+
+from ip_calc_v2_funcoes import *
+from ip_calc_v2_vetorizado import array2ips, calcularRedesLote
+
+# ----------------------------------------------------------------------
+# Colunas gravadas na saída (na ordem em que aparecem no CSV)
+COLUNAS = ('ip', 'cidr', 'mascara', 'rede', 'primeiro_host', 'broadcast', 'ultimo_host', 'qt_hosts')
+
+# Colunas que contém endereços IP (são convertidas para 'A.B.C.D')
+COLUNAS_IP = ('ip', 'mascara', 'rede', 'primeiro_host', 'broadcast', 'ultimo_host')
+
+TAMANHO_LOTE = 100_000
+
+
+# ----------------------------------------------------------------------
+def lerLinhas(entrada):
+   """
+      Gera, de forma preguiçosa, as linhas não vazias de um arquivo
+      (ignorando comentários iniciados por '#').
+
+      Args:
+         entrada (Iterable[str]): Arquivo aberto (ou qualquer iterável de linhas).
+
+      Yields:
+         tuple: (número da linha, conteúdo da linha sem espaços nas pontas).
+   """
+   for intNumLinha, strLinha in enumerate(entrada, start=1):
+      strLinha = strLinha.strip()
+      if strLinha and not strLinha.startswith('#'):
+         yield intNumLinha, strLinha
+
+
+# ----------------------------------------------------------------------
+def gerarLotes(iteravel, tamanho: int = TAMANHO_LOTE):
+   """
+      Agrupa os itens de um iterável em listas de tamanho fixo (o último
+      lote pode ser menor).
+
+      Args:
+         iteravel (Iterable): Os itens a serem agrupados.
+         tamanho (int): A quantidade máxima de itens por lote.
+
+      Yields:
+         list: Um lote de itens.
+   """
+   iterador = iter(iteravel)
+   while lstLote := list(islice(iterador, tamanho)):
+      yield lstLote
+
+
+# ----------------------------------------------------------------------
+def interpretarLinha(linha: str, cidr_padrao: int = None) -> tuple:
+   """
+      Interpreta uma linha no formato 'ip/cidr' (ou apenas 'ip', quando
+      um CIDR padrão for informado), validando o IP e o CIDR.
+
+      Args:
+         linha (str): A linha a ser interpretada.
+         cidr_padrao (int): CIDR usado quando a linha não informa um.
+
+      Returns:
+         tuple: (IP no formato 'A.B.C.D', CIDR como inteiro) ou uma Exception.
+   """
+   strIP, _, strCIDR = linha.partition('/')
+   if not strCIDR:
+      if cidr_padrao is None:
+         raise ValueError('ERRO...: Linha sem CIDR (formato esperado: ip/cidr)')
+      intCIDR = cidr_padrao
+   else:
+      try:
+         intCIDR = int(strCIDR)
+      except ValueError:
+         raise ValueError('ERRO...: O CIDR deve ser um número inteiro.')
+
+   validarIP(strIP)
+   validarCIDR(intCIDR)
+   return strIP, intCIDR
+
+
+# ----------------------------------------------------------------------
+def gerarRegistros(dictColunas: dict):
+   """
+      Converte os arrays (colunas) retornados por calcularRedesLote em
+      registros (linhas) prontos para gravação.
+
+      Args:
+         dictColunas (dict): As colunas calculadas para um lote.
+
+      Yields:
+         tuple: Os valores de um registro, na ordem de COLUNAS.
+   """
+   lstColunas = [
+      array2ips(dictColunas[c]) if c in COLUNAS_IP else dictColunas[c].tolist()
+      for c in COLUNAS
+   ]
+   yield from zip(*lstColunas)
+
+
+# ----------------------------------------------------------------------
+def processarFluxo(entrada, saida, formato: str = 'csv', tamanho_lote: int = TAMANHO_LOTE,
+                   erros = sys.stderr, cidr_padrao: int = None) -> tuple:
+   """
+      Processa um fluxo de linhas 'ip/cidr' em lotes, gravando os
+      resultados de forma incremental.
+
+      Args:
+         entrada (Iterable[str]): Arquivo (ou iterável) com as linhas de entrada.
+         saida (TextIO): Arquivo onde os resultados serão gravados.
+         formato (str): 'csv' ou 'jsonl'.
+         tamanho_lote (int): Quantidade de linhas processadas por lote.
+         erros (TextIO): Canal onde as linhas inválidas são informadas.
+         cidr_padrao (int): CIDR usado para linhas que não informam um.
+
+      Returns:
+         tuple: (quantidade de linhas processadas, quantidade de linhas inválidas).
+   """
+   if formato not in ('csv', 'jsonl'):
+      raise ValueError(f'ERRO...: Formato de saída \'{formato}\' inválido (use csv ou jsonl).')
+   if tamanho_lote < 1:
+      raise ValueError('ERRO...: O tamanho do lote deve ser maior que zero.')
+
+   if formato == 'csv':
+      escritorCSV = csv.writer(saida, lineterminator='\n')
+      escritorCSV.writerow(COLUNAS)
+
+   intQtProcessadas = intQtInvalidas = 0
+   for lstLote in gerarLotes(lerLinhas(entrada), tamanho_lote):
+      lstIPs, lstCIDRs = [], []
+      for intNumLinha, strLinha in lstLote:
+         try:
+            strIP, intCIDR = interpretarLinha(strLinha, cidr_padrao)
+         except Exception as e:
+            intQtInvalidas += 1
+            if erros is not None: erros.write(f'Linha {intNumLinha}: {strLinha} -> {e}\n')
+         else:
+            lstIPs.append(strIP)
+            lstCIDRs.append(intCIDR)
+
+      if not lstIPs: continue
+
+      dictColunas = calcularRedesLote(lstIPs, lstCIDRs)
+      if formato == 'csv':
+         escritorCSV.writerows(gerarRegistros(dictColunas))
+      else:
+         saida.writelines(json.dumps(dict(zip(COLUNAS, r))) + '\n' for r in gerarRegistros(dictColunas))
+      intQtProcessadas += len(lstIPs)
+
+   return intQtProcessadas, intQtInvalidas
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Cálculo de faixa de rede IPv4 em modo fluxo (ip/cidr por linha).')
+   parser.add_argument('entrada', nargs='?', default='-', help='arquivo de entrada (padrão: stdin)')
+   parser.add_argument('-o', '--saida', default='-', help='arquivo de saída (padrão: stdout)')
+   parser.add_argument('-f', '--formato', choices=('csv', 'jsonl'), default='csv', help='formato de saída')
+   parser.add_argument('-e', '--erros', default=None, help='arquivo para as linhas inválidas (padrão: stderr)')
+   parser.add_argument('-l', '--lote', type=int, default=TAMANHO_LOTE, help='linhas por lote')
+   parser.add_argument('-c', '--cidr', type=int, default=None, help='CIDR padrão para linhas sem /cidr')
+   args = parser.parse_args()
+
+   try:
+      # Os arquivos abertos aqui são fechados (e gravados) também em caso de erro
+      with ExitStack() as pilhaArquivos:
+         # Bytes inválidos em UTF-8 viram '�': a linha é informada como inválida
+         arqEntrada = sys.stdin if args.entrada == '-' else \
+                      pilhaArquivos.enter_context(open(args.entrada, 'r', encoding='utf-8', errors='replace'))
+         arqSaida   = sys.stdout if args.saida == '-' else \
+                      pilhaArquivos.enter_context(open(args.saida, 'w', encoding='utf-8', newline=''))
+         arqErros   = sys.stderr if args.erros is None else \
+                      pilhaArquivos.enter_context(open(args.erros, 'w', encoding='utf-8'))
+         intQtProcessadas, intQtInvalidas = processarFluxo(arqEntrada, arqSaida, args.formato,
+                                                           args.lote, arqErros, args.cidr)
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'Linhas processadas: {intQtProcessadas} | Linhas inválidas: {intQtInvalidas}', file=sys.stderr)
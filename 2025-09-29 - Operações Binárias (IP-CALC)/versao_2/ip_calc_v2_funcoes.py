@@ -1,3 +1,8 @@
+from bisect import bisect_right
+from functools import lru_cache
+from socket import AF_INET, inet_pton
+
+
 # ----------------------------------------------------------------------
 def validarIP(ip: str) -> bool | Exception:
    """
@@ -9,19 +14,9 @@ def validarIP(ip: str) -> bool | Exception:
       Returns:
          bool: True se o IP for válido ou uma Exception.
    """
-   try:
-      lstOctetos = ip.split('.')
-      if len(lstOctetos) != 4: 
-         raise ValueError('ERRO...: Endereço IPv4 inválido. Não possui 4 octetos')
-      for octeto in lstOctetos:
-         if not octeto.isdigit(): 
-            raise ValueError(f'ERRO...: Endereço IPv4 inválido. Octeto \'{octeto}\' não é numérico')
-         if not 0 <= int(octeto) <= 255: 
-            raise ValueError(f'ERRO...: Endereço IPv4 inválido. Octeto \'{octeto}\' está fora do intervalo válido (0-255)')
-   except Exception as excecao:
-      raise excecao
-   else:
-      return True 
+   # A validação é feita pelo próprio conversor (ip2int), em uma única passada
+   ip2int(ip)
+   return True
 
 
 # ----------------------------------------------------------------------
@@ -47,39 +42,181 @@ def validarCIDR(cidr: int) -> bool | Exception:
 
 
 # ----------------------------------------------------------------------
-def classificarIP(ip: str) -> tuple:
+def ip2int(ip: str | bytes) -> int:
+   """
+      Valida e converte um endereço IPv4 no formato 'A.B.C.D' (str ou bytes)
+      para um inteiro de 32 bits, percorrendo os octetos uma única vez.
+
+      Args:
+         ip (str | bytes): O endereço IP a ser convertido.
+
+      Returns:
+         int: O endereço IP como inteiro ou uma Exception.
+   """
+   # Caminho rápido: inet_pton (em C) aceita apenas 'A.B.C.D' com octetos
+   # decimais de 0 a 255, sem zeros à esquerda. O que ele recusa (inclusive
+   # '010.0.0.1', que é válido aqui) segue para a validação octeto a octeto,
+   # que também monta a mensagem de erro
+   if isinstance(ip, str):
+      try:
+         return int.from_bytes(inet_pton(AF_INET, ip), 'big')
+      except (OSError, ValueError):
+         pass
+
+   lstOctetos = ip.split(b'.' if isinstance(ip, (bytes, bytearray)) else '.')
+   if len(lstOctetos) != 4:
+      raise ValueError('ERRO...: Endereço IPv4 inválido. Não possui 4 octetos')
+
+   intIP = 0
+   for octeto in lstOctetos:
+      if not (octeto.isdigit() and octeto.isascii()):
+         strOcteto = octeto if isinstance(octeto, str) else octeto.decode('ascii', 'replace')
+         raise ValueError(f'ERRO...: Endereço IPv4 inválido. Octeto \'{strOcteto}\' não é numérico')
+      intOcteto = int(octeto)
+      if intOcteto > 255:
+         strOcteto = octeto if isinstance(octeto, str) else octeto.decode('ascii')
+         raise ValueError(f'ERRO...: Endereço IPv4 inválido. Octeto \'{strOcteto}\' está fora do intervalo válido (0-255)')
+      intIP = (intIP << 8) | intOcteto
+   return intIP
+
+
+# ----------------------------------------------------------------------
+def criarCacheIP(tamanho: int = 65536):
+   """
+      Cria uma versão de ip2int com cache LRU limitado: endereços repetidos
+      (comuns em logs) são convertidos apenas uma vez.
+
+      Args:
+         tamanho (int): A quantidade máxima de endereços guardados no cache.
+
+      Returns:
+         Callable: Função com a mesma assinatura de ip2int.
+   """
+   return lru_cache(maxsize=tamanho)(ip2int)
+
+
+# ----------------------------------------------------------------------
+def int2ip(valor: int) -> str:
+   """
+      Converte um inteiro de 32 bits para um endereço IPv4 no formato 'A.B.C.D'.
+
+      Args:
+         valor (int): O endereço IP como inteiro.
+
+      Returns:
+         str: O endereço IP no formato 'A.B.C.D'.
+   """
+   return '.'.join([str(x) for x in valor.to_bytes(4, 'big')])
+
+
+# ----------------------------------------------------------------------
+def cidr2mascara(cidr: int) -> int:
+   """
+      Calcula a máscara de sub-rede (inteiro de 32 bits) para um CIDR.
+
+      Args:
+         cidr (int): O valor CIDR (0-32).
+
+      Returns:
+         int: A máscara de sub-rede como inteiro.
+   """
+   return 0xFFFFFFFF >> (32 - cidr) << (32 - cidr)
+
+
+# ----------------------------------------------------------------------
+# Classe de cada endereço IPv4, indexada pelo primeiro octeto (0-255)
+CLASSES_OCTETO = tuple(
+   'Reservado (Rede Atual)'          if o == 0   else
+   'Classe A (Endereço de Loopback)' if o == 127 else
+   'A' if o <= 126 else
+   'B' if o <= 191 else
+   'C' if o <= 223 else
+   'D' if o <= 239 else
+   'E'
+   for o in range(256)
+)
+
+# Faixas de endereços especiais (RFC 6890 e RFCs relacionadas). Os
+# endereços fora destas faixas são classificados como 'Público'. Quando
+# uma faixa está contida em outra, prevalece a mais específica.
+FAIXAS_ESPECIAIS = (
+   ('0.0.0.0',          8, 'Endereço Especial'),
+   ('10.0.0.0',         8, 'Privado'),
+   ('100.64.0.0',      10, 'Compartilhado (CGNAT)'),
+   ('127.0.0.0',        8, 'Endereço Especial'),
+   ('169.254.0.0',     16, 'Link-Local'),
+   ('172.16.0.0',      12, 'Privado'),
+   ('192.0.0.0',       24, 'Reservado (Atribuições de Protocolo IETF)'),
+   ('192.0.2.0',       24, 'Documentação (TEST-NET-1)'),
+   ('192.88.99.0',     24, 'Reservado (Relay Anycast 6to4)'),
+   ('192.168.0.0',     16, 'Privado'),
+   ('198.18.0.0',      15, 'Testes de Desempenho (Benchmarking)'),
+   ('198.51.100.0',    24, 'Documentação (TEST-NET-2)'),
+   ('203.0.113.0',     24, 'Documentação (TEST-NET-3)'),
+   ('224.0.0.0',        4, 'Reservado para Multicast'),
+   ('240.0.0.0',        4, 'Reservado para Uso Futuro/Experimental'),
+   ('255.255.255.255', 32, 'Broadcast Limitado'),
+)
+
+
+# ----------------------------------------------------------------------
+def _indexarFaixas(faixas: tuple) -> tuple:
+   """
+      Converte as faixas especiais (rede, CIDR, tipo) em intervalos
+      [início, fim] ordenados e sem sobreposição, para busca binária.
+
+      Returns:
+         tuple: (lista de inícios, lista de fins, lista de tipos).
+   """
+   lstFaixas = []
+   for strRede, intCIDR, strTipo in faixas:
+      intInicio = ip2int(strRede) & cidr2mascara(intCIDR)
+      lstFaixas.append((intInicio, intInicio | (~cidr2mascara(intCIDR) & 0xFFFFFFFF), strTipo))
+
+   # Divide a reta de endereços nos pontos onde alguma faixa começa ou
+   # termina e atribui a cada trecho a faixa mais específica (menor)
+   lstPontos = sorted({f[0] for f in lstFaixas} | {f[1] + 1 for f in lstFaixas})
+   lstInicios, lstFins, lstTipos = [], [], []
+   for intInicio, intProximo in zip(lstPontos, lstPontos[1:]):
+      lstCobrem = [f for f in lstFaixas if f[0] <= intInicio and intProximo - 1 <= f[1]]
+      if not lstCobrem: continue
+      strTipo = min(lstCobrem, key=lambda f: f[1] - f[0])[2]
+      if lstFins and lstFins[-1] + 1 == intInicio and lstTipos[-1] == strTipo:
+         lstFins[-1] = intProximo - 1
+      else:
+         lstInicios.append(intInicio)
+         lstFins.append(intProximo - 1)
+         lstTipos.append(strTipo)
+
+   return lstInicios, lstFins, lstTipos
+
+
+INICIOS_ESPECIAIS, FINS_ESPECIAIS, TIPOS_ESPECIAIS = _indexarFaixas(FAIXAS_ESPECIAIS)
+
+
+# ----------------------------------------------------------------------
+def classificarIP(ip: str | int) -> tuple:
    """
       Classifica um endereço IPv4, identificando sua classe e se pertence a
-      um intervalo especial (privado, loopback, etc.).
+      um intervalo especial (privado, loopback, CGNAT, documentação, etc.).
+
+      A classe é obtida de uma tabela indexada pelo primeiro octeto e o tipo
+      por busca binária nas faixas especiais (FAIXAS_ESPECIAIS).
 
       Args:
-         ip (str): Um endereço IP válido.
-   """
-   lstOctetos = [int(o) for o in ip.split('.')]
-    
-   if lstOctetos[0] == 0:
-      classe = 'Reservado (Rede Atual)'
-      tipo   = 'Endereço Especial'
-   elif lstOctetos[0] == 127:
-      classe = 'Classe A (Endereço de Loopback)'
-      tipo   = 'Endereço Especial'
-   elif 1 <= lstOctetos[0] <= 126:
-      classe = 'A'
-      tipo   = 'Público' if lstOctetos[0] != 10 else 'Privado'
-   elif 128 <= lstOctetos[0] <= 191:
-      classe = 'B'
-      tipo   = 'Público' if not (lstOctetos[0] == 172 and 16 <= lstOctetos[1] <= 31) else 'Privado'
-   elif 192 <= lstOctetos[0] <= 223:
-      classe = 'C'
-      tipo   = 'Público' if not (lstOctetos[0] == 192 and lstOctetos[1] == 168) else 'Privado'
-   elif 224 <= lstOctetos[0] <= 239:
-      classe = 'D'
-      tipo   = 'Reservado para Multicast'
-   elif 240 <= lstOctetos[0] <= 255:
-      classe = 'E'
-      tipo   = 'Reservado para Uso Futuro/Experimental'
+         ip (str | int): Um endereço IP válido ('A.B.C.D' ou inteiro).
+
+      Returns:
+         tuple: (classe, tipo) do endereço IP.
+   """
+   intIP = ip2int(ip) if isinstance(ip, str) else ip
+   if not 0 <= intIP <= 0xFFFFFFFF:
+      raise ValueError('ERRO...: Endereço IPv4 inválido. Valor fora do intervalo de 32 bits')
+
+   intPos = bisect_right(INICIOS_ESPECIAIS, intIP) - 1
+   if intPos >= 0 and intIP <= FINS_ESPECIAIS[intPos]:
+      strTipo = TIPOS_ESPECIAIS[intPos]
    else:
-      classe = 'Desconhecida'
-      tipo   = 'N/A' 
+      strTipo = 'Público'
 
-   return classe, tipo
+   return CLASSES_OCTETO[intIP >> 24], strTipo
@@ -0,0 +1,331 @@
+'''
+   Cálculo de Faixa de Rede IPv6
+
+   Versão IPv6 das funções do ip_calc_v2_funcoes.py. Os endereços IPv6
+   têm 128 bits (8 grupos de 16 bits em hexadecimal, separados por ':')
+   e a sequência de grupos zerados mais longa pode ser abreviada por '::'
+   (ex: '2001:db8::1' = '2001:0db8:0000:0000:0000:0000:0000:0001').
+
+   Os cálculos usam a mesma aritmética de bits do IPv4, mas com máscaras
+   de 128 bits (inteiros do Python não têm limite de tamanho):
+      intMascara = MASCARA_128 >> (128 - intCIDR) << (128 - intCIDR)
+
+   Diferente do IPv4, o IPv6 não possui endereço de broadcast: todos os
+   endereços da faixa (da rede até o último) podem ser usados por hosts.
+
+   Exemplo:
+      dictRede = calcularRedeIPv6('2001:db8:abcd:12::1', 64)
+      print(dictRede['rede'], dictRede['ultimo_host'])
+'''
+from ip_calc_v2_funcoes import ip2int, int2ip, validarIP
+
+# ----------------------------------------------------------------------
+MASCARA_128 = (1 << 128) - 1
+
+# Faixas especiais IPv6 (RFC 6890 e RFCs relacionadas): (rede, CIDR,
+# classe, tipo). Quando uma faixa está contida em outra, prevalece a mais
+# específica. Os endereços fora destas faixas são reservados pela IETF.
+FAIXAS_ESPECIAIS_V6 = (
+   ('::',           128, 'Não Especificado',            'Endereço Especial'),
+   ('::1',          128, 'Loopback',                    'Endereço Especial'),
+   ('2001::',        32, 'Teredo',                      'Túnel (Teredo)'),
+   ('2001:db8::',    32, 'Documentação',                'Documentação'),
+   ('2001:10::',     28, 'ORCHID',                      'Reservado (ORCHID)'),
+   ('2001::',        23, 'Atribuições IETF',            'Reservado (Atribuições de Protocolo IETF)'),
+   ('2001:2::',      48, 'Testes de Desempenho',        'Testes de Desempenho (Benchmarking)'),
+   ('::ffff:0:0',    96, 'IPv4 Mapeado',                'Endereço Especial'),
+   ('64:ff9b::',     96, 'Tradução IPv4/IPv6',          'Endereço Especial'),
+   ('100::',         64, 'Descarte (Discard-Only)',     'Endereço Especial'),
+   ('2002::',        16, '6to4',                        'Túnel (6to4)'),
+   ('fc00::',         7, 'Unique Local (ULA)',          'Privado'),
+   ('fe80::',        10, 'Link-Local',                  'Link-Local'),
+   ('ff00::',         8, 'Multicast',                   'Reservado para Multicast'),
+   ('2000::',         3, 'Unicast Global',              'Público'),
+)
+
+
+# ----------------------------------------------------------------------
+def ipv62int(ip: str) -> int:
+   """
+      Valida e converte um endereço IPv6 (com ou sem abreviação '::' e,
+      opcionalmente, com um IPv4 embutido no final) para um inteiro de 128 bits.
+
+      Args:
+         ip (str): O endereço IPv6 (ex: '2001:db8::1', '::ffff:192.168.1.10').
+
+      Returns:
+         int: O endereço IPv6 como inteiro ou uma Exception.
+   """
+   if not isinstance(ip, str):
+      raise TypeError('ERRO...: O endereço IPv6 deve ser uma string.')
+
+   strCabeca, strAbreviacao, strCauda = ip.partition('::')
+   if '::' in strCauda:
+      raise ValueError('ERRO...: Endereço IPv6 inválido. Possui mais de uma abreviação \'::\'')
+
+   lstCabeca = strCabeca.split(':') if strCabeca else []
+   lstCauda  = strCauda.split(':')  if strCauda  else []
+
+   # Um IPv4 embutido (ex: ::ffff:192.168.1.10) ocupa os dois últimos grupos
+   lstFinal = lstCauda if strAbreviacao else lstCabeca
+   if lstFinal and '.' in lstFinal[-1]:
+      try:
+         validarIP(lstFinal[-1])
+      except ValueError as e:
+         raise ValueError(f'ERRO...: Endereço IPv6 inválido. IPv4 embutido inválido ({e})')
+      intIPv4 = ip2int(lstFinal[-1])
+      lstFinal[-1:] = [f'{intIPv4 >> 16:x}', f'{intIPv4 & 0xFFFF:x}']
+
+   intQtGrupos = len(lstCabeca) + len(lstCauda)
+   if strAbreviacao:
+      if intQtGrupos > 7:
+         raise ValueError('ERRO...: Endereço IPv6 inválido. Possui grupos demais para usar \'::\'')
+      lstGrupos = lstCabeca + ['0'] * (8 - intQtGrupos) + lstCauda
+   else:
+      if intQtGrupos != 8:
+         raise ValueError('ERRO...: Endereço IPv6 inválido. Não possui 8 grupos')
+      lstGrupos = lstCabeca
+
+   intIP = 0
+   for strGrupo in lstGrupos:
+      if not 1 <= len(strGrupo) <= 4 or strGrupo.strip('0123456789abcdefABCDEF'):
+         raise ValueError(f'ERRO...: Endereço IPv6 inválido. Grupo \'{strGrupo}\' não é um hexadecimal de 1 a 4 dígitos')
+      intIP = (intIP << 16) | int(strGrupo, 16)
+   return intIP
+
+
+# ----------------------------------------------------------------------
+def int2ipv6(valor: int) -> str:
+   """
+      Converte um inteiro de 128 bits para um endereço IPv6 no formato
+      abreviado recomendado pela RFC 5952 (minúsculas, sem zeros à
+      esquerda e com '::' na maior sequência de grupos zerados).
+
+      Args:
+         valor (int): O endereço IPv6 como inteiro.
+
+      Returns:
+         str: O endereço IPv6 abreviado.
+   """
+   # Endereços IPv4 mapeados são exibidos com o IPv4 no final
+   if valor >> 32 == 0xFFFF:
+      return f'::ffff:{int2ip(valor & 0xFFFFFFFF)}'
+
+   lstGrupos = [(valor >> (112 - 16 * i)) & 0xFFFF for i in range(8)]
+
+   # Procura a maior sequência (com 2 ou mais grupos) de grupos zerados
+   intInicio, intTamanho, intPos = -1, 1, 0
+   while intPos < 8:
+      intFim = intPos
+      while intFim < 8 and lstGrupos[intFim] == 0: intFim += 1
+      if intFim - intPos > intTamanho:
+         intInicio, intTamanho = intPos, intFim - intPos
+      intPos = intFim + 1
+
+   lstTexto = [f'{g:x}' for g in lstGrupos]
+   if intInicio < 0: return ':'.join(lstTexto)
+   return ':'.join(lstTexto[:intInicio]) + '::' + ':'.join(lstTexto[intInicio + intTamanho:])
+
+
+# ----------------------------------------------------------------------
+def validarIPv6(ip: str) -> bool | Exception:
+   """
+      Valida um endereço IPv6.
+
+      Args:
+         ip (str): O endereço IPv6 a ser validado.
+
+      Returns:
+         bool: True se o IP for válido ou uma Exception.
+   """
+   ipv62int(ip)
+   return True
+
+
+# ----------------------------------------------------------------------
+def validarCIDRv6(cidr: int) -> bool | Exception:
+   """
+      Valida um prefixo IPv6 no formato CIDR.
+
+      Args:
+         cidr (int): O valor CIDR a ser validado (como inteiro).
+
+      Returns:
+         bool: True se o CIDR for válido ou uma Exception.
+   """
+   if not isinstance(cidr, int):
+      raise TypeError('ERRO...: O CIDR deve ser um número inteiro.')
+   if not 0 <= cidr <= 128:
+      raise ValueError('ERRO...: O CIDR deve estar entre 0 e 128.')
+   return True
+
+
+# ----------------------------------------------------------------------
+def cidr2mascarav6(cidr: int) -> int:
+   """
+      Calcula a máscara de rede IPv6 (inteiro de 128 bits) para um CIDR.
+
+      Args:
+         cidr (int): O valor CIDR (0-128).
+
+      Returns:
+         int: A máscara de rede como inteiro.
+   """
+   return MASCARA_128 >> (128 - cidr) << (128 - cidr)
+
+
+# ----------------------------------------------------------------------
+def _indexarFaixasV6(faixas: tuple) -> tuple:
+   """
+      Converte as faixas especiais para (rede, máscara, classe, tipo),
+      ordenadas da mais específica (maior CIDR) para a menos específica.
+   """
+   lstFaixas = sorted(faixas, key=lambda f: -f[1])
+   return tuple((ipv62int(r) & cidr2mascarav6(c), cidr2mascarav6(c), cl, t) for r, c, cl, t in lstFaixas)
+
+
+INDICE_ESPECIAIS_V6 = _indexarFaixasV6(FAIXAS_ESPECIAIS_V6)
+
+
+# ----------------------------------------------------------------------
+def classificarIPv6(ip: str | int) -> tuple:
+   """
+      Classifica um endereço IPv6, identificando sua categoria e se
+      pertence a um intervalo especial (loopback, link-local, ULA, etc.).
+
+      Args:
+         ip (str | int): Um endereço IPv6 válido (texto ou inteiro).
+
+      Returns:
+         tuple: (classe, tipo) do endereço IPv6.
+   """
+   intIP = ipv62int(ip) if isinstance(ip, str) else ip
+   for intRede, intMascara, strClasse, strTipo in INDICE_ESPECIAIS_V6:
+      if intIP & intMascara == intRede:
+         return strClasse, strTipo
+   return 'Reservado pela IETF', 'Reservado'
+
+
+# ----------------------------------------------------------------------
+def calcularRedeIPv6(ip: str | int, cidr: int) -> dict:
+   """
+      Calcula a faixa de rede IPv6 de um endereço e prefixo.
+
+      Args:
+         ip (str | int): O endereço IPv6 (texto ou inteiro).
+         cidr (int): O prefixo CIDR (0-128).
+
+      Returns:
+         dict: Inteiros com as chaves 'ip', 'cidr', 'mascara', 'rede',
+               'primeiro_host', 'ultimo_host' e 'qt_hosts'.
+   """
+   validarCIDRv6(cidr)
+   intIP      = ipv62int(ip) if isinstance(ip, str) else ip
+   intMascara = cidr2mascarav6(cidr)
+   intIPRede  = intIP & intMascara
+
+   return {
+      'ip'           : intIP,
+      'cidr'         : cidr,
+      'mascara'      : intMascara,
+      'rede'         : intIPRede,
+      'primeiro_host': intIPRede,
+      'ultimo_host'  : intIPRede | (~intMascara & MASCARA_128),
+      'qt_hosts'     : 2 ** (128 - cidr),
+   }
+
+
+# ----------------------------------------------------------------------
+def ipv6s2ints(ips) -> list:
+   """
+      Converte, em lote, endereços IPv6 para inteiros de 128 bits.
+
+      Args:
+         ips (Iterable[str]): Os endereços IPv6.
+
+      Returns:
+         list[int]: Os endereços como inteiros.
+   """
+   return [ipv62int(ip) for ip in ips]
+
+
+# ----------------------------------------------------------------------
+def calcularRedesIPv6Lote(ips, cidrs) -> dict:
+   """
+      Calcula, em lote, a faixa de rede para cada par (IPv6, CIDR). Como
+      o NumPy não possui inteiros de 128 bits, as colunas são listas de
+      inteiros do Python.
+
+      Args:
+         ips (Iterable[str | int]): Os endereços IPv6 (texto ou inteiro).
+         cidrs (int | Iterable[int]): Os prefixos CIDR. Um único inteiro é
+            aplicado a todos os endereços.
+
+      Returns:
+         dict: Listas (colunas) com as chaves 'ip', 'cidr', 'mascara', 'rede',
+               'primeiro_host', 'ultimo_host' e 'qt_hosts'.
+   """
+   lstIPs = [ipv62int(ip) if isinstance(ip, str) else ip for ip in ips]
+   lstCIDRs = [cidrs] * len(lstIPs) if isinstance(cidrs, int) else list(cidrs)
+   if len(lstCIDRs) != len(lstIPs):
+      raise ValueError('ERRO...: A quantidade de IPs e de CIDRs deve ser a mesma.')
+   for intCIDR in set(lstCIDRs): validarCIDRv6(intCIDR)
+
+   # Máscaras calculadas uma única vez por CIDR distinto
+   dictMascaras = {c: cidr2mascarav6(c) for c in set(lstCIDRs)}
+   lstMascaras  = [dictMascaras[c] for c in lstCIDRs]
+   lstRedes     = [i & m for i, m in zip(lstIPs, lstMascaras)]
+
+   return {
+      'ip'           : lstIPs,
+      'cidr'         : lstCIDRs,
+      'mascara'      : lstMascaras,
+      'rede'         : lstRedes,
+      'primeiro_host': lstRedes,
+      'ultimo_host'  : [r | (m ^ MASCARA_128) for r, m in zip(lstRedes, lstMascaras)],
+      'qt_hosts'     : [1 << (128 - c) for c in lstCIDRs],
+   }
+
+
+# ----------------------------------------------------------------------
+def classificarIPv6Lote(ips) -> list:
+   """
+      Classifica, em lote, os endereços IPv6 (mesmas regras de classificarIPv6).
+
+      Args:
+         ips (Iterable[str | int]): Os endereços IPv6 (texto ou inteiro).
+
+      Returns:
+         list[tuple]: (classe, tipo) de cada endereço.
+   """
+   return [classificarIPv6(ip) for ip in ips]
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   # Informando os dados de entrada (IPv6 e CIDR) com validação
+   print('\n--- Cálculo de Faixa de Rede IPv6 ---\n')
+   while True:
+      try:
+         strIP = input('Informe o Endereço IPv6 (ex: 2001:db8:abcd:12::1): ')
+         try:
+            intCIDR = int(input('Informe o Prefixo no formato CIDR (0-128): '))
+         except ValueError:
+            raise ValueError('ERRO...: O CIDR deve ser um número inteiro.')
+         else:
+            if validarIPv6(strIP) and validarCIDRv6(intCIDR): break
+      except Exception as e:
+         print(f'\n{e}.\nTente novamente...\n')
+
+   dictRede = calcularRedeIPv6(strIP, intCIDR)
+   strClasse, strTipo = classificarIPv6(dictRede['ip'])
+
+   print('\nRESULTADOS OBTIDOS (os IP\'s estão no formato IPV6):\n')
+   print(f'O Endereço é (IPV6).........................: {int2ipv6(dictRede["ip"])}')
+   print(f'A Máscara para o CIDR /{intCIDR:<3} é................: {int2ipv6(dictRede["mascara"])}\n')
+   print(f'A Classe do Endereço IP é...................: {strClasse}')
+   print(f'O Tipo do Endereço IP é.....................: {strTipo}\n')
+   print(f'O Endereço da Rede é (IPV6).................: {int2ipv6(dictRede["rede"])}')
+   print(f'O Endereço do 1º Host da Rede é (IPV6)......: {int2ipv6(dictRede["primeiro_host"])}')
+   print(f'O Endereço do Último Host da Rede é (IPV6)..: {int2ipv6(dictRede["ultimo_host"])}')
+   print(f'A Quantidade de Endereços na Rede é.........: {dictRede["qt_hosts"]}\n')
@@ -0,0 +1,226 @@
+'''
+   Agregador de Logs de Acesso por Sub-rede (Top-K)
+
+   Lê logs (web, firewall, ...) em fluxo, extrai o endereço IPv4 do
+   cliente de cada linha, calcula a sua rede para um ou mais CIDRs (a
+   mesma conta intIP & intMascara do ip_calc_v2.py) e mantém os
+   contadores das sub-redes que mais aparecem (heavy hitters).
+
+   Para que a memória seja limitada (independente do tamanho do log e da
+   quantidade de sub-redes distintas), cada CIDR usa um contador
+   "space-saving" com no máximo K entradas: quando uma sub-rede nova
+   chega e o contador está cheio, a menos contada é substituída e a nova
+   herda a sua contagem (registrada como erro máximo da estimativa).
+   Toda sub-rede com mais de N/K ocorrências está garantidamente no topo.
+
+   O log é lido em blocos de bytes (terminados em quebra de linha); a
+   extração dos IPs, a conversão e o cálculo das redes são feitos por
+   bloco (regex + NumPy), sem laços em Python por linha.
+
+   Exemplos de uso:
+      python ip_calc_v2_logs.py access.log -c 24 -c 16 -k 20
+      zcat firewall.log.gz | python ip_calc_v2_logs.py -r 'SRC=(\\S+)'
+'''
+import argparse, heapq, re, sys
+
+import numpy as np
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_vetorizado import calcularMascarasLote, converterBufferIPs
+
+# ----------------------------------------------------------------------
+# Primeiro endereço IPv4 de cada linha (o cliente, nos formatos comuns)
+REGEX_IPV4 = rb'(?<![\d.])((?:\d{1,3}\.){3}\d{1,3})(?![\d.])'
+
+TAMANHO_BLOCO = 1 << 22
+TAMANHO_TOPO  = 1000
+
+
+# ----------------------------------------------------------------------
+class ContadorTopK:
+   """
+      Contador space-saving: guarda no máximo K chaves e as suas
+      contagens (estimadas por cima, com o erro máximo de cada uma).
+   """
+
+   def __init__(self, k: int = TAMANHO_TOPO):
+      if k < 1:
+         raise ValueError('ERRO...: O tamanho do topo (K) deve ser maior que zero.')
+      self.k = k
+      self.total = 0
+      # chave -> [contagem, erro]
+      self._dictContadores = {}
+      # Heap (contagem, chave) para achar a menor contagem. Registros
+      # antigos (contagem desatualizada) são descartados ao remover
+      self._lstHeap = []
+
+
+   # ----------------------------------------------------------------------
+   def _removerMenor(self) -> int:
+      """
+         Remove a chave de menor contagem e retorna essa contagem.
+      """
+      while True:
+         intContagem, chave = heapq.heappop(self._lstHeap)
+         lstContador = self._dictContadores.get(chave)
+         if lstContador is not None and lstContador[0] == intContagem:
+            del self._dictContadores[chave]
+            return intContagem
+
+
+   # ----------------------------------------------------------------------
+   def adicionar(self, chave, peso: int = 1):
+      """
+         Soma 'peso' ocorrências à chave.
+      """
+      self.total += peso
+      lstContador = self._dictContadores.get(chave)
+      if lstContador is None:
+         intErro = self._removerMenor() if len(self._dictContadores) >= self.k else 0
+         lstContador = self._dictContadores[chave] = [intErro, intErro]
+      lstContador[0] += peso
+      heapq.heappush(self._lstHeap, (lstContador[0], chave))
+
+      # Reconstrói o heap quando os registros antigos se acumulam
+      if len(self._lstHeap) > 4 * self.k + 64:
+         self._lstHeap = [(c, chave) for chave, (c, _) in self._dictContadores.items()]
+         heapq.heapify(self._lstHeap)
+
+
+   # ----------------------------------------------------------------------
+   def adicionarLote(self, chaves, pesos):
+      """
+         Soma as ocorrências de várias chaves (ex: saída de np.unique).
+      """
+      for chave, intPeso in zip(chaves, pesos):
+         self.adicionar(chave, intPeso)
+
+
+   # ----------------------------------------------------------------------
+   def topo(self, n: int = None) -> list:
+      """
+         Retorna as n chaves mais contadas.
+
+         Returns:
+            list: Tuplas (chave, contagem estimada, erro máximo), da maior
+                  para a menor contagem.
+      """
+      lstOrdenada = sorted(self._dictContadores.items(), key=lambda item: item[1][0], reverse=True)
+      return [(chave, c, e) for chave, (c, e) in lstOrdenada[:n]]
+
+
+   def __len__(self) -> int:
+      return len(self._dictContadores)
+
+
+# ----------------------------------------------------------------------
+def lerBlocos(entrada, tamanho: int = TAMANHO_BLOCO):
+   """
+      Lê um arquivo binário em blocos de aproximadamente 'tamanho' bytes,
+      sempre terminados em uma quebra de linha (nenhuma linha é cortada).
+
+      Yields:
+         bytes: Um bloco de linhas completas.
+   """
+   while bytBloco := entrada.read(tamanho):
+      if not bytBloco.endswith(b'\n'): bytBloco += entrada.readline()
+      yield bytBloco
+
+
+# ----------------------------------------------------------------------
+class AgregadorSubRedes:
+   """
+      Conta as ocorrências de cada sub-rede (para vários CIDRs) nos IPs
+      extraídos de blocos de linhas de log.
+   """
+
+   def __init__(self, cidrs = (24, 16), k: int = TAMANHO_TOPO, regex: bytes = REGEX_IPV4):
+      """
+         Args:
+            cidrs (Iterable[int]): Os CIDRs das sub-redes a serem contadas.
+            k (int): Quantidade máxima de sub-redes guardadas por CIDR.
+            regex (bytes): Expressão que localiza o IP, com exatamente um
+               grupo (o primeiro casamento de cada linha é usado).
+      """
+      self.cidrs = tuple(cidrs)
+      self._arrMascaras = calcularMascarasLote(self.cidrs)
+      self._regexIP = re.compile(rb'^[^\n]*?' + regex, re.MULTILINE)
+      # findall retorna tuplas (ou a linha inteira) se não houver um único grupo
+      if self._regexIP.groups != 1:
+         raise ValueError('ERRO...: A expressão regular deve ter exatamente um grupo (o IP do cliente).')
+      self.contadores = {c: ContadorTopK(k) for c in self.cidrs}
+      self.qt_linhas = self.qt_sem_ip = 0
+
+
+   # ----------------------------------------------------------------------
+   def processarBloco(self, bloco: bytes):
+      """
+         Extrai os IPs de um bloco de linhas e atualiza os contadores.
+      """
+      lstIPs = self._regexIP.findall(bloco)
+      intQtLinhas = bloco.count(b'\n') + (not bloco.endswith(b'\n'))
+      self.qt_linhas += intQtLinhas
+      if not lstIPs:
+         self.qt_sem_ip += intQtLinhas
+         return
+
+      arrIPs, arrValidos = converterBufferIPs(b'\n'.join(lstIPs))
+      arrIPs = arrIPs[arrValidos]
+      self.qt_sem_ip += intQtLinhas - arrIPs.size
+
+      for intCIDR, intMascara in zip(self.cidrs, self._arrMascaras):
+         # Agrega o bloco antes de atualizar o contador (uma atualização
+         # por sub-rede distinta, e não por linha)
+         arrRedes, arrQts = np.unique(arrIPs & intMascara, return_counts=True)
+         self.contadores[intCIDR].adicionarLote(arrRedes.tolist(), arrQts.tolist())
+
+
+   # ----------------------------------------------------------------------
+   def processarArquivo(self, entrada, tamanho_bloco: int = TAMANHO_BLOCO):
+      """
+         Processa um arquivo binário (ou sys.stdin.buffer) inteiro.
+      """
+      for bytBloco in lerBlocos(entrada, tamanho_bloco):
+         self.processarBloco(bytBloco)
+
+
+   # ----------------------------------------------------------------------
+   def topo(self, cidr: int, n: int = None) -> list:
+      """
+         Retorna as n sub-redes mais frequentes para o CIDR informado.
+
+         Returns:
+            list: Tuplas ('rede/cidr', contagem estimada, erro máximo).
+      """
+      return [(f'{int2ip(r)}/{cidr}', c, e) for r, c, e in self.contadores[cidr].topo(n)]
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Conta as sub-redes mais frequentes nos IPs de um log.')
+   parser.add_argument('entrada', nargs='?', default='-', help='arquivo de log (padrão: stdin)')
+   parser.add_argument('-c', '--cidr', type=int, action='append', help='CIDR das sub-redes (pode repetir; padrão: 24 e 16)')
+   parser.add_argument('-k', '--topo', type=int, default=10, help='quantidade de sub-redes exibidas por CIDR')
+   parser.add_argument('-m', '--memoria', type=int, default=TAMANHO_TOPO, help='sub-redes guardadas por CIDR (K)')
+   parser.add_argument('-r', '--regex', default=None, help='expressão com um grupo que captura o IP do cliente')
+   parser.add_argument('-b', '--bloco', type=int, default=TAMANHO_BLOCO, help='tamanho do bloco de leitura (bytes)')
+   args = parser.parse_args()
+
+   try:
+      bytRegex = REGEX_IPV4 if args.regex is None else args.regex.encode('utf-8')
+      agregador = AgregadorSubRedes(args.cidr or (24, 16), max(args.memoria, args.topo), bytRegex)
+      if args.entrada == '-':
+         agregador.processarArquivo(sys.stdin.buffer, args.bloco)
+      else:
+         with open(args.entrada, 'rb') as arqEntrada:
+            agregador.processarArquivo(arqEntrada, args.bloco)
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'Linhas lidas: {agregador.qt_linhas} | Linhas sem IP válido: {agregador.qt_sem_ip}')
+      for intCIDR in agregador.cidrs:
+         print(f'\nTop {args.topo} sub-redes /{intCIDR}:')
+         for intPos, (strRede, intQt, intErro) in enumerate(agregador.topo(intCIDR, args.topo), start=1):
+            print(f'{intPos:>4}. {strRede:<18} {intQt:>12} (± {intErro})')
@@ -0,0 +1,223 @@
+'''
+   Cálculo de Faixa de Rede IPv4 em Paralelo (Vários Processos)
+
+   Versão paralela do ip_calc_v2_fluxo.py para arquivos muito grandes:
+
+      1. O arquivo de entrada é dividido em faixas de bytes (partes) de
+         tamanho parecido, com cada limite ajustado para o início de uma
+         linha (nenhuma linha é cortada ao meio);
+      2. Cada parte é processada por um processo de um ProcessPoolExecutor,
+         que usa o mesmo processarFluxo do modo fluxo e grava o resultado
+         em um arquivo temporário;
+      3. Os arquivos temporários são juntados na ordem original, à medida
+         que as partes terminam, e os números das linhas inválidas são
+         corrigidos para a posição no arquivo completo.
+
+   Há mais partes do que processos (por padrão, 4 por processo), para
+   que um processo que termine cedo pegue a próxima parte e nenhum núcleo
+   fique parado no final. Ao final, a vazão de cada processo é informada.
+
+   Exemplo de uso:
+      python ip_calc_v2_paralelo.py enderecos.txt -p 64 -o resultado.csv
+'''
+import argparse, os, re, shutil, sys, tempfile, time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+from ip_calc_v2_fluxo import TAMANHO_LOTE, processarFluxo
+
+# ----------------------------------------------------------------------
+PARTES_POR_PROCESSO = 4
+
+REGEX_LINHA_ERRO = re.compile(r'^Linha (\d+):')
+
+
+# ----------------------------------------------------------------------
+def dividirArquivo(caminho: str, qt_partes: int) -> list:
+   """
+      Divide um arquivo em faixas de bytes [início, fim) de tamanho
+      parecido, com todos os limites no início de uma linha.
+
+      Args:
+         caminho (str): O arquivo a ser dividido.
+         qt_partes (int): A quantidade desejada de partes.
+
+      Returns:
+         list: Lista de tuplas (início, fim), sem partes vazias.
+   """
+   intTamanho = os.path.getsize(caminho)
+   lstLimites = [0]
+   with open(caminho, 'rb') as arqEntrada:
+      for intParte in range(1, qt_partes):
+         intPos = intTamanho * intParte // qt_partes
+         if intPos <= lstLimites[-1]: continue
+         # Avança até o fim da linha em que o limite caiu
+         arqEntrada.seek(intPos - 1)
+         arqEntrada.readline()
+         lstLimites.append(min(arqEntrada.tell(), intTamanho))
+   lstLimites.append(intTamanho)
+   return [(i, f) for i, f in zip(lstLimites, lstLimites[1:]) if f > i]
+
+
+# ----------------------------------------------------------------------
+def processarParte(caminho: str, inicio: int, fim: int, prefixo: str, formato: str = 'csv',
+                   tamanho_lote: int = TAMANHO_LOTE, cidr_padrao: int = None) -> dict:
+   """
+      Processa uma faixa de bytes do arquivo (executado em cada processo),
+      gravando o resultado em '<prefixo>.saida' e as linhas inválidas em
+      '<prefixo>.erros' (numeradas a partir do início da parte).
+
+      Returns:
+         dict: Estatísticas da parte (pid, linhas, processadas, inválidas, segundos).
+   """
+   intQtLinhas = 0
+
+   def lerFaixa(arqEntrada):
+      nonlocal intQtLinhas
+      arqEntrada.seek(inicio)
+      intPos = inicio
+      for bytLinha in arqEntrada:
+         if intPos >= fim: break
+         intPos += len(bytLinha)
+         intQtLinhas += 1
+         # Um byte inválido em UTF-8 não interrompe a parte: a linha vira
+         # uma linha inválida comum (informada em 'erros')
+         yield bytLinha.decode('utf-8', errors='replace')
+
+   fltInicio = time.perf_counter()
+   with open(caminho, 'rb') as arqEntrada, \
+        open(f'{prefixo}.saida', 'w', encoding='utf-8', newline='') as arqSaida, \
+        open(f'{prefixo}.erros', 'w', encoding='utf-8') as arqErros:
+      intQtProcessadas, intQtInvalidas = processarFluxo(lerFaixa(arqEntrada), arqSaida, formato,
+                                                        tamanho_lote, arqErros, cidr_padrao)
+
+   return {'pid': os.getpid(), 'linhas': intQtLinhas, 'processadas': intQtProcessadas,
+           'invalidas': intQtInvalidas, 'segundos': time.perf_counter() - fltInicio}
+
+
+# ----------------------------------------------------------------------
+def _juntarParte(prefixo: str, saida, erros, formato: str, primeira: bool, deslocamento: int):
+   """
+      Acrescenta o resultado de uma parte à saída final (sem repetir o
+      cabeçalho CSV) e corrige a numeração das linhas inválidas.
+   """
+   with open(f'{prefixo}.saida', 'r', encoding='utf-8', newline='') as arqParte:
+      if formato == 'csv' and not primeira: arqParte.readline()
+      shutil.copyfileobj(arqParte, saida)
+
+   if erros is None: return
+   with open(f'{prefixo}.erros', 'r', encoding='utf-8') as arqParte:
+      for strLinha in arqParte:
+         erros.write(REGEX_LINHA_ERRO.sub(lambda m: f'Linha {int(m.group(1)) + deslocamento}:', strLinha, count=1))
+
+
+# ----------------------------------------------------------------------
+def processarParalelo(caminho: str, saida, formato: str = 'csv', tamanho_lote: int = TAMANHO_LOTE,
+                      erros = sys.stderr, cidr_padrao: int = None, processos: int = None,
+                      partes: int = None) -> tuple:
+   """
+      Processa um arquivo de linhas 'ip/cidr' com vários processos,
+      gravando os resultados na mesma ordem do arquivo de entrada.
+
+      Args:
+         caminho (str): O arquivo de entrada (precisa permitir seek).
+         saida (TextIO): Arquivo onde os resultados serão gravados.
+         formato (str): 'csv' ou 'jsonl'.
+         tamanho_lote (int): Quantidade de linhas processadas por lote.
+         erros (TextIO): Canal onde as linhas inválidas são informadas.
+         cidr_padrao (int): CIDR usado para linhas que não informam um.
+         processos (int): Quantidade de processos (padrão: núcleos da máquina).
+         partes (int): Quantidade de partes (padrão: 4 por processo).
+
+      Returns:
+         tuple: (linhas processadas, linhas inválidas, lista de estatísticas por parte).
+   """
+   if formato not in ('csv', 'jsonl'):
+      raise ValueError(f'ERRO...: Formato de saída \'{formato}\' inválido (use csv ou jsonl).')
+   if tamanho_lote < 1:
+      raise ValueError('ERRO...: O tamanho do lote deve ser maior que zero.')
+
+   intQtProcessos = processos or os.cpu_count() or 1
+   lstFaixas = dividirArquivo(caminho, partes or intQtProcessos * PARTES_POR_PROCESSO) or [(0, 0)]
+
+   intQtProcessadas = intQtInvalidas = intDeslocamento = 0
+   lstEstatisticas = []
+   with tempfile.TemporaryDirectory(prefix='ip_calc_') as strDirTemp, \
+        ProcessPoolExecutor(max_workers=intQtProcessos) as executor:
+      lstPrefixos = [os.path.join(strDirTemp, f'parte{i:05d}') for i in range(len(lstFaixas))]
+      lstFuturos  = [
+         executor.submit(processarParte, caminho, i, f, p, formato, tamanho_lote, cidr_padrao)
+         for (i, f), p in zip(lstFaixas, lstPrefixos)
+      ]
+
+      # Junta as partes na ordem do arquivo, enquanto as seguintes ainda rodam
+      for intParte, (futuro, strPrefixo) in enumerate(zip(lstFuturos, lstPrefixos)):
+         dictEstatistica = futuro.result()
+         _juntarParte(strPrefixo, saida, erros, formato, intParte == 0, intDeslocamento)
+         os.remove(f'{strPrefixo}.saida')
+         os.remove(f'{strPrefixo}.erros')
+
+         intDeslocamento  += dictEstatistica['linhas']
+         intQtProcessadas += dictEstatistica['processadas']
+         intQtInvalidas   += dictEstatistica['invalidas']
+         lstEstatisticas.append(dictEstatistica)
+
+   return intQtProcessadas, intQtInvalidas, lstEstatisticas
+
+
+# ----------------------------------------------------------------------
+def resumirProcessos(estatisticas: list) -> list:
+   """
+      Agrupa as estatísticas das partes por processo.
+
+      Returns:
+         list: Tuplas (pid, partes, linhas, segundos, linhas por segundo).
+   """
+   dictProcessos = {}
+   for dictEstatistica in estatisticas:
+      lstTotal = dictProcessos.setdefault(dictEstatistica['pid'], [0, 0, 0.0])
+      lstTotal[0] += 1
+      lstTotal[1] += dictEstatistica['linhas']
+      lstTotal[2] += dictEstatistica['segundos']
+   return [
+      (pid, p, l, s, l / s if s else 0.0)
+      for pid, (p, l, s) in sorted(dictProcessos.items())
+   ]
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Cálculo de faixa de rede IPv4 em paralelo (ip/cidr por linha).')
+   parser.add_argument('entrada', help='arquivo de entrada')
+   parser.add_argument('-o', '--saida', default='-', help='arquivo de saída (padrão: stdout)')
+   parser.add_argument('-f', '--formato', choices=('csv', 'jsonl'), default='csv', help='formato de saída')
+   parser.add_argument('-e', '--erros', default=None, help='arquivo para as linhas inválidas (padrão: stderr)')
+   parser.add_argument('-l', '--lote', type=int, default=TAMANHO_LOTE, help='linhas por lote')
+   parser.add_argument('-c', '--cidr', type=int, default=None, help='CIDR padrão para linhas sem /cidr')
+   parser.add_argument('-p', '--processos', type=int, default=None, help='quantidade de processos (padrão: núcleos)')
+   parser.add_argument('-n', '--partes', type=int, default=None, help='quantidade de partes (padrão: 4 por processo)')
+   args = parser.parse_args()
+
+   try:
+      # Os arquivos abertos aqui são fechados (e gravados) também em caso de erro
+      with ExitStack() as pilhaArquivos:
+         arqSaida = sys.stdout if args.saida == '-' else \
+                    pilhaArquivos.enter_context(open(args.saida, 'w', encoding='utf-8', newline=''))
+         arqErros = sys.stderr if args.erros is None else \
+                    pilhaArquivos.enter_context(open(args.erros, 'w', encoding='utf-8'))
+
+         fltInicio = time.perf_counter()
+         intQtProcessadas, intQtInvalidas, lstEstatisticas = processarParalelo(
+            args.entrada, arqSaida, args.formato, args.lote, arqErros, args.cidr, args.processos, args.partes)
+         fltTotal = max(time.perf_counter() - fltInicio, 1e-9)
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'{"PID":>8} {"Partes":>6} {"Linhas":>12} {"Segundos":>9} {"Linhas/s":>12}', file=sys.stderr)
+      for intPID, intPartes, intLinhas, fltSegundos, fltVazao in resumirProcessos(lstEstatisticas):
+         print(f'{intPID:>8} {intPartes:>6} {intLinhas:>12} {fltSegundos:>9.2f} {fltVazao:>12,.0f}', file=sys.stderr)
+      print(f'Linhas processadas: {intQtProcessadas} | Linhas inválidas: {intQtInvalidas} | '
+            f'Tempo total: {fltTotal:.2f} s ({(intQtProcessadas + intQtInvalidas) / fltTotal:,.0f} linhas/s)',
+            file=sys.stderr)
@@ -0,0 +1,180 @@
+'''
+   Pool de Endereços IPv4 com Mapa de Bits (Estilo DHCP)
+
+   Controla quais endereços de uma rede (calculada como no ip_calc_v2.py)
+   estão emprestados (leases), usando um bit por endereço em um
+   bytearray: uma rede /8 (16.777.216 endereços) ocupa apenas 2 MB, em
+   vez de um dicionário com uma string por endereço.
+
+   O endereço de rede e o de broadcast são reservados na criação do pool
+   (exceto nas redes /31 e /32, que não os possuem). A alocação procura o
+   próximo endereço livre a partir de um cursor que gira pela rede: os
+   bytes totalmente ocupados (0xFF) são pulados de uma vez por uma busca
+   em C (expressão regular sobre o bytearray), e o bit livre é achado com
+   aritmética de bits, sem laços em Python por endereço.
+
+   Exemplo:
+      poolDHCP = PoolEnderecos('192.168.0.0', 24)
+      poolDHCP.reservar('192.168.0.1')      # gateway
+      print(poolDHCP.alocar())              # -> 192.168.0.2
+'''
+import re
+
+from ip_calc_v2_funcoes import *
+
+# ----------------------------------------------------------------------
+# Qualquer byte que ainda tenha pelo menos um bit livre (zero)
+REGEX_BYTE_LIVRE = re.compile(rb'[^\xff]')
+
+
+# ----------------------------------------------------------------------
+class PoolEnderecos:
+   """
+      Pool de endereços de uma rede IPv4, com um bit por endereço
+      (1 = emprestado ou reservado, 0 = livre).
+   """
+
+   def __init__(self, rede, cidr: int):
+      """
+         Args:
+            rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+            cidr (int): O CIDR da rede.
+      """
+      validarCIDR(cidr)
+      intIP = ip2int(rede) if isinstance(rede, (str, bytes)) else rede
+      self.intIPRede = intIP & cidr2mascara(cidr)
+      self.intCIDR   = cidr
+      self.intQtEnderecos = 1 << (32 - cidr)
+
+      self._bytMapa   = bytearray((self.intQtEnderecos + 7) >> 3)
+      self._intCursor = 0
+      self._intQtUsados = 0
+      self._setReservados = set()
+
+      # Os bits que sobram no último byte (redes menores que /29) nunca
+      # ficam livres
+      intSobra = len(self._bytMapa) * 8 - self.intQtEnderecos
+      if intSobra: self._bytMapa[-1] = (0xFF << (8 - intSobra)) & 0xFF
+
+      if cidr <= 30:
+         self.reservar(self.intIPRede)
+         self.reservar(self.intIPRede + self.intQtEnderecos - 1)
+
+
+   # ----------------------------------------------------------------------
+   def _deslocamento(self, ip) -> int:
+      """
+         Converte um endereço na sua posição dentro do pool.
+      """
+      intIP = ip2int(ip) if isinstance(ip, (str, bytes)) else ip
+      intPos = intIP - self.intIPRede
+      if not 0 <= intPos < self.intQtEnderecos:
+         raise ValueError(f'ERRO...: O endereço {int2ip(intIP)} não pertence à rede {int2ip(self.intIPRede)}/{self.intCIDR}.')
+      return intPos
+
+
+   # ----------------------------------------------------------------------
+   def _estaUsado(self, posicao: int) -> bool:
+      return bool(self._bytMapa[posicao >> 3] >> (posicao & 7) & 1)
+
+
+   # ----------------------------------------------------------------------
+   def _marcar(self, posicao: int):
+      self._bytMapa[posicao >> 3] |= 1 << (posicao & 7)
+      self._intQtUsados += 1
+
+
+   # ----------------------------------------------------------------------
+   def alocarInt(self) -> int:
+      """
+         Empresta o próximo endereço livre (a partir do cursor).
+
+         Returns:
+            int: O endereço emprestado ou uma Exception (pool esgotado).
+      """
+      # Procura do cursor até o fim e, se preciso, do início até o cursor
+      encontrado = REGEX_BYTE_LIVRE.search(self._bytMapa, self._intCursor) or \
+                   REGEX_BYTE_LIVRE.search(self._bytMapa, 0, self._intCursor)
+      if encontrado is None:
+         raise ValueError(f'ERRO...: Não há endereços livres na rede {int2ip(self.intIPRede)}/{self.intCIDR}.')
+
+      intByte = encontrado.start()
+      intValor = self._bytMapa[intByte]
+      # Bit zero menos significativo: ~v & (v + 1) isola esse bit
+      intPos = (intByte << 3) | ((~intValor & (intValor + 1)).bit_length() - 1)
+
+      self._marcar(intPos)
+      self._intCursor = intByte
+      return self.intIPRede + intPos
+
+
+   # ----------------------------------------------------------------------
+   def alocar(self) -> str:
+      """
+         Empresta o próximo endereço livre.
+
+         Returns:
+            str: O endereço emprestado ('A.B.C.D').
+      """
+      return int2ip(self.alocarInt())
+
+
+   # ----------------------------------------------------------------------
+   def reservar(self, ip):
+      """
+         Reserva um endereço específico (ex: gateway), que não será
+         emprestado nem poderá ser liberado.
+
+         Args:
+            ip (str | int): O endereço a ser reservado.
+      """
+      intPos = self._deslocamento(ip)
+      if self._estaUsado(intPos):
+         raise ValueError(f'ERRO...: O endereço {int2ip(self.intIPRede + intPos)} já está em uso.')
+      self._marcar(intPos)
+      self._setReservados.add(intPos)
+
+
+   # ----------------------------------------------------------------------
+   def liberar(self, ip):
+      """
+         Devolve ao pool um endereço emprestado.
+
+         Args:
+            ip (str | int): O endereço a ser liberado.
+      """
+      intPos = self._deslocamento(ip)
+      if intPos in self._setReservados:
+         raise ValueError(f'ERRO...: O endereço {int2ip(self.intIPRede + intPos)} é reservado.')
+      if not self._estaUsado(intPos):
+         raise ValueError(f'ERRO...: O endereço {int2ip(self.intIPRede + intPos)} não está emprestado.')
+      self._bytMapa[intPos >> 3] &= ~(1 << (intPos & 7)) & 0xFF
+      self._intQtUsados -= 1
+
+
+   # ----------------------------------------------------------------------
+   @property
+   def qtUsados(self) -> int:
+      """
+         Quantidade de endereços emprestados ou reservados.
+      """
+      return self._intQtUsados
+
+
+   @property
+   def qtLivres(self) -> int:
+      return self.intQtEnderecos - self._intQtUsados
+
+
+   # ----------------------------------------------------------------------
+   def __contains__(self, ip) -> bool:
+      """
+         True se o endereço está emprestado ou reservado.
+      """
+      return self._estaUsado(self._deslocamento(ip))
+
+   def __len__(self) -> int:
+      return self._intQtUsados
+
+   def __repr__(self) -> str:
+      return f'PoolEnderecos({int2ip(self.intIPRede)}/{self.intCIDR}, {self._intQtUsados} em uso, {self.qtLivres} livres)'
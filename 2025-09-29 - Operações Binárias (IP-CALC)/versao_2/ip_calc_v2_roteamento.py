@@ -0,0 +1,214 @@
+'''
+   Tabela de Roteamento IPv4 com Busca pelo Prefixo Mais Longo
+
+   Esta tabela usa a mesma aritmética de máscara do script ip_calc_v2.py
+   (intMascara = 0xFFFFFFFF >> (32 - intCIDR) << (32 - intCIDR)) para
+   guardar os prefixos em uma tabela hash (dict) por comprimento de
+   prefixo (0 a 32).
+
+   Uma busca (Longest Prefix Match) testa apenas os comprimentos que
+   possuem prefixos cadastrados, do mais longo para o mais curto: no pior
+   caso são 33 consultas a dict, independentemente da quantidade de
+   prefixos na tabela. A busca em lote (buscarLote) faz o mesmo com NumPy,
+   usando busca binária (searchsorted) sobre as chaves ordenadas de cada
+   comprimento.
+
+   Exemplo:
+      tabRotas = TabelaRoteamento()
+      tabRotas.inserir('10.0.0.0', 8, 'eth0')
+      tabRotas.inserir('10.1.0.0', 16, 'eth1')
+      print(tabRotas.buscar('10.1.2.3'))  # -> 'eth1'
+'''
+import numpy as np
+
+from ip_calc_v2_funcoes import *
+from ip_calc_v2_vetorizado import ips2array
+
+# ----------------------------------------------------------------------
+# Máscaras pré-calculadas para cada CIDR (0-32)
+MASCARAS = tuple(cidr2mascara(intCIDR) for intCIDR in range(33))
+
+
+# ----------------------------------------------------------------------
+class TabelaRoteamento:
+   """
+      Tabela de prefixos IPv4 com inserção, remoção e busca pelo prefixo
+      mais longo (Longest Prefix Match).
+   """
+
+   def __init__(self):
+      # Uma tabela hash por comprimento de prefixo: {rede (int): valor}
+      self._lstTabelas = [{} for _ in range(33)]
+      # Comprimentos que possuem prefixos, do mais longo para o mais curto
+      self._lstComprimentos = []
+      # Índices ordenados (NumPy) usados pela busca em lote, por comprimento
+      self._dictIndices = {}
+
+
+   # ----------------------------------------------------------------------
+   @staticmethod
+   def _normalizar(rede, cidr: int) -> int:
+      """
+         Valida o CIDR e retorna o endereço de rede (IP & máscara) como inteiro.
+      """
+      validarCIDR(cidr)
+      intIP = ip2int(rede) if isinstance(rede, str) else rede
+      return intIP & MASCARAS[cidr]
+
+
+   # ----------------------------------------------------------------------
+   def _atualizarComprimentos(self, cidr: int):
+      self._dictIndices.pop(cidr, None)
+      self._lstComprimentos = [c for c in range(32, -1, -1) if self._lstTabelas[c]]
+
+
+   # ----------------------------------------------------------------------
+   def inserir(self, rede, cidr: int, valor):
+      """
+         Insere (ou substitui) um prefixo na tabela.
+
+         Args:
+            rede (str | int): Endereço da rede. Os bits de host são ignorados.
+            cidr (int): O comprimento do prefixo (0-32).
+            valor: O dado associado ao prefixo (ex: próximo salto, interface).
+      """
+      intRede = self._normalizar(rede, cidr)
+      bolNovoComprimento = not self._lstTabelas[cidr]
+      self._lstTabelas[cidr][intRede] = valor
+      if bolNovoComprimento:
+         self._atualizarComprimentos(cidr)
+      else:
+         self._dictIndices.pop(cidr, None)
+
+
+   # ----------------------------------------------------------------------
+   def remover(self, rede, cidr: int):
+      """
+         Remove um prefixo da tabela.
+
+         Args:
+            rede (str | int): Endereço da rede.
+            cidr (int): O comprimento do prefixo (0-32).
+
+         Returns:
+            O valor que estava associado ao prefixo ou uma Exception
+            (KeyError) se o prefixo não existir.
+      """
+      intRede = self._normalizar(rede, cidr)
+      try:
+         valor = self._lstTabelas[cidr].pop(intRede)
+      except KeyError:
+         raise KeyError(f'ERRO...: O prefixo {int2ip(intRede)}/{cidr} não existe na tabela.')
+      self._atualizarComprimentos(cidr)
+      return valor
+
+
+   # ----------------------------------------------------------------------
+   def buscarPrefixo(self, ip) -> tuple | None:
+      """
+         Busca o prefixo mais longo que contém o endereço informado.
+
+         Args:
+            ip (str | int): O endereço IP a ser buscado.
+
+         Returns:
+            tuple: (rede como inteiro, CIDR, valor) ou None se nenhum
+                   prefixo contiver o endereço.
+      """
+      intIP = ip2int(ip) if isinstance(ip, str) else ip
+      for intCIDR in self._lstComprimentos:
+         intRede = intIP & MASCARAS[intCIDR]
+         dictTabela = self._lstTabelas[intCIDR]
+         if intRede in dictTabela:
+            return intRede, intCIDR, dictTabela[intRede]
+      return None
+
+
+   # ----------------------------------------------------------------------
+   def buscar(self, ip, padrao = None):
+      """
+         Retorna o valor do prefixo mais longo que contém o endereço.
+
+         Args:
+            ip (str | int): O endereço IP a ser buscado.
+            padrao: Valor retornado quando nenhum prefixo contém o endereço.
+      """
+      intIP = ip2int(ip) if isinstance(ip, str) else ip
+      for intCIDR in self._lstComprimentos:
+         valor = self._lstTabelas[intCIDR].get(intIP & MASCARAS[intCIDR], self)
+         if valor is not self: return valor
+      return padrao
+
+
+   # ----------------------------------------------------------------------
+   def _obterIndice(self, cidr: int) -> tuple:
+      """
+         Retorna (chaves ordenadas, valores) do comprimento informado,
+         construindo o índice NumPy apenas quando a tabela mudou.
+      """
+      if cidr not in self._dictIndices:
+         dictTabela = self._lstTabelas[cidr]
+         arrChaves  = np.fromiter(dictTabela.keys(), dtype=np.uint32, count=len(dictTabela))
+         arrValores = np.empty(len(dictTabela), dtype=object)
+         arrValores[:] = list(dictTabela.values())
+         arrOrdem = np.argsort(arrChaves, kind='stable')
+         self._dictIndices[cidr] = (arrChaves[arrOrdem], arrValores[arrOrdem])
+      return self._dictIndices[cidr]
+
+
+   # ----------------------------------------------------------------------
+   def buscarLote(self, ips, padrao = None) -> np.ndarray:
+      """
+         Busca, em lote, o prefixo mais longo para cada endereço.
+
+         Args:
+            ips (list[str] | np.ndarray): Os endereços IP ('A.B.C.D' ou uint32).
+            padrao: Valor usado para os endereços sem prefixo correspondente.
+
+         Returns:
+            np.ndarray: Array (object) com o valor encontrado para cada endereço.
+      """
+      arrIPs       = ips2array(ips)
+      arrResultado = np.full(arrIPs.shape, padrao, dtype=object)
+
+      # Os endereços são percorridos em ordem crescente: como aplicar uma
+      # máscara preserva a ordem, as buscas binárias de todos os
+      # comprimentos recebem valores já ordenados (bem mais rápido)
+      arrPendentes    = np.argsort(arrIPs, kind='stable')
+      arrIPsPendentes = arrIPs[arrPendentes]
+
+      for intCIDR in self._lstComprimentos:
+         if not arrPendentes.size: break
+         arrChaves, arrValores = self._obterIndice(intCIDR)
+
+         arrRedes = arrIPsPendentes & np.uint32(MASCARAS[intCIDR])
+         arrPos   = np.searchsorted(arrChaves, arrRedes)
+         arrPos[arrPos == arrChaves.size] = 0
+         arrAchou = arrChaves[arrPos] == arrRedes
+
+         arrResultado[arrPendentes[arrAchou]] = arrValores[arrPos[arrAchou]]
+         arrPendentes    = arrPendentes[~arrAchou]
+         arrIPsPendentes = arrIPsPendentes[~arrAchou]
+
+      return arrResultado
+
+
+   # ----------------------------------------------------------------------
+   def __len__(self) -> int:
+      return sum(len(dictTabela) for dictTabela in self._lstTabelas)
+
+
+   # ----------------------------------------------------------------------
+   def __contains__(self, prefixo: tuple) -> bool:
+      rede, cidr = prefixo
+      return self._normalizar(rede, cidr) in self._lstTabelas[cidr]
+
+
+   # ----------------------------------------------------------------------
+   def __iter__(self):
+      """
+         Percorre os prefixos cadastrados como (rede como inteiro, CIDR, valor).
+      """
+      for intCIDR in range(33):
+         for intRede, valor in self._lstTabelas[intCIDR].items():
+            yield intRede, intCIDR, valor
@@ -0,0 +1,269 @@
+'''
+   Tabela Binária de Prefixos IPv4 (Mapeada em Memória)
+
+   Carregar um CSV grande (ex: milhões de linhas 'prefixo,dados', como
+   uma base GeoIP) exige interpretar cada linha a cada inicialização do
+   programa. Este módulo grava os prefixos uma única vez em um arquivo
+   binário compacto, que depois é aberto com mmap e consultado por busca
+   binária diretamente sobre as páginas do arquivo, sem interpretação
+   nem cópia. Vários processos que abrem o mesmo arquivo compartilham as
+   mesmas páginas de memória (cache do sistema operacional).
+
+   Formato do arquivo (little-endian, colunas alinhadas em 8 bytes):
+      Cabeçalho (32 bytes): assinatura 'IPCTAB01', quantidade de registros
+                            (uint64), tamanho dos dados (uint64), reservado
+      inicios  : uint32[n]   -> rede (ordenado, sem sobreposição)
+      fins     : uint32[n]   -> broadcast
+      cidrs    : uint32[n]   -> CIDR
+      offsets  : uint64[n+1] -> posição dos dados de cada registro
+      dados    : bytes       -> dados (payload) de todos os registros
+
+   Exemplo de conversão (uma única vez):
+      python ip_calc_v2_tabela_binaria.py geoip.csv geoip.ipct
+
+   Exemplo de consulta:
+      converterCSV('geoip.csv', 'geoip.ipct')
+      with TabelaPrefixosMapeada('geoip.ipct') as tabGeo:
+         print(tabGeo.buscar('8.8.8.8'))
+'''
+import argparse, mmap, os, struct, sys
+
+import numpy as np
+
+from ip_calc_v2_funcoes import ip2int
+from ip_calc_v2_vetorizado import ips2array
+from ip_calc_v2_agregacao import redes2faixas
+from ip_calc_v2_fluxo import interpretarLinha, lerLinhas
+
+# ----------------------------------------------------------------------
+ASSINATURA        = b'IPCTAB01'
+FORMATO_CABECALHO = '<8sQQ8x'
+TAM_CABECALHO     = struct.calcsize(FORMATO_CABECALHO)
+
+
+# ----------------------------------------------------------------------
+def _alinhar(posicao: int) -> int:
+   """
+      Arredonda a posição para o próximo múltiplo de 8 bytes.
+   """
+   return (posicao + 7) & ~7
+
+
+# ----------------------------------------------------------------------
+def _posicoesColunas(qt_registros: int) -> tuple:
+   """
+      Calcula a posição (offset) de cada coluna no arquivo.
+
+      Returns:
+         tuple: (inicios, fins, cidrs, offsets, dados).
+   """
+   intPosInicios = TAM_CABECALHO
+   intPosFins    = _alinhar(intPosInicios + 4 * qt_registros)
+   intPosCIDRs   = _alinhar(intPosFins + 4 * qt_registros)
+   intPosOffsets = _alinhar(intPosCIDRs + 4 * qt_registros)
+   intPosDados   = intPosOffsets + 8 * (qt_registros + 1)
+   return intPosInicios, intPosFins, intPosCIDRs, intPosOffsets, intPosDados
+
+
+# ----------------------------------------------------------------------
+def gravarTabelaPrefixos(caminho: str, redes, cidrs, dados: list):
+   """
+      Grava os prefixos e seus dados no formato binário da tabela.
+
+      Args:
+         caminho (str): O arquivo de destino.
+         redes (list[str] | np.ndarray): Endereços das redes ('A.B.C.D' ou uint32).
+         cidrs (int | list[int] | np.ndarray): Os valores CIDR.
+         dados (list[bytes | str]): Os dados de cada prefixo (str é gravado em UTF-8).
+   """
+   arrInicios, arrFins = redes2faixas(redes, cidrs)
+   arrCIDRs = np.broadcast_to(np.asarray(cidrs, dtype=np.uint32), arrInicios.shape)
+   if len(dados) != arrInicios.size:
+      raise ValueError('ERRO...: A quantidade de dados e de redes deve ser a mesma.')
+
+   arrOrdem   = np.argsort(arrInicios, kind='stable')
+   arrInicios = arrInicios[arrOrdem]
+   arrFins    = arrFins[arrOrdem]
+   if np.any(arrInicios[1:] <= arrFins[:-1]):
+      intPos = int(np.flatnonzero(arrInicios[1:] <= arrFins[:-1])[0])
+      raise ValueError(f'ERRO...: Os prefixos {intPos} e {intPos + 1} (após a ordenação) se sobrepõem.')
+
+   lstDados   = [dados[i] if isinstance(dados[i], bytes) else str(dados[i]).encode('utf-8') for i in arrOrdem.tolist()]
+   arrOffsets = np.zeros(len(lstDados) + 1, dtype='<u8')
+   np.cumsum([len(d) for d in lstDados], out=arrOffsets[1:])
+
+   intQtRegistros = arrInicios.size
+   lstPosicoes    = _posicoesColunas(intQtRegistros)
+   with open(caminho, 'wb') as arqTabela:
+      arqTabela.write(struct.pack(FORMATO_CABECALHO, ASSINATURA, intQtRegistros, int(arrOffsets[-1])))
+      for intPos, arrColuna in zip(lstPosicoes, (arrInicios, arrFins, arrCIDRs[arrOrdem])):
+         arqTabela.write(b'\0' * (intPos - arqTabela.tell()))
+         arqTabela.write(arrColuna.astype('<u4').tobytes())
+      arqTabela.write(b'\0' * (lstPosicoes[3] - arqTabela.tell()))
+      arqTabela.write(arrOffsets.tobytes())
+      arqTabela.writelines(lstDados)
+
+
+# ----------------------------------------------------------------------
+def converterCSV(origem: str, destino: str, erros = sys.stderr) -> int:
+   """
+      Converte um CSV com linhas 'prefixo,dados' (ex: '8.8.8.0/24,US,Google')
+      para a tabela binária. Tudo após a primeira vírgula é o dado do prefixo.
+
+      Args:
+         origem (str): O arquivo CSV.
+         destino (str): O arquivo binário a ser gerado.
+         erros (TextIO): Canal onde as linhas inválidas são informadas.
+
+      Returns:
+         int: A quantidade de prefixos gravados.
+   """
+   lstRedes, lstCIDRs, lstDados = [], [], []
+   with open(origem, 'r', encoding='utf-8') as arqCSV:
+      for intNumLinha, strLinha in lerLinhas(arqCSV):
+         strPrefixo, _, strDados = strLinha.partition(',')
+         try:
+            strIP, intCIDR = interpretarLinha(strPrefixo.strip())
+         except Exception as e:
+            if erros is not None: erros.write(f'Linha {intNumLinha}: {strLinha} -> {e}\n')
+         else:
+            lstRedes.append(strIP)
+            lstCIDRs.append(intCIDR)
+            lstDados.append(strDados.encode('utf-8'))
+
+   gravarTabelaPrefixos(destino, lstRedes, lstCIDRs, lstDados)
+   return len(lstRedes)
+
+
+# ----------------------------------------------------------------------
+class TabelaPrefixosMapeada:
+   """
+      Tabela binária de prefixos aberta com mmap (somente leitura). As
+      colunas são arrays NumPy que apontam diretamente para o arquivo.
+   """
+
+   def __init__(self, caminho: str):
+      self.inicios = self.fins = self.cidrs = self.offsets = None
+      self._mmTabela  = None
+      self._arqTabela = open(caminho, 'rb')
+      # Em qualquer erro (cabeçalho curto ou corrompido, arquivo truncado),
+      # o arquivo e o mapeamento já abertos são fechados antes do erro
+      try:
+         if os.fstat(self._arqTabela.fileno()).st_size < TAM_CABECALHO:
+            raise ValueError(f'ERRO...: O arquivo {caminho} não é uma tabela de prefixos válida.')
+         self._mmTabela = mmap.mmap(self._arqTabela.fileno(), 0, access=mmap.ACCESS_READ)
+
+         strAssinatura, intQtRegistros, intTamDados = struct.unpack_from(FORMATO_CABECALHO, self._mmTabela)
+         if strAssinatura != ASSINATURA:
+            raise ValueError(f'ERRO...: O arquivo {caminho} não é uma tabela de prefixos válida.')
+
+         intPosInicios, intPosFins, intPosCIDRs, intPosOffsets, self._intPosDados = _posicoesColunas(intQtRegistros)
+         if len(self._mmTabela) < self._intPosDados + intTamDados:
+            raise ValueError(f'ERRO...: O arquivo {caminho} está incompleto (tabela truncada).')
+         self.inicios = np.frombuffer(self._mmTabela, dtype='<u4', count=intQtRegistros, offset=intPosInicios)
+         self.fins    = np.frombuffer(self._mmTabela, dtype='<u4', count=intQtRegistros, offset=intPosFins)
+         self.cidrs   = np.frombuffer(self._mmTabela, dtype='<u4', count=intQtRegistros, offset=intPosCIDRs)
+         self.offsets = np.frombuffer(self._mmTabela, dtype='<u8', count=intQtRegistros + 1, offset=intPosOffsets)
+      except Exception:
+         self.fechar()
+         raise
+
+
+   # ----------------------------------------------------------------------
+   def indice(self, ip) -> int:
+      """
+         Retorna a posição do prefixo que contém o endereço ou -1.
+
+         Args:
+            ip (str | int): O endereço IP ('A.B.C.D' ou inteiro).
+      """
+      intIP  = ip2int(ip) if isinstance(ip, (str, bytes)) else ip
+      intPos = int(np.searchsorted(self.inicios, intIP, side='right')) - 1
+      return intPos if intPos >= 0 and intIP <= self.fins[intPos] else -1
+
+
+   # ----------------------------------------------------------------------
+   def indicesLote(self, ips) -> np.ndarray:
+      """
+         Retorna, em lote, a posição do prefixo que contém cada endereço
+         (-1 para os endereços sem prefixo).
+
+         Args:
+            ips (list[str] | np.ndarray): Os endereços IP ('A.B.C.D' ou uint32).
+      """
+      arrIPs = ips2array(ips)
+      if not self.inicios.size: return np.full(arrIPs.shape, -1, dtype=np.int64)
+      arrPos = np.searchsorted(self.inicios, arrIPs, side='right').astype(np.int64) - 1
+      arrPos[(arrPos < 0) | (arrIPs > self.fins[arrPos.clip(0)])] = -1
+      return arrPos
+
+
+   # ----------------------------------------------------------------------
+   def dados(self, posicao: int) -> bytes:
+      """
+         Retorna os dados (payload) do registro na posição informada.
+      """
+      return self._mmTabela[self._intPosDados + int(self.offsets[posicao]):self._intPosDados + int(self.offsets[posicao + 1])]
+
+
+   # ----------------------------------------------------------------------
+   def buscar(self, ip, padrao = None) -> bytes:
+      """
+         Retorna os dados do prefixo que contém o endereço (ou o padrão).
+      """
+      intPos = self.indice(ip)
+      return padrao if intPos < 0 else self.dados(intPos)
+
+
+   # ----------------------------------------------------------------------
+   def buscarLote(self, ips, padrao = None) -> list:
+      """
+         Retorna, em lote, os dados do prefixo que contém cada endereço.
+      """
+      return [padrao if p < 0 else self.dados(p) for p in self.indicesLote(ips).tolist()]
+
+
+   # ----------------------------------------------------------------------
+   def fechar(self):
+      """
+         Libera as colunas e fecha o mapeamento e o arquivo.
+
+         Se o chamador ainda guarda arrays obtidos das colunas (ex:
+         arr = tabela.inicios), o mapeamento não pode ser fechado agora:
+         ele é liberado quando esses arrays forem descartados.
+      """
+      self.inicios = self.fins = self.cidrs = self.offsets = None
+      if self._mmTabela is not None:
+         try:
+            self._mmTabela.close()
+         except BufferError:
+            pass
+         self._mmTabela = None
+      self._arqTabela.close()
+
+
+   def __len__(self) -> int:
+      return 0 if self.inicios is None else int(self.inicios.size)
+
+   def __enter__(self) -> 'TabelaPrefixosMapeada':
+      return self
+
+   def __exit__(self, *args):
+      self.fechar()
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Converte um CSV prefixo,dados para a tabela binária de prefixos.')
+   parser.add_argument('origem', help='arquivo CSV de entrada')
+   parser.add_argument('destino', help='arquivo binário de saída')
+   args = parser.parse_args()
+
+   try:
+      intQtPrefixos = converterCSV(args.origem, args.destino)
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'Prefixos gravados: {intQtPrefixos}', file=sys.stderr)
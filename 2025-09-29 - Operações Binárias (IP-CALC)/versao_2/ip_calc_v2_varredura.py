@@ -0,0 +1,155 @@
+'''
+   Varredura de Hosts de uma Sub-rede IPv4 (asyncio)
+
+   A partir da faixa de hosts calculada como no ip_calc_v2.py (do 1º ao
+   último host), tenta uma conexão TCP em uma porta de cada host para
+   descobrir quais estão alcançáveis.
+
+   Tentar um host por vez seria lento (cada host sem resposta custa o
+   tempo limite inteiro). Aqui as conexões são feitas com asyncio: um
+   número fixo de tarefas (a concorrência) pega o próximo host da faixa
+   e tenta a conexão, com um tempo limite por tentativa. Os resultados
+   são entregues (async yield) à medida que ficam prontos, sem esperar o
+   fim da varredura.
+
+   Possíveis estados de cada host:
+      ABERTA       -> a conexão foi aceita (porta aberta);
+      FECHADA      -> o host respondeu recusando a conexão (está ativo);
+      SEM RESPOSTA -> o tempo limite acabou (host inativo ou filtrado);
+      ERRO         -> outro erro de rede (ex: rede inalcançável).
+
+   Exemplo de uso (teste local: o Linux responde em toda a 127.0.0.0/8):
+      python ip_calc_v2_varredura.py 127.0.0.0/16 -p 8080 -c 1000
+'''
+import argparse, asyncio, sys, time
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_enumeracao import faixaHosts
+from ip_calc_v2_fluxo import interpretarLinha
+
+# ----------------------------------------------------------------------
+CONCORRENCIA = 500
+TEMPO_LIMITE = 1.0
+
+ESTADOS_ATIVOS = ('ABERTA', 'FECHADA')
+
+
+# ----------------------------------------------------------------------
+async def testarPorta(ip: str, porta: int, tempo_limite: float = TEMPO_LIMITE) -> tuple:
+   """
+      Tenta uma conexão TCP em ip:porta.
+
+      Args:
+         ip (str): O endereço do host ('A.B.C.D').
+         porta (int): A porta TCP.
+         tempo_limite (float): Tempo máximo da tentativa (segundos).
+
+      Returns:
+         tuple: (ip, estado, tempo da tentativa em milissegundos).
+   """
+   fltInicio = time.perf_counter()
+   try:
+      _, escritor = await asyncio.wait_for(asyncio.open_connection(ip, porta), tempo_limite)
+   except asyncio.TimeoutError:
+      strEstado = 'SEM RESPOSTA'
+   except ConnectionRefusedError:
+      strEstado = 'FECHADA'
+   except OSError:
+      strEstado = 'ERRO'
+   else:
+      strEstado = 'ABERTA'
+      escritor.close()
+      try:
+         await escritor.wait_closed()
+      except OSError:
+         pass
+   return ip, strEstado, (time.perf_counter() - fltInicio) * 1000
+
+
+# ----------------------------------------------------------------------
+async def varrerRede(rede, cidr: int, porta: int, concorrencia: int = CONCORRENCIA,
+                     tempo_limite: float = TEMPO_LIMITE):
+   """
+      Testa a porta em todos os hosts da rede, com no máximo
+      'concorrencia' conexões abertas ao mesmo tempo.
+
+      Args:
+         rede (str | int): Um endereço da rede ('A.B.C.D' ou inteiro).
+         cidr (int): O valor CIDR (0-32).
+         porta (int): A porta TCP.
+         concorrencia (int): Quantidade de tentativas simultâneas.
+         tempo_limite (float): Tempo máximo de cada tentativa (segundos).
+
+      Yields:
+         tuple: (ip, estado, milissegundos), na ordem em que terminam.
+   """
+   if not 0 < porta < 65536:
+      raise ValueError('ERRO...: A porta deve estar entre 1 e 65535.')
+   if concorrencia < 1:
+      raise ValueError('ERRO...: A concorrência deve ser maior que zero.')
+
+   # As tarefas dividem o mesmo iterador: cada host é testado uma vez
+   iterHosts = iter(faixaHosts(rede, cidr))
+   filaResultados = asyncio.Queue(maxsize=concorrencia)
+
+   async def trabalhar():
+      # Ao terminar, cada tarefa avisa com None (ou com o erro inesperado)
+      try:
+         for intHost in iterHosts:
+            await filaResultados.put(await testarPorta(int2ip(intHost), porta, tempo_limite))
+      except Exception as erro:
+         await filaResultados.put(erro)
+      await filaResultados.put(None)
+
+   lstTarefas = [asyncio.create_task(trabalhar()) for _ in range(concorrencia)]
+   try:
+      intAtivas = len(lstTarefas)
+      while intAtivas:
+         tuplaResultado = await filaResultados.get()
+         if tuplaResultado is None:
+            intAtivas -= 1
+         elif isinstance(tuplaResultado, Exception):
+            raise tuplaResultado
+         else:
+            yield tuplaResultado
+   finally:
+      for tarefa in lstTarefas: tarefa.cancel()
+      await asyncio.gather(*lstTarefas, return_exceptions=True)
+
+
+# ----------------------------------------------------------------------
+async def _executar(args) -> tuple:
+   """
+      Executa a varredura da linha de comando, exibindo os hosts ativos
+      (ou todos, com --todos) à medida que são encontrados.
+   """
+   strIP, intCIDR = interpretarLinha(args.rede)
+   dictContagem = {}
+   async for strHost, strEstado, fltMs in varrerRede(strIP, intCIDR, args.porta, args.concorrencia, args.tempo):
+      dictContagem[strEstado] = dictContagem.get(strEstado, 0) + 1
+      if args.todos or strEstado in ESTADOS_ATIVOS:
+         print(f'{strHost:<15} {strEstado:<12} {fltMs:8.1f} ms', flush=True)
+   return dictContagem
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Varredura TCP assíncrona dos hosts de uma sub-rede IPv4.')
+   parser.add_argument('rede', help='rede no formato ip/cidr (ex: 192.168.0.0/24)')
+   parser.add_argument('-p', '--porta', type=int, default=80, help='porta TCP testada (padrão: 80)')
+   parser.add_argument('-c', '--concorrencia', type=int, default=CONCORRENCIA, help='tentativas simultâneas')
+   parser.add_argument('-t', '--tempo', type=float, default=TEMPO_LIMITE, help='tempo limite por tentativa (s)')
+   parser.add_argument('--todos', action='store_true', help='exibe também os hosts sem resposta')
+   args = parser.parse_args()
+
+   try:
+      fltInicio = time.perf_counter()
+      dictContagem = asyncio.run(_executar(args))
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      strResumo = ' | '.join(f'{e}: {q}' for e, q in sorted(dictContagem.items()))
+      print(f'\nHosts testados: {sum(dictContagem.values())} ({strResumo}) em '
+            f'{time.perf_counter() - fltInicio:.2f} s', file=sys.stderr)
@@ -0,0 +1,231 @@
+'''
+   Cálculo de Faixa de Rede IPv4 em Lote (NumPy)
+
+   Este módulo realiza os mesmos cálculos do script ip_calc_v2.py (rede,
+   primeiro host, broadcast, último host, máscara e quantidade de hosts),
+   porém sobre arrays NumPy de endereços (uint32) e CIDRs, processando
+   milhões de pares (IP, CIDR) em uma única passada, sem laços em Python.
+
+   Exemplo:
+      arrIPs  = ips2array(['192.168.1.10', '10.1.2.3'])
+      dictRes = calcularRedesLote(arrIPs, [24, 8])
+      print(array2ips(dictRes['rede']))
+'''
+import numpy as np
+
+from ip_calc_v2_funcoes import ip2int, CLASSES_OCTETO, INICIOS_ESPECIAIS, FINS_ESPECIAIS, TIPOS_ESPECIAIS
+
+# ----------------------------------------------------------------------
+# Tabelas de classificação no formato NumPy (usadas por classificarIPLote)
+ARR_CLASSES  = np.array(CLASSES_OCTETO, dtype=object)
+ARR_INICIOS  = np.array(INICIOS_ESPECIAIS, dtype=np.uint32)
+ARR_FINS     = np.array(FINS_ESPECIAIS, dtype=np.uint32)
+ARR_TIPOS    = np.array(TIPOS_ESPECIAIS + ['Público'], dtype=object)
+
+
+# ----------------------------------------------------------------------
+def ips2array(ips) -> np.ndarray:
+   """
+      Converte uma sequência de endereços IPv4 ('A.B.C.D') para um array
+      NumPy de inteiros de 32 bits (uint32).
+
+      Args:
+         ips (list[str] | np.ndarray): Os endereços IP a serem convertidos.
+            Se já for um array de inteiros, ele é apenas convertido para uint32.
+
+      Returns:
+         np.ndarray: Array (uint32) com os endereços IP como inteiros.
+   """
+   if isinstance(ips, np.ndarray) and ips.dtype.kind in 'ui':
+      if ips.size and (ips.min() < 0 or ips.max() > 0xFFFFFFFF):
+         raise ValueError('ERRO...: Endereço IPv4 inválido. Valor fora do intervalo de 32 bits')
+      return ips.astype(np.uint32)
+
+   lstIPs = list(ips)
+   if not lstIPs: return np.empty(0, dtype=np.uint32)
+
+   # Cada endereço precisa de exatamente 3 pontos: só o total de octetos
+   # não basta (['1.2.3', '4.5.6.7.8'] também daria 8 octetos)
+   if (np.char.count(np.asarray(lstIPs, dtype=str), '.') != 3).any():
+      raise ValueError('ERRO...: Endereço IPv4 inválido. Não possui 4 octetos')
+
+   # Um único split sobre todos os endereços juntos, em vez de um split por IP
+   lstOctetos = '.'.join(lstIPs).split('.')
+   # Apenas dígitos ASCII, como em ip2int (int() aceitaria ' 1' e '+4')
+   strDigitos = ''.join(lstOctetos)
+   if not (strDigitos.isascii() and strDigitos.isdigit()):
+      raise ValueError('ERRO...: Endereço IPv4 inválido. Octeto não é numérico')
+   try:
+      arrOctetos = np.array(lstOctetos, dtype=np.int64).reshape(-1, 4)
+   except ValueError:
+      raise ValueError('ERRO...: Endereço IPv4 inválido. Octeto não é numérico')
+   if arrOctetos.min() < 0 or arrOctetos.max() > 255:
+      raise ValueError('ERRO...: Endereço IPv4 inválido. Octeto está fora do intervalo válido (0-255)')
+
+   arrOctetos = arrOctetos.astype(np.uint32)
+   return (arrOctetos[:, 0] << 24) | (arrOctetos[:, 1] << 16) | (arrOctetos[:, 2] << 8) | arrOctetos[:, 3]
+
+
+# ----------------------------------------------------------------------
+def array2ips(valores: np.ndarray) -> list:
+   """
+      Converte um array de inteiros de 32 bits para uma lista de endereços
+      IPv4 no formato 'A.B.C.D'.
+
+      Args:
+         valores (np.ndarray): Array com os endereços IP como inteiros.
+
+      Returns:
+         list[str]: Os endereços IP no formato 'A.B.C.D'.
+   """
+   arrOctetos = np.asarray(valores, dtype='>u4').view(np.uint8).reshape(-1, 4).astype(str)
+   return ['.'.join(x) for x in arrOctetos.tolist()]
+
+
+# ----------------------------------------------------------------------
+def calcularMascarasLote(cidrs) -> np.ndarray:
+   """
+      Calcula as máscaras de sub-rede (uint32) para um array de CIDRs.
+
+      Args:
+         cidrs (list[int] | np.ndarray): Os valores CIDR (0-32).
+
+      Returns:
+         np.ndarray: Array (uint32) com as máscaras de sub-rede.
+   """
+   arrCIDR = np.asarray(cidrs, dtype=np.int64)
+   if arrCIDR.size and (arrCIDR.min() < 0 or arrCIDR.max() > 32):
+      raise ValueError('ERRO...: O CIDR deve estar entre 0 e 32.')
+
+   # O deslocamento é feito em 64 bits, pois deslocar um uint32 por 32
+   # posições (CIDR /0) tem resultado indefinido
+   arrMascara = (np.uint64(0xFFFFFFFF) << (32 - arrCIDR).astype(np.uint64)) & np.uint64(0xFFFFFFFF)
+   return arrMascara.astype(np.uint32)
+
+
+# ----------------------------------------------------------------------
+def calcularRedesLote(ips, cidrs) -> dict:
+   """
+      Calcula, em lote, a faixa de rede para cada par (IP, CIDR).
+
+      Args:
+         ips (list[str] | np.ndarray): Os endereços IP ('A.B.C.D' ou uint32).
+         cidrs (int | list[int] | np.ndarray): Os valores CIDR. Um único
+            inteiro é aplicado a todos os endereços.
+
+      Returns:
+         dict: Arrays (colunas) com as chaves 'ip', 'cidr', 'mascara', 'rede',
+               'primeiro_host', 'broadcast', 'ultimo_host' e 'qt_hosts'.
+   """
+   arrIP = ips2array(ips)
+   try:
+      arrCIDR = np.broadcast_to(np.asarray(cidrs, dtype=np.int64), arrIP.shape)
+   except ValueError:
+      raise ValueError('ERRO...: A quantidade de IPs e de CIDRs deve ser a mesma.')
+
+   arrMascara   = calcularMascarasLote(arrCIDR)
+   arrCIDR      = arrCIDR.astype(np.uint8)
+   arrRede      = arrIP & arrMascara
+   arrBroadcast = arrRede | (~arrMascara & np.uint32(0xFFFFFFFF))
+
+   return {
+      'ip'           : arrIP,
+      'cidr'         : arrCIDR,
+      'mascara'      : arrMascara,
+      'rede'         : arrRede,
+      'primeiro_host': arrRede | np.uint32(0x00000001),
+      'broadcast'    : arrBroadcast,
+      'ultimo_host'  : arrBroadcast & np.uint32(0xFFFFFFFE),
+      'qt_hosts'     : (np.int64(1) << (32 - arrCIDR.astype(np.int64))) - 2,
+   }
+
+
+# ----------------------------------------------------------------------
+def classificarIPLote(ips) -> tuple:
+   """
+      Classifica, em lote, os endereços IPv4 (mesmas regras de classificarIP).
+
+      Args:
+         ips (list[str] | np.ndarray): Os endereços IP ('A.B.C.D' ou uint32).
+
+      Returns:
+         tuple: (array com as classes, array com os tipos), ambos do tipo object.
+   """
+   arrIP  = ips2array(ips)
+   arrPos = np.searchsorted(ARR_INICIOS, arrIP, side='right').astype(np.int64) - 1
+
+   # Endereços fora das faixas especiais apontam para o último tipo ('Público')
+   arrDentro = (arrPos >= 0) & (arrIP <= ARR_FINS[arrPos.clip(0)])
+   arrPos[~arrDentro] = ARR_TIPOS.size - 1
+
+   return ARR_CLASSES[arrIP >> 24], ARR_TIPOS[arrPos]
+
+
+# ----------------------------------------------------------------------
+def converterBufferIPs(buffer: bytes) -> tuple:
+   """
+      Valida e converte, de uma só vez, um buffer de bytes com endereços
+      IPv4 separados por quebra de linha (ex: b'10.0.0.1\n192.168.1.10\n')
+      para um array uint32, sem criar uma string por endereço.
+
+      Cada '.' ou '\n' encerra um octeto, cujo valor é montado a partir dos
+      (até) 3 bytes anteriores: unidade + 10 * dezena + 100 * centena.
+
+      Args:
+         buffer (bytes): Os endereços, um por linha ('\r\n' é aceito).
+
+      Returns:
+         tuple: (array uint32 com os endereços, array bool indicando as
+                 linhas válidas). Linhas inválidas recebem o valor 0.
+   """
+   arrBytes = np.frombuffer(buffer, dtype=np.uint8)
+   if b'\r' in buffer: arrBytes = arrBytes[arrBytes != ord('\r')]
+   if not arrBytes.size: return np.empty(0, dtype=np.uint32), np.empty(0, dtype=bool)
+   if arrBytes[-1] != ord('\n'): arrBytes = np.append(arrBytes, np.uint8(ord('\n')))
+
+   arrEhQuebra    = arrBytes == ord('\n')
+   arrEhSeparador = arrEhQuebra | (arrBytes == ord('.'))
+   arrEhDigito    = (arrBytes >= ord('0')) & (arrBytes <= ord('9'))
+
+   # Posição de cada separador (fim de octeto) e das quebras de linha
+   arrPosSeparador = np.flatnonzero(arrEhSeparador)
+   arrPosQuebra    = np.flatnonzero(arrEhQuebra)
+   arrTamanho      = np.diff(arrPosSeparador, prepend=-1) - 1
+
+   # Índice (entre os octetos) do último octeto de cada linha
+   arrOctetoQuebra = np.flatnonzero(arrEhQuebra[arrPosSeparador])
+
+   # Uma linha válida tem exatamente 4 octetos (3 pontos) e apenas dígitos/separadores
+   arrValidos = np.diff(arrOctetoQuebra, prepend=-1) == 4
+   arrValidos[np.searchsorted(arrPosQuebra, np.flatnonzero(~(arrEhDigito | arrEhSeparador)))] = False
+
+   # Valor de cada octeto a partir dos até 3 bytes que antecedem o separador
+   arrValores = np.zeros(arrPosSeparador.size, dtype=np.int32)
+   for intPeso, intDistancia in ((1, 1), (10, 2), (100, 3)):
+      arrDigito   = arrBytes[(arrPosSeparador - intDistancia).clip(0)].astype(np.int32) - ord('0')
+      arrValores += np.where(arrTamanho >= intDistancia, intPeso * arrDigito, 0)
+
+   # Linha de cada octeto: octetos vazios ou acima de 255 invalidam a linha
+   arrFimLinha    = arrEhQuebra[arrPosSeparador]
+   arrLinhaOcteto = np.cumsum(arrFimLinha) - arrFimLinha
+   arrValidos[arrLinhaOcteto[(arrTamanho < 1) | (arrValores > 255)]] = False
+
+   # Os octetos são lidos apenas nas linhas válidas: em uma linha inválida
+   # com menos de 4 octetos, os índices sairiam do início do array
+   arrPrimeiro = arrOctetoQuebra[arrValidos] - 3
+   arrValores  = arrValores.astype(np.uint32)
+   arrIPs = np.zeros(arrValidos.size, dtype=np.uint32)
+   arrIPs[arrValidos] = ((arrValores[arrPrimeiro] << 24) | (arrValores[arrPrimeiro + 1] << 16) |
+                         (arrValores[arrPrimeiro + 2] << 8) | arrValores[arrPrimeiro + 3])
+
+   # Octetos com mais de 3 dígitos (zeros à esquerda, ex: '0010') são raros:
+   # essas linhas são convertidas uma a uma por ip2int
+   arrInicioLinha = np.concatenate(([0], arrPosQuebra[:-1] + 1))
+   for intLinha in np.unique(arrLinhaOcteto[arrTamanho > 3]).tolist():
+      try:
+         arrIPs[intLinha] = ip2int(arrBytes[arrInicioLinha[intLinha]:arrPosQuebra[intLinha]].tobytes())
+         arrValidos[intLinha] = True
+      except ValueError:
+         arrIPs[intLinha], arrValidos[intLinha] = 0, False
+
+   return arrIPs, arrValidos
@@ -0,0 +1,211 @@
+'''
+   Planejador de Sub-redes VLSM (Alocador Buddy)
+
+   A partir de uma rede "pai" (ex: 10.0.0.0/16) e de uma lista com a
+   quantidade de hosts necessária para cada sub-rede, o planejador aloca
+   sub-redes sem sobreposição e com o mínimo de desperdício.
+
+   A estrutura usada é a de um alocador "buddy" (companheiro):
+      - Os blocos livres são guardados em uma lista por CIDR;
+      - Para alocar uma /N, pega-se o menor bloco livre que a comporte e
+        divide-se ao meio (gerando duas metades "companheiras") até
+        chegar ao tamanho /N;
+      - Ao liberar, se o bloco companheiro (endereço XOR tamanho do
+        bloco) também estiver livre, os dois são unidos novamente.
+
+   Exemplo:
+      planVLSM = PlanejadorVLSM('192.168.0.0', 24)
+      print(planVLSM.planejar([100, 50, 20, 2]))
+      # -> [('192.168.0.0', 25), ('192.168.0.128', 26), ('192.168.0.192', 27), ('192.168.0.224', 30)]
+'''
+import heapq
+
+from ip_calc_v2_funcoes import *
+
+
+# ----------------------------------------------------------------------
+def calcularCIDRHosts(qt_hosts: int) -> int:
+   """
+      Calcula o maior CIDR (menor rede) que comporta a quantidade de hosts
+      informada, usando a mesma regra do ip_calc_v2.py: 2 ** (32 - CIDR) - 2.
+
+      Args:
+         qt_hosts (int): A quantidade de hosts válidos necessária.
+
+      Returns:
+         int: O CIDR da menor rede que comporta os hosts.
+   """
+   if not isinstance(qt_hosts, int) or qt_hosts < 1:
+      raise ValueError('ERRO...: A quantidade de hosts deve ser um número inteiro positivo.')
+   intBitsHost = (qt_hosts + 1).bit_length()
+   if intBitsHost > 32:
+      raise ValueError(f'ERRO...: Não existe rede IPv4 com {qt_hosts} hosts válidos.')
+   return 32 - max(intBitsHost, 2)
+
+
+# ----------------------------------------------------------------------
+class PlanejadorVLSM:
+   """
+      Alocador de sub-redes (buddy allocator) sobre uma rede IPv4 pai.
+   """
+
+   def __init__(self, rede, cidr: int):
+      validarCIDR(cidr)
+      intIP = ip2int(rede) if isinstance(rede, str) else rede
+      self.intIPRede = intIP & cidr2mascara(cidr)
+      self.intCIDR   = cidr
+
+      # Blocos livres por CIDR: um set (pertinência) e um heap (menor endereço)
+      self._dictLivres = {c: set() for c in range(cidr, 33)}
+      self._dictHeaps  = {c: [] for c in range(cidr, 33)}
+      # Blocos alocados: {rede (int): CIDR}
+      self._dictAlocados = {}
+
+      self._adicionarLivre(self.intIPRede, cidr)
+
+
+   # ----------------------------------------------------------------------
+   def _adicionarLivre(self, rede: int, cidr: int):
+      self._dictLivres[cidr].add(rede)
+      heapq.heappush(self._dictHeaps[cidr], rede)
+
+
+   # ----------------------------------------------------------------------
+   def _retirarLivre(self, cidr: int) -> int | None:
+      """
+         Retira o bloco livre de menor endereço do CIDR informado. Os
+         registros do heap que já foram unidos/usados são descartados aqui
+         (remoção preguiçosa).
+      """
+      setLivres, lstHeap = self._dictLivres[cidr], self._dictHeaps[cidr]
+      while lstHeap:
+         intRede = heapq.heappop(lstHeap)
+         if intRede in setLivres:
+            setLivres.remove(intRede)
+            return intRede
+      return None
+
+
+   # ----------------------------------------------------------------------
+   def alocarBloco(self, cidr: int) -> int:
+      """
+         Aloca um bloco /cidr dentro da rede pai.
+
+         Args:
+            cidr (int): O CIDR do bloco (do CIDR da rede pai até 32).
+
+         Returns:
+            int: O endereço de rede do bloco alocado ou uma Exception.
+      """
+      validarCIDR(cidr)
+      if cidr < self.intCIDR:
+         raise ValueError(f'ERRO...: Uma /{cidr} não cabe na rede pai /{self.intCIDR}.')
+
+      # Procura o menor bloco livre (maior CIDR) que comporte o pedido
+      for intCIDRLivre in range(cidr, self.intCIDR - 1, -1):
+         intRede = self._retirarLivre(intCIDRLivre)
+         if intRede is not None: break
+      else:
+         raise ValueError(f'ERRO...: Não há espaço livre para uma /{cidr} na rede pai.')
+
+      # Divide o bloco ao meio até chegar ao tamanho pedido, devolvendo
+      # a metade superior (companheira) de cada divisão para os livres
+      while intCIDRLivre < cidr:
+         intCIDRLivre += 1
+         self._adicionarLivre(intRede | (1 << (32 - intCIDRLivre)), intCIDRLivre)
+
+      self._dictAlocados[intRede] = cidr
+      return intRede
+
+
+   # ----------------------------------------------------------------------
+   def alocar(self, qt_hosts: int) -> tuple:
+      """
+         Aloca a menor sub-rede que comporte a quantidade de hosts.
+
+         Args:
+            qt_hosts (int): A quantidade de hosts válidos necessária.
+
+         Returns:
+            tuple: (endereço da sub-rede 'A.B.C.D', CIDR).
+      """
+      intCIDR = calcularCIDRHosts(qt_hosts)
+      return int2ip(self.alocarBloco(intCIDR)), intCIDR
+
+
+   # ----------------------------------------------------------------------
+   def liberar(self, rede):
+      """
+         Libera uma sub-rede alocada, unindo-a ao seu bloco companheiro
+         sempre que ele também estiver livre.
+
+         Args:
+            rede (str | int): O endereço da sub-rede alocada.
+      """
+      intRede = ip2int(rede) if isinstance(rede, str) else rede
+      try:
+         intCIDR = self._dictAlocados.pop(intRede)
+      except KeyError:
+         raise KeyError(f'ERRO...: A sub-rede {int2ip(intRede)} não está alocada.')
+
+      while intCIDR > self.intCIDR:
+         intCompanheiro = intRede ^ (1 << (32 - intCIDR))
+         if intCompanheiro not in self._dictLivres[intCIDR]: break
+         self._dictLivres[intCIDR].remove(intCompanheiro)
+         intRede &= intCompanheiro
+         intCIDR -= 1
+
+      self._adicionarLivre(intRede, intCIDR)
+
+
+   # ----------------------------------------------------------------------
+   def planejar(self, lista_hosts: list) -> list:
+      """
+         Aloca uma sub-rede para cada quantidade de hosts da lista. As
+         maiores sub-redes são alocadas primeiro (minimiza a fragmentação).
+         Se alguma sub-rede não couber, nada é alocado.
+
+         Args:
+            lista_hosts (list[int]): A quantidade de hosts de cada sub-rede.
+
+         Returns:
+            list[tuple]: (endereço da sub-rede 'A.B.C.D', CIDR) para cada
+                         item, na mesma ordem da lista recebida.
+      """
+      lstCIDRs = [calcularCIDRHosts(q) for q in lista_hosts]
+      lstPlano = [None] * len(lstCIDRs)
+      try:
+         for intPos in sorted(range(len(lstCIDRs)), key=lstCIDRs.__getitem__):
+            lstPlano[intPos] = self.alocarBloco(lstCIDRs[intPos])
+      except ValueError:
+         for intRede in lstPlano:
+            if intRede is not None: self.liberar(intRede)
+         raise
+
+      return [(int2ip(intRede), intCIDR) for intRede, intCIDR in zip(lstPlano, lstCIDRs)]
+
+
+   # ----------------------------------------------------------------------
+   def alocados(self) -> list:
+      """
+         Retorna as sub-redes alocadas como (endereço 'A.B.C.D', CIDR), em
+         ordem de endereço.
+      """
+      return [(int2ip(r), c) for r, c in sorted(self._dictAlocados.items())]
+
+
+   # ----------------------------------------------------------------------
+   def livres(self) -> list:
+      """
+         Retorna os blocos livres como (endereço 'A.B.C.D', CIDR), em ordem
+         de endereço.
+      """
+      return [(int2ip(r), c) for r, c in sorted((r, c) for c, s in self._dictLivres.items() for r in s)]
+
+
+   # ----------------------------------------------------------------------
+   def qtEnderecosLivres(self) -> int:
+      """
+         Retorna a quantidade de endereços ainda livres na rede pai.
+      """
+      return sum(len(s) << (32 - c) for c, s in self._dictLivres.items())
@@ -0,0 +1,99 @@
+'''
+   Testes de regressão do ip_calc_v2_acl.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_acl.py
+'''
+import io, ipaddress, random, unittest
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_acl import MotorACL, lerRegras
+
+
+# ----------------------------------------------------------------------
+def _regraIngenua(lstRegras: list, strOrigem: str, strDestino: str) -> int:
+   """
+      Testa as regras uma a uma e retorna a primeira que casa (ou -1).
+   """
+   objOrigem, objDestino = ipaddress.ip_address(strOrigem), ipaddress.ip_address(strDestino)
+   for intIndice, (_, strPrefOrigem, strPrefDestino) in enumerate(lstRegras):
+      objRedeOrigem  = ipaddress.ip_network('0.0.0.0/0' if strPrefOrigem == 'any' else strPrefOrigem, strict=False)
+      objRedeDestino = ipaddress.ip_network('0.0.0.0/0' if strPrefDestino == 'any' else strPrefDestino, strict=False)
+      if objOrigem in objRedeOrigem and objDestino in objRedeDestino: return intIndice
+   return -1
+
+
+# ----------------------------------------------------------------------
+def _gerarPrefixo(rndGerador: random.Random) -> str:
+   # Endereços em 10.0.0.0/24 para que as regras casem com frequência
+   intCIDR = rndGerador.choice((0, 16, 24, 25, 26, 28, 30, 32))
+   if intCIDR == 0 and rndGerador.random() < 0.5: return 'any'
+   return f'{int2ip(0x0A000000 | rndGerador.getrandbits(8))}/{intCIDR}'
+
+
+# ----------------------------------------------------------------------
+class TesteMotorACL(unittest.TestCase):
+
+   def testPrimeiraRegraVence(self):
+      aclRegras = MotorACL([('negar', '10.66.0.0/16', 'any'),
+                            ('permitir', '10.0.0.0/8', '192.168.1.10'),
+                            ('negar', '10.0.0.0/8', '192.168.1.0/24')])
+      self.assertEqual(aclRegras.avaliar('10.66.1.1', '192.168.1.10'), 'negar')
+      self.assertEqual(aclRegras.regra('10.1.1.1', '192.168.1.10'), 1)
+      self.assertEqual(aclRegras.regra('10.1.1.1', '192.168.1.11'), 2)
+
+   def testPadraoSemRegraQueCase(self):
+      for strPadrao in ('negar', 'permitir'):
+         aclRegras = MotorACL([('permitir', '10.0.0.0/8', 'any')], padrao=strPadrao)
+         with self.subTest(padrao=strPadrao):
+            self.assertEqual(aclRegras.regra('11.0.0.1', '1.1.1.1'), -1)
+            self.assertEqual(aclRegras.avaliar('11.0.0.1', '1.1.1.1'), strPadrao)
+            self.assertEqual(aclRegras.regrasLote(['11.0.0.1'], ['1.1.1.1']).tolist(), [-1])
+            self.assertEqual(aclRegras.avaliarLote(['11.0.0.1', '10.0.0.1'], ['1.1.1.1'] * 2).tolist(),
+                             [strPadrao, 'permitir'])
+
+   def testACLVazia(self):
+      aclRegras = MotorACL()
+      self.assertEqual(aclRegras.avaliar('1.2.3.4', '5.6.7.8'), 'negar')
+      self.assertEqual(aclRegras.avaliarLote(['1.2.3.4'], ['5.6.7.8']).tolist(), ['negar'])
+
+   def testRegraRepetida(self):
+      # A repetição de uma regra nunca é alcançada
+      aclRegras = MotorACL([('permitir', '10.0.0.0/8', 'any'), ('negar', '10.0.0.0/8', 'any')])
+      self.assertEqual(aclRegras.regra('10.0.0.1', '1.1.1.1'), 0)
+      self.assertEqual(aclRegras.regrasLote(['10.0.0.1'], ['1.1.1.1']).tolist(), [0])
+
+   def testAleatorios(self):
+      rndGerador = random.Random(2025)
+      for _ in range(100):
+         lstRegras = [(rndGerador.choice(('permitir', 'negar')), _gerarPrefixo(rndGerador), _gerarPrefixo(rndGerador))
+                      for _ in range(rndGerador.randint(0, 25))]
+         lstOrigens  = [int2ip(0x0A000000 | rndGerador.getrandbits(8)) for _ in range(50)]
+         lstDestinos = [int2ip(0x0A000000 | rndGerador.getrandbits(8)) for _ in range(50)]
+         aclRegras   = MotorACL(lstRegras)
+         lstEsperado = [_regraIngenua(lstRegras, o, d) for o, d in zip(lstOrigens, lstDestinos)]
+         with self.subTest(regras=lstRegras):
+            self.assertEqual([aclRegras.regra(o, d) for o, d in zip(lstOrigens, lstDestinos)], lstEsperado)
+            self.assertEqual(aclRegras.regrasLote(lstOrigens, lstDestinos).tolist(), lstEsperado)
+            self.assertEqual(aclRegras.avaliarLote(lstOrigens, lstDestinos).tolist(),
+                             [aclRegras.padrao if i < 0 else lstRegras[i][0] for i in lstEsperado])
+
+   def testQuantidadeDiferente(self):
+      with self.assertRaises(ValueError):
+         MotorACL([('permitir', 'any', 'any')]).regrasLote(['1.1.1.1'], ['1.1.1.1', '2.2.2.2'])
+
+
+# ----------------------------------------------------------------------
+class TesteLerRegras(unittest.TestCase):
+
+   def testArquivo(self):
+      aclRegras = lerRegras(io.StringIO('# comentário\npermitir 10.0.0.0/8 192.168.1.10/32\n\nnegar, any, any\n'))
+      self.assertEqual(aclRegras.acoes, ['permitir', 'negar'])
+
+   def testFormatoInvalido(self):
+      with self.assertRaises(ValueError):
+         lerRegras(io.StringIO('permitir 10.0.0.0/8\n'))
+
+
+if __name__ == '__main__':
+   unittest.main()
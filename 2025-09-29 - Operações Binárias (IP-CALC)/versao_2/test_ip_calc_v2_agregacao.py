@@ -0,0 +1,64 @@
+'''
+   Testes de regressão do ip_calc_v2_agregacao.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_agregacao.py
+'''
+import ipaddress, random, unittest
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_agregacao import agregarRedes
+
+
+# ----------------------------------------------------------------------
+def _agregarReferencia(lstRedes: list, lstCIDRs: list) -> list:
+   """
+      Agrega as redes com ipaddress.collapse_addresses (referência).
+   """
+   lstObjetos = [ipaddress.ip_network(f'{strRede}/{intCIDR}', strict=False)
+                 for strRede, intCIDR in zip(lstRedes, lstCIDRs)]
+   return [(int(objRede.network_address), objRede.prefixlen)
+           for objRede in ipaddress.collapse_addresses(lstObjetos)]
+
+
+# ----------------------------------------------------------------------
+class TesteAgregarRedes(unittest.TestCase):
+
+   def _conferir(self, lstRedes: list, lstCIDRs: list):
+      arrRedes, arrCIDRs = agregarRedes(lstRedes, lstCIDRs)
+      self.assertEqual(list(zip(arrRedes.tolist(), arrCIDRs.tolist())),
+                       _agregarReferencia(lstRedes, lstCIDRs))
+
+   def testAdjacentes(self):
+      self._conferir(['192.168.0.0', '192.168.1.0', '192.168.2.0', '192.168.3.0'], [24] * 4)
+
+   def testAdjacentesNaoAlinhadas(self):
+      # 10.0.1.0/24 + 10.0.2.0/24 não formam um /23
+      self._conferir(['10.0.1.0', '10.0.2.0'], [24, 24])
+
+   def testAninhadas(self):
+      self._conferir(['10.0.0.0', '10.1.0.0', '10.1.2.0', '10.1.2.3'], [8, 16, 24, 32])
+
+   def testRedeInteira(self):
+      self._conferir(['0.0.0.0', '10.0.0.0', '255.255.255.255'], [0, 8, 32])
+
+   def testBitsDeHost(self):
+      self._conferir(['10.0.0.77', '10.0.1.200'], [24, 24])
+
+   def testVazio(self):
+      arrRedes, arrCIDRs = agregarRedes([], [])
+      self.assertEqual((arrRedes.size, arrCIDRs.size), (0, 0))
+
+   def testAleatorios(self):
+      rndGerador = random.Random(2025)
+      for _ in range(200):
+         intQt    = rndGerador.randint(1, 30)
+         lstCIDRs = [rndGerador.randint(20, 32) for _ in range(intQt)]
+         # Redes próximas (10.0.0.0/20) para gerar adjacências e sobreposições
+         lstRedes = [int2ip(0x0A000000 | rndGerador.getrandbits(12)) for _ in range(intQt)]
+         with self.subTest(redes=lstRedes, cidrs=lstCIDRs):
+            self._conferir(lstRedes, lstCIDRs)
+
+
+if __name__ == '__main__':
+   unittest.main()
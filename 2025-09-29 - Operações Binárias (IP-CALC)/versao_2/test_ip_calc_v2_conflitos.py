@@ -0,0 +1,117 @@
+'''
+   Testes de regressão do ip_calc_v2_conflitos.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_conflitos.py
+'''
+import io, ipaddress, random, unittest
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_conflitos import detectarConflitos, lerInventario
+
+
+# ----------------------------------------------------------------------
+def _conflitosForcaBruta(lstRotulos: list, lstRedes: list, lstCIDRs: list) -> list:
+   """
+      Compara todos os pares com ipaddress (referência O(n²)). Cada
+      conflito vira (tipo, rótulo da rede maior, rótulo da rede menor);
+      nos duplicados a ordem dos rótulos não importa.
+   """
+   lstObjetos = [ipaddress.ip_network(f'{strRede}/{intCIDR}', strict=False)
+                 for strRede, intCIDR in zip(lstRedes, lstCIDRs)]
+   lstConflitos = []
+   for intA, objA in enumerate(lstObjetos):
+      for intB in range(intA + 1, len(lstObjetos)):
+         objB = lstObjetos[intB]
+         if not objA.overlaps(objB): continue
+         if objA == objB:
+            lstConflitos.append(('DUPLICADO', *sorted((lstRotulos[intA], lstRotulos[intB]))))
+         elif objA.prefixlen < objB.prefixlen:
+            lstConflitos.append(('SOBREPOSTO', lstRotulos[intA], lstRotulos[intB]))
+         else:
+            lstConflitos.append(('SOBREPOSTO', lstRotulos[intB], lstRotulos[intA]))
+   return sorted(lstConflitos)
+
+
+# ----------------------------------------------------------------------
+def _normalizar(lstConflitos: list) -> list:
+   lstNormalizados = []
+   for strTipo, strDonoA, _, strDonoB, _ in lstConflitos:
+      if strTipo == 'DUPLICADO': strDonoA, strDonoB = sorted((strDonoA, strDonoB))
+      lstNormalizados.append((strTipo, strDonoA, strDonoB))
+   return sorted(lstNormalizados)
+
+
+# ----------------------------------------------------------------------
+class TesteDetectarConflitos(unittest.TestCase):
+
+   def _conflitos(self, lstRedes: list, lstCIDRs: list) -> list:
+      return list(detectarConflitos([f'r{intPos}' for intPos in range(len(lstRedes))], lstRedes, lstCIDRs))
+
+   def testDuplicado(self):
+      self.assertEqual(self._conflitos(['10.0.0.0', '10.0.0.0'], [24, 24]),
+                       [('DUPLICADO', 'r0', '10.0.0.0/24', 'r1', '10.0.0.0/24')])
+
+   def testDuplicadoComBitsDeHost(self):
+      self.assertEqual(self._conflitos(['10.0.0.7', '10.0.0.200'], [24, 24]),
+                       [('DUPLICADO', 'r0', '10.0.0.0/24', 'r1', '10.0.0.0/24')])
+
+   def testContido(self):
+      # A ordem de entrada não importa: a rede maior é sempre a primeira
+      for lstRedes, lstCIDRs in ((['10.0.0.0', '10.0.5.0'], [16, 24]), (['10.0.5.0', '10.0.0.0'], [24, 16])):
+         with self.subTest(redes=lstRedes):
+            lstConflitos = self._conflitos(lstRedes, lstCIDRs)
+            self.assertEqual([lstConflito[0::2] for lstConflito in lstConflitos],
+                             [('SOBREPOSTO', '10.0.0.0/16', '10.0.5.0/24')])
+
+   def testSobreposicaoEmVariosNiveis(self):
+      # Dois prefixos CIDR nunca se sobrepõem parcialmente: toda sobreposição
+      # é uma rede contida em outra, em quantos níveis houver
+      lstConflitos = self._conflitos(['10.0.0.0', '10.1.0.0', '10.1.1.0', '10.2.0.0'], [8, 16, 24, 16])
+      self.assertEqual(_normalizar(lstConflitos), [('SOBREPOSTO', 'r0', 'r1'), ('SOBREPOSTO', 'r0', 'r2'),
+                                                   ('SOBREPOSTO', 'r0', 'r3'), ('SOBREPOSTO', 'r1', 'r2')])
+
+   def testAdjacentesNaoConflitam(self):
+      # Redes que se encostam (fim + 1 == início) não se sobrepõem
+      for lstRedes, lstCIDRs in ((['10.0.0.0', '10.0.1.0'], [24, 24]),
+                                 (['10.0.0.0', '10.0.0.128', '10.0.1.0'], [25, 25, 24]),
+                                 (['0.0.0.0', '128.0.0.0'], [1, 1]),
+                                 (['10.0.0.255', '10.0.1.0'], [32, 32])):
+         with self.subTest(redes=lstRedes, cidrs=lstCIDRs):
+            self.assertEqual(self._conflitos(lstRedes, lstCIDRs), [])
+
+   def testRedeInteira(self):
+      lstConflitos = self._conflitos(['0.0.0.0', '192.168.0.0', '255.255.255.255'], [0, 16, 32])
+      self.assertEqual(_normalizar(lstConflitos), [('SOBREPOSTO', 'r0', 'r1'), ('SOBREPOSTO', 'r0', 'r2')])
+
+   def testVazio(self):
+      self.assertEqual(self._conflitos([], []), [])
+
+   def testQuantidadeDiferente(self):
+      with self.assertRaises(ValueError):
+         list(detectarConflitos(['a'], ['10.0.0.0', '10.0.1.0'], [24, 24]))
+
+   def testAleatorios(self):
+      rndGerador = random.Random(2025)
+      for _ in range(200):
+         intQt     = rndGerador.randint(1, 25)
+         lstCIDRs  = [rndGerador.randint(20, 32) for _ in range(intQt)]
+         lstRedes  = [int2ip(0x0A000000 | rndGerador.getrandbits(12)) for _ in range(intQt)]
+         lstRotulos = [f'r{intPos}' for intPos in range(intQt)]
+         with self.subTest(redes=lstRedes, cidrs=lstCIDRs):
+            self.assertEqual(_normalizar(detectarConflitos(lstRotulos, lstRedes, lstCIDRs)),
+                             _conflitosForcaBruta(lstRotulos, lstRedes, lstCIDRs))
+
+
+# ----------------------------------------------------------------------
+class TesteLerInventario(unittest.TestCase):
+
+   def testLinhasInvalidas(self):
+      arqErros = io.StringIO()
+      tuplaInventario = lerInventario(io.StringIO('dono,prefixo\nrh, 10.0.0.0/24\n\nti,10.0.0.0/33\nlab,x,10.1.0.0/16\n'), arqErros)
+      self.assertEqual(tuplaInventario, (['rh', 'lab,x'], ['10.0.0.0', '10.1.0.0'], [24, 16]))
+      self.assertEqual(len(arqErros.getvalue().splitlines()), 2)
+
+
+if __name__ == '__main__':
+   unittest.main()
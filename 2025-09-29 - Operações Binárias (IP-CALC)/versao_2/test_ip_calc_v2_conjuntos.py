@@ -0,0 +1,114 @@
+'''
+   Testes de regressão do ip_calc_v2_conjuntos.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_conjuntos.py
+'''
+import random, unittest
+
+import numpy as np
+
+from ip_calc_v2_conjuntos import IPRangeSet, ULTIMO_IP
+
+# ----------------------------------------------------------------------
+# Universo pequeno (0.0.0.0 a 0.0.0.63) usado como referência por conjunto
+TAMANHO_UNIVERSO = 64
+
+
+# ----------------------------------------------------------------------
+def _gerarFaixas(rndGerador: random.Random) -> list:
+   """
+      Gera faixas aleatórias (podendo ser adjacentes, aninhadas ou
+      sobrepostas) dentro do universo pequeno.
+   """
+   lstFaixas = []
+   for _ in range(rndGerador.randint(0, 6)):
+      intInicio = rndGerador.randrange(TAMANHO_UNIVERSO)
+      lstFaixas.append((intInicio, rndGerador.randint(intInicio, min(intInicio + 12, TAMANHO_UNIVERSO - 1))))
+   return lstFaixas
+
+
+# ----------------------------------------------------------------------
+def _criarConjunto(lstFaixas: list) -> IPRangeSet:
+   return IPRangeSet([intInicio for intInicio, _ in lstFaixas], [intFim for _, intFim in lstFaixas])
+
+
+# ----------------------------------------------------------------------
+def _enderecos(lstFaixas: list) -> set:
+   return {intIP for intInicio, intFim in lstFaixas for intIP in range(intInicio, intFim + 1)}
+
+
+# ----------------------------------------------------------------------
+def _faixasDoSet(setEnderecos: set) -> list:
+   """
+      Converte um conjunto de endereços em faixas maximais ordenadas.
+   """
+   lstFaixas = []
+   for intIP in sorted(setEnderecos):
+      if lstFaixas and lstFaixas[-1][1] + 1 == intIP:
+         lstFaixas[-1][1] = intIP
+      else:
+         lstFaixas.append([intIP, intIP])
+   return [tuple(lstFaixa) for lstFaixa in lstFaixas]
+
+
+# ----------------------------------------------------------------------
+class TesteOperacoes(unittest.TestCase):
+
+   def _conferir(self, setResultado: IPRangeSet, setEsperado: set):
+      self.assertEqual(list(setResultado), _faixasDoSet(setEsperado))
+
+   def testAleatorios(self):
+      rndGerador = random.Random(2025)
+      for _ in range(500):
+         lstFaixasA, lstFaixasB = _gerarFaixas(rndGerador), _gerarFaixas(rndGerador)
+         setA, setB = _criarConjunto(lstFaixasA), _criarConjunto(lstFaixasB)
+         setRefA, setRefB = _enderecos(lstFaixasA), _enderecos(lstFaixasB)
+         with self.subTest(a=lstFaixasA, b=lstFaixasB):
+            self._conferir(setA, setRefA)
+            self._conferir(setA | setB, setRefA | setRefB)
+            self._conferir(setA & setB, setRefA & setRefB)
+            self._conferir(setA - setB, setRefA - setRefB)
+            self._conferir(setA ^ setB, setRefA ^ setRefB)
+            self.assertEqual(setA >= setB, setRefA >= setRefB)
+            self.assertEqual(setA.qtEnderecos(), len(setRefA))
+            arrIPs = np.arange(TAMANHO_UNIVERSO, dtype=np.uint32)
+            self.assertEqual(setA.contem(arrIPs).tolist(), [intIP in setRefA for intIP in range(TAMANHO_UNIVERSO)])
+
+   def testAdjacentesSaoUnidas(self):
+      self.assertEqual(list(_criarConjunto([(0, 9), (10, 19)])), [(0, 19)])
+
+   def testAninhadas(self):
+      setExterno = IPRangeSet.deRedes(['10.0.0.0'], [8])
+      setInterno = IPRangeSet.deRedes(['10.1.0.0'], [16])
+      self.assertEqual(setExterno | setInterno, setExterno)
+      self.assertEqual(setExterno & setInterno, setInterno)
+      self.assertEqual((setInterno - setExterno).qtEnderecos(), 0)
+      self.assertEqual((setExterno - setInterno).qtEnderecos(), 2 ** 24 - 2 ** 16)
+
+   def testRedeInteira(self):
+      setTodos = IPRangeSet.deRedes(['0.0.0.0'], [0])
+      setRede  = IPRangeSet.deRedes(['192.168.0.0'], [16])
+      self.assertEqual(list(setTodos), [(0, ULTIMO_IP)])
+      self.assertEqual(setTodos.qtEnderecos(), 2 ** 32)
+      self.assertEqual(list(~setTodos), [])
+      self.assertEqual(~IPRangeSet(), setTodos)
+      self.assertEqual(setTodos & setRede, setRede)
+      self.assertEqual(setTodos - setRede, ~setRede)
+      self.assertEqual(list(setTodos - setRede), [(0, 0xC0A7FFFF), (0xC0A90000, ULTIMO_IP)])
+      self.assertIn('255.255.255.255', setTodos)
+      self.assertTrue(setTodos >= setRede and setRede <= setTodos)
+
+   def testParaCIDRs(self):
+      setRedes = IPRangeSet.deRedes(['192.168.0.0', '192.168.1.0'], [24, 24])
+      arrRedes, arrCIDRs = setRedes.paraCIDRs()
+      self.assertEqual((arrRedes.tolist(), arrCIDRs.tolist()), ([0xC0A80000], [23]))
+
+   def testFaixaInvalida(self):
+      for lstInicios, lstFins in (([5], [4]), ([0], [ULTIMO_IP + 1]), ([0, 1], [2])):
+         with self.subTest(inicios=lstInicios, fins=lstFins), self.assertRaises(ValueError):
+            IPRangeSet(lstInicios, lstFins)
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,72 @@
+'''
+   Testes de regressão do ip_calc_v2_enumeracao.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_enumeracao.py
+'''
+import ipaddress, itertools, unittest
+
+from ip_calc_v2_enumeracao import *
+
+
+# ----------------------------------------------------------------------
+class TesteHosts(unittest.TestCase):
+
+   def testComparaComIpaddress(self):
+      for intCIDR in range(20, 31):
+         objRede = ipaddress.ip_network(f'172.16.0.99/{intCIDR}', strict=False)
+         with self.subTest(cidr=intCIDR):
+            self.assertEqual(list(gerarHosts('172.16.0.99', intCIDR)), [str(objHost) for objHost in objRede.hosts()])
+
+   def testRedes31E32(self):
+      # Como no ip_calc_v2.py, /31 e /32 não possuem hosts válidos
+      for strRede, intCIDR in (('10.0.0.0', 31), ('10.0.0.1', 31), ('10.0.0.4', 32), ('10.0.0.5', 32),
+                               ('0.0.0.0', 32), ('255.255.255.255', 32)):
+         with self.subTest(rede=strRede, cidr=intCIDR):
+            self.assertEqual(len(faixaHosts(strRede, intCIDR)), 0)
+            self.assertEqual(list(gerarHosts(strRede, intCIDR)), [])
+            with self.assertRaisesRegex(IndexError, '^ERRO...'):
+               obterHost(strRede, intCIDR, 0)
+
+   def testRedeInteiraPreguicosa(self):
+      # /0 tem mais de 4 bilhões de hosts: nada pode ser montado na memória
+      self.assertEqual(len(faixaHosts('0.0.0.0', 0)), 2 ** 32 - 2)
+      self.assertEqual(list(itertools.islice(gerarHosts('0.0.0.0', 0), 3)), ['0.0.0.1', '0.0.0.2', '0.0.0.3'])
+      self.assertEqual(obterHost('0.0.0.0', 0, -1), '255.255.255.254')
+      self.assertEqual(obterHost('0.0.0.0', 0, 2 ** 31), '128.0.0.1')
+      self.assertIn(ip2int('8.8.8.8'), faixaHosts('0.0.0.0', 0))
+
+   def testIndiceForaDaRede(self):
+      with self.assertRaises(IndexError):
+         obterHost('192.168.0.0', 30, 2)
+      self.assertEqual(obterHost('192.168.0.0', 30, -2), '192.168.0.1')
+
+
+# ----------------------------------------------------------------------
+class TesteSubRedes(unittest.TestCase):
+
+   def testComparaComIpaddress(self):
+      objRede = ipaddress.ip_network('10.0.0.0/16')
+      for intNovoCIDR in (16, 20, 24, 30, 32):
+         with self.subTest(novo_cidr=intNovoCIDR):
+            lstSubRedes = list(itertools.islice(gerarSubRedes('10.0.0.0', 16, intNovoCIDR), 300))
+            lstEsperado = [(str(o.network_address), intNovoCIDR)
+                           for o in itertools.islice(objRede.subnets(new_prefix=intNovoCIDR), 300)]
+            self.assertEqual(lstSubRedes, lstEsperado)
+            self.assertEqual(len(faixaSubRedes('10.0.0.0', 16, intNovoCIDR)), 1 << (intNovoCIDR - 16))
+
+   def testRedeInteiraPreguicosa(self):
+      self.assertEqual(len(faixaSubRedes('0.0.0.0', 0, 32)), 2 ** 32)
+      self.assertEqual(obterSubRede('0.0.0.0', 0, 32, -1), ('255.255.255.255', 32))
+      self.assertEqual(obterSubRede('10.0.0.0', 8, 24, 1000), ('10.3.232.0', 24))
+      self.assertEqual(next(gerarSubRedes('0.0.0.0', 0, 0)), ('0.0.0.0', 0))
+
+   def testCIDRInvalido(self):
+      with self.assertRaises(ValueError):
+         faixaSubRedes('10.0.0.0', 24, 16)
+      with self.assertRaises(IndexError):
+         obterSubRede('10.0.0.0', 24, 25, 2)
+
+
+if __name__ == '__main__':
+   unittest.main()
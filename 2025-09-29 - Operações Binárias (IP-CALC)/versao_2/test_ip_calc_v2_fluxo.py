@@ -0,0 +1,46 @@
+'''
+   Testes de regressão do ip_calc_v2_fluxo.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_fluxo.py
+'''
+import io, os, subprocess, sys, tempfile, unittest
+
+from ip_calc_v2_fluxo import processarFluxo
+
+
+# ----------------------------------------------------------------------
+class TesteProcessarFluxo(unittest.TestCase):
+
+   def testLoteInvalido(self):
+      # Com lote 0, a entrada era descartada sem nenhum aviso
+      for intLote in (0, -1):
+         with self.subTest(lote=intLote), self.assertRaises(ValueError):
+            processarFluxo(io.StringIO('10.0.0.1/24\n'), io.StringIO(), tamanho_lote=intLote)
+
+   def testLoteUnitario(self):
+      arqSaida, arqErros = io.StringIO(), io.StringIO()
+      tuplaQt = processarFluxo(io.StringIO('10.0.0.1/24\nx\n192.168.0.9/30\n'), arqSaida, 'csv', 1, arqErros)
+      self.assertEqual(tuplaQt, (2, 1))
+      self.assertEqual(len(arqSaida.getvalue().splitlines()), 3)
+
+
+# ----------------------------------------------------------------------
+class TesteLinhaDeComando(unittest.TestCase):
+
+   def testArquivosGravados(self):
+      # Linha que não é UTF-8: informada como inválida, sem interromper
+      with tempfile.TemporaryDirectory() as strDirTemp:
+         strEntrada, strSaida, strErros = (os.path.join(strDirTemp, n) for n in ('entrada.txt', 'saida.csv', 'erros.txt'))
+         with open(strEntrada, 'wb') as arqEntrada:
+            arqEntrada.write(b'10.0.0.1/24\n1.2.\xff.4/8\n192.168.0.9/30\n')
+         procScript = subprocess.run([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ip_calc_v2_fluxo.py'),
+                                      strEntrada, '-o', strSaida, '-e', strErros], capture_output=True, text=True)
+         self.assertEqual(procScript.returncode, 0, procScript.stderr)
+         with open(strSaida, encoding='utf-8') as arqSaida, open(strErros, encoding='utf-8') as arqErros:
+            self.assertEqual(len(arqSaida.read().splitlines()), 3)
+            self.assertTrue(arqErros.read().startswith('Linha 2:'))
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,42 @@
+'''
+   Testes de regressão do ip_calc_v2_funcoes.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_funcoes.py
+'''
+import unittest
+
+from ip_calc_v2_funcoes import classificarIP, ip2int, validarIP
+
+
+# ----------------------------------------------------------------------
+class TesteIp2int(unittest.TestCase):
+
+   def testValidos(self):
+      for strIP, intEsperado in (('0.0.0.0', 0), ('255.255.255.255', 0xFFFFFFFF), ('192.168.1.10', 0xC0A8010A),
+                                 ('010.0.0.1', 0x0A000001), ('0010.0.0.1', 0x0A000001)):
+         with self.subTest(ip=strIP):
+            self.assertEqual(ip2int(strIP), intEsperado)
+            self.assertEqual(ip2int(strIP.encode()), intEsperado)
+
+   def testInvalidos(self):
+      # O caminho rápido (inet_pton) não pode aceitar nada além do formato A.B.C.D
+      for strIP in ('', '1.2.3', '1.2.3.4.5', ' 1.2.3.4', '1.2.3.4 ', '1.2.3.+4', '1.2.3.256', '1..2.3',
+                    '1.2.3.٣', '1.2.3.4\x00', '0x1.2.3.4'):
+         with self.subTest(ip=strIP), self.assertRaises(ValueError):
+            ip2int(strIP)
+
+   def testValidarEClassificar(self):
+      self.assertTrue(validarIP('10.1.2.3'))
+      self.assertEqual(classificarIP('10.1.2.3'), classificarIP(ip2int('10.1.2.3')))
+
+   def testClassificarForaDoIntervalo(self):
+      # Inteiros negativos ou acima de 32 bits eram classificados (ex: -1 como classe 'E')
+      self.assertEqual(classificarIP(0xFFFFFFFF), classificarIP('255.255.255.255'))
+      for intIP in (-1, 0x100000000, 1 << 40):
+         with self.subTest(ip=intIP), self.assertRaisesRegex(ValueError, 'fora do intervalo de 32 bits'):
+            classificarIP(intIP)
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,105 @@
+'''
+   Testes de regressão do ip_calc_v2_ipv6.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_ipv6.py
+'''
+import ipaddress, random, unittest
+
+from ip_calc_v2_ipv6 import *
+
+
+# ----------------------------------------------------------------------
+def _gerarIPv6(rndGerador: random.Random) -> int:
+   """
+      Gera um IPv6 com muitos grupos zerados (sequências de tamanhos
+      variados, inclusive empatadas).
+   """
+   intIP = 0
+   for _ in range(8):
+      intIP = (intIP << 16) | rndGerador.choice((0, 0, 0, 1, rndGerador.getrandbits(16)))
+   return intIP
+
+
+# ----------------------------------------------------------------------
+class TesteConversao(unittest.TestCase):
+
+   def testEspeciais(self):
+      for strIP, strEsperado in (('::', '::'), ('::1', '::1'), ('0:0:0:0:0:0:0:0', '::'), ('1::', '1::'),
+                                 ('2001:0db8:0000:0000:0000:0000:0000:0001', '2001:db8::1'),
+                                 ('ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff', 'ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff')):
+         with self.subTest(ip=strIP):
+            self.assertEqual(ipv62int(strIP), int(ipaddress.IPv6Address(strIP)))
+            self.assertEqual(int2ipv6(ipv62int(strIP)), strEsperado)
+
+   def testIPv4Embutido(self):
+      for strIP in ('::ffff:192.168.1.10', '::192.168.1.10', '64:ff9b::8.8.8.8', '1:2:3:4:5:6:1.2.3.4'):
+         with self.subTest(ip=strIP):
+            self.assertEqual(ipv62int(strIP), int(ipaddress.IPv6Address(strIP)))
+      # IPv4 mapeado é exibido com o IPv4 no final (RFC 5952, seção 5)
+      self.assertEqual(int2ipv6(ipv62int('::ffff:c0a8:10a')), '::ffff:192.168.1.10')
+
+   def testMaiorSequenciaDeZeros(self):
+      for strIP, strEsperado in (('1:0:0:1:0:0:0:1', '1:0:0:1::1'),
+                                 # Empate: a primeira sequência é abreviada
+                                 ('1:0:0:1:0:0:1:1', '1::1:0:0:1:1'),
+                                 ('0:0:1:0:0:1:0:0', '::1:0:0:1:0:0'),
+                                 # Um único grupo zerado não é abreviado
+                                 ('1:0:1:1:1:1:1:1', '1:0:1:1:1:1:1:1')):
+         with self.subTest(ip=strIP):
+            self.assertEqual(int2ipv6(ipv62int(strIP)), strEsperado)
+            self.assertEqual(strEsperado, str(ipaddress.IPv6Address(strIP)))
+
+   def testMaiusculas(self):
+      self.assertEqual(ipv62int('2001:DB8::ABCD'), ipv62int('2001:db8::abcd'))
+      self.assertEqual(int2ipv6(ipv62int('FE80::1')), 'fe80::1')
+
+   def testAleatorios(self):
+      rndGerador = random.Random(2025)
+      for _ in range(5000):
+         intIP = _gerarIPv6(rndGerador)
+         objIP = ipaddress.IPv6Address(intIP)
+         with self.subTest(ip=objIP.exploded):
+            self.assertEqual(ipv62int(objIP.exploded), intIP)
+            self.assertEqual(ipv62int(objIP.compressed.upper()), intIP)
+            self.assertEqual(ipv62int(int2ipv6(intIP)), intIP)
+            if intIP >> 32 != 0xFFFF:
+               self.assertEqual(int2ipv6(intIP), objIP.compressed)
+
+   def testInvalidos(self):
+      for strIP in ('', ':', ':::', '1::2::3', '1:2:3:4:5:6:7', '1:2:3:4:5:6:7:8:9', '1:2:3:4:5:6:7:8::',
+                    '12345::', 'g::1', ':1:2:3:4:5:6:7', '::1.2.3', '::256.0.0.1', '1.2.3.4::', ' ::1'):
+         with self.subTest(ip=strIP):
+            with self.assertRaises(ValueError):
+               ipaddress.IPv6Address(strIP)
+            with self.assertRaises(ValueError):
+               ipv62int(strIP)
+      with self.assertRaises(TypeError):
+         ipv62int(1)
+
+
+# ----------------------------------------------------------------------
+class TesteRede(unittest.TestCase):
+
+   def testComparaComIpaddress(self):
+      rndGerador = random.Random(2025)
+      for _ in range(500):
+         intIP, intCIDR = _gerarIPv6(rndGerador), rndGerador.randint(0, 128)
+         objRede = ipaddress.IPv6Network((intIP, intCIDR), strict=False)
+         dictRede = calcularRedeIPv6(intIP, intCIDR)
+         with self.subTest(ip=intIP, cidr=intCIDR):
+            self.assertEqual(dictRede['rede'], int(objRede.network_address))
+            self.assertEqual(dictRede['ultimo_host'], int(objRede.broadcast_address))
+            self.assertEqual(dictRede['mascara'], int(objRede.netmask))
+            self.assertEqual(dictRede['qt_hosts'], objRede.num_addresses)
+
+   def testClassificar(self):
+      for strIP, strClasse in (('::', 'Não Especificado'), ('::1', 'Loopback'), ('fe80::1', 'Link-Local'),
+                               ('fd00::1', 'Unique Local (ULA)'), ('2001:db8::1', 'Documentação'),
+                               ('2001:4860::8888', 'Unicast Global'), ('ff02::1', 'Multicast')):
+         with self.subTest(ip=strIP):
+            self.assertEqual(classificarIPv6(strIP)[0], strClasse)
+
+
+if __name__ == '__main__':
+   unittest.main()
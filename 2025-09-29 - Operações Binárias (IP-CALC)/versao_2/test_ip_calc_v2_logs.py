@@ -0,0 +1,94 @@
+'''
+   Testes de regressão do ip_calc_v2_logs.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_logs.py
+'''
+import io, random, unittest
+from collections import Counter
+
+from ip_calc_v2_logs import AgregadorSubRedes, ContadorTopK
+
+
+# ----------------------------------------------------------------------
+def _gerarFluxo(rndGerador: random.Random, qt_chaves: int, tamanho: int) -> list:
+   # Distribuição enviesada (poucas chaves muito frequentes)
+   return [int(rndGerador.paretovariate(1.2)) % qt_chaves for _ in range(tamanho)]
+
+
+# ----------------------------------------------------------------------
+class TesteContadorTopK(unittest.TestCase):
+
+   def testExatoQuandoKComportaTodas(self):
+      rndGerador = random.Random(2025)
+      lstFluxo = _gerarFluxo(rndGerador, 50, 5000)
+      cntTopK = ContadorTopK(50)
+      for intChave in lstFluxo: cntTopK.adicionar(intChave)
+      cntReal = Counter(lstFluxo)
+      self.assertEqual({chave: (c, e) for chave, c, e in cntTopK.topo()}, {chave: (c, 0) for chave, c in cntReal.items()})
+      self.assertEqual(cntTopK.total, len(lstFluxo))
+
+   def testLimiteDoErro(self):
+      rndGerador = random.Random(2025)
+      for intK in (5, 20, 100):
+         lstFluxo = _gerarFluxo(rndGerador, 500, 20000)
+         cntTopK, cntReal = ContadorTopK(intK), Counter(lstFluxo)
+         for intChave in lstFluxo: cntTopK.adicionar(intChave)
+         lstTopo = cntTopK.topo()
+         with self.subTest(k=intK):
+            self.assertEqual(len(lstTopo), intK)
+            # A contagem estimada nunca é menor que a real e passa dela no
+            # máximo pelo erro registrado, que é no máximo N/K
+            for intChave, intContagem, intErro in lstTopo:
+               self.assertLessEqual(intContagem - intErro, cntReal[intChave])
+               self.assertLessEqual(cntReal[intChave], intContagem)
+               self.assertLessEqual(intErro, len(lstFluxo) // intK)
+            # Toda chave com mais de N/K ocorrências está no topo
+            setTopo = {intChave for intChave, _, _ in lstTopo}
+            for intChave, intQt in cntReal.items():
+               if intQt > len(lstFluxo) / intK: self.assertIn(intChave, setTopo)
+
+   def testLoteComPesos(self):
+      cntTopK = ContadorTopK(3)
+      cntTopK.adicionarLote(['a', 'b', 'c'], [5, 3, 1])
+      cntTopK.adicionar('d')
+      self.assertEqual(cntTopK.topo(), [('a', 5, 0), ('b', 3, 0), ('d', 2, 1)])
+
+   def testKInvalido(self):
+      with self.assertRaises(ValueError):
+         ContadorTopK(0)
+
+
+# ----------------------------------------------------------------------
+class TesteAgregadorSubRedes(unittest.TestCase):
+
+   def testContagens(self):
+      rndGerador = random.Random(2025)
+      lstLinhas, cntRedes = [], Counter()
+      for intLinha in range(3000):
+         if intLinha % 10 == 0:
+            lstLinhas.append(f'sem endereço na linha {intLinha}')
+            continue
+         strIP = f'10.{rndGerador.randint(0, 3)}.{rndGerador.randint(0, 7)}.{rndGerador.randint(0, 255)}'
+         lstLinhas.append(f'{strIP} - - "GET / HTTP/1.1" 200 1.2.3.4')
+         cntRedes[strIP.rsplit('.', 1)[0] + '.0/24'] += 1
+      agregador = AgregadorSubRedes((24,), k=100)
+      # Blocos pequenos: as linhas são completadas até a quebra de linha
+      agregador.processarArquivo(io.BytesIO('\n'.join(lstLinhas).encode()), 1000)
+      self.assertEqual((agregador.qt_linhas, agregador.qt_sem_ip), (3000, 300))
+      self.assertEqual({strRede: intQt for strRede, intQt, _ in agregador.topo(24)}, dict(cntRedes))
+
+   def testRegexComUmGrupo(self):
+      agregador = AgregadorSubRedes((32,), regex=rb'SRC=(\S+)')
+      agregador.processarBloco(b'IN=eth0 SRC=1.2.3.4 DST=5.6.7.8\nIN=eth0 SRC=x DST=5.6.7.8\n')
+      self.assertEqual(agregador.topo(32), [('1.2.3.4/32', 1, 0)])
+      self.assertEqual(agregador.qt_sem_ip, 1)
+
+   def testRegexSemUmGrupo(self):
+      for bytRegex in (rb'SRC=\S+', rb'(SRC)=(\S+)', rb'(?:SRC)=\S+'):
+         with self.subTest(regex=bytRegex), self.assertRaisesRegex(ValueError, '^ERRO...: A expressão regular'):
+            AgregadorSubRedes(regex=bytRegex)
+
+
+if __name__ == '__main__':
+   unittest.main()
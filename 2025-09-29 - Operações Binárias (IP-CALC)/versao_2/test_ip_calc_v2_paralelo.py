@@ -0,0 +1,112 @@
+'''
+   Testes de regressão do ip_calc_v2_paralelo.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_paralelo.py
+'''
+import io, os, random, tempfile, unittest
+
+from ip_calc_v2_fluxo import processarFluxo
+from ip_calc_v2_paralelo import _juntarParte, dividirArquivo, processarParalelo
+
+
+# ----------------------------------------------------------------------
+def _gerarEntrada(quantidade: int, semente: int = 2025) -> bytes:
+   """
+      Linhas 'ip/cidr' válidas misturadas com linhas inválidas, vazias,
+      comentários e uma linha que não é UTF-8.
+   """
+   rndGerador = random.Random(semente)
+   lstLinhas = []
+   for intLinha in range(quantidade):
+      fltSorteio = rndGerador.random()
+      if fltSorteio < 0.70:
+         strIP = '.'.join(str(rndGerador.randint(0, 255)) for _ in range(4))
+         lstLinhas.append(f'{strIP}/{rndGerador.randint(0, 32)}'.encode())
+      elif fltSorteio < 0.80:
+         lstLinhas.append(b'999.1.1.1/24')
+      elif fltSorteio < 0.88:
+         lstLinhas.append(b'')
+      elif fltSorteio < 0.95:
+         lstLinhas.append(b'# comentario')
+      else:
+         lstLinhas.append(b'10.0.0.1/33')
+   lstLinhas[quantidade // 2] = b'10.0.\xff\xfe.1/24'
+   return b'\n'.join(lstLinhas) + b'\n'
+
+
+# ----------------------------------------------------------------------
+class TesteParalelo(unittest.TestCase):
+
+   def setUp(self):
+      self.dirTemp = tempfile.TemporaryDirectory()
+
+   def tearDown(self):
+      self.dirTemp.cleanup()
+
+   def _gravar(self, conteudo: bytes, nome: str = 'entrada.txt') -> str:
+      strCaminho = os.path.join(self.dirTemp.name, nome)
+      with open(strCaminho, 'wb') as arqEntrada:
+         arqEntrada.write(conteudo)
+      return strCaminho
+
+   def _conferirFaixas(self, conteudo: bytes, qt_partes: int):
+      lstFaixas = dividirArquivo(self._gravar(conteudo), qt_partes)
+      # Faixas contíguas, sem partes vazias, cobrindo o arquivo inteiro
+      self.assertEqual([i for i, _ in lstFaixas[1:]], [f for _, f in lstFaixas[:-1]])
+      self.assertTrue(all(f > i for i, f in lstFaixas))
+      if conteudo:
+         self.assertEqual((lstFaixas[0][0], lstFaixas[-1][1]), (0, len(conteudo)))
+      # Cada parte começa no início de uma linha
+      for intInicio, _ in lstFaixas[1:]:
+         self.assertEqual(conteudo[intInicio - 1:intInicio], b'\n')
+      return lstFaixas
+
+   def testDividirSemQuebraNoFim(self):
+      self._conferirFaixas(b'10.0.0.1/8\n192.168.0.1/24\n172.16.0.1/12', 2)
+
+   def testDividirMaisPartesQueLinhas(self):
+      lstFaixas = self._conferirFaixas(b'1.1.1.1/8\n2.2.2.2/8\n3.3.3.3/8\n', 50)
+      self.assertLessEqual(len(lstFaixas), 3)
+
+   def testDividirLinhaUnica(self):
+      self.assertEqual(self._conferirFaixas(b'1.1.1.1/8', 4), [(0, 9)])
+
+   def testDividirVazio(self):
+      self.assertEqual(self._conferirFaixas(b'', 4), [])
+
+   def testRenumerarErros(self):
+      strPrefixo = os.path.join(self.dirTemp.name, 'parte')
+      self._gravar(b'ip,cidr\n1.1.1.1,8\n', 'parte.saida')
+      self._gravar(b'Linha 1: x -> erro\nLinha 12: Linha 3: y -> erro\n', 'parte.erros')
+      arqSaida, arqErros = io.StringIO(), io.StringIO()
+      _juntarParte(strPrefixo, arqSaida, arqErros, 'csv', False, 100)
+      self.assertEqual(arqSaida.getvalue(), '1.1.1.1,8\n')
+      # Apenas o número no início da linha é corrigido
+      self.assertEqual(arqErros.getvalue(), 'Linha 101: x -> erro\nLinha 112: Linha 3: y -> erro\n')
+
+   def testIgualAoFluxo(self):
+      # A linha que não é UTF-8 interrompia o processamento paralelo
+      strEntrada = self._gravar(_gerarEntrada(3000))
+      for strFormato in ('csv', 'jsonl'):
+         with self.subTest(formato=strFormato):
+            arqSaidaFluxo, arqErrosFluxo = io.StringIO(newline=''), io.StringIO()
+            with open(strEntrada, 'r', encoding='utf-8', errors='replace') as arqEntrada:
+               tuplaFluxo = processarFluxo(arqEntrada, arqSaidaFluxo, strFormato, 97, arqErrosFluxo)
+
+            arqSaida, arqErros = io.StringIO(newline=''), io.StringIO()
+            intQtProcessadas, intQtInvalidas, _ = processarParalelo(strEntrada, arqSaida, strFormato, 97, arqErros,
+                                                                     processos=2, partes=7)
+            self.assertEqual((intQtProcessadas, intQtInvalidas), tuplaFluxo)
+            self.assertEqual(arqSaida.getvalue(), arqSaidaFluxo.getvalue())
+            self.assertEqual(arqErros.getvalue(), arqErrosFluxo.getvalue())
+            self.assertIn('�', arqErros.getvalue())
+
+   def testArquivoVazio(self):
+      arqSaida = io.StringIO()
+      self.assertEqual(processarParalelo(self._gravar(b''), arqSaida, 'csv', erros=None, processos=1)[:2], (0, 0))
+      self.assertEqual(arqSaida.getvalue().count('\n'), 1)
+
+
+if __name__ == '__main__':
+   unittest.main()
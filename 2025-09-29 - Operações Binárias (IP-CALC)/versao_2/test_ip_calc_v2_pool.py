@@ -0,0 +1,90 @@
+'''
+   Testes de regressão do ip_calc_v2_pool.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_pool.py
+'''
+import random, unittest
+
+from ip_calc_v2_funcoes import ip2int
+from ip_calc_v2_pool import PoolEnderecos
+
+
+# ----------------------------------------------------------------------
+class TestePoolEnderecos(unittest.TestCase):
+
+   def testReservaRedeEBroadcast(self):
+      poolDHCP = PoolEnderecos('192.168.0.77', 24)
+      self.assertEqual((poolDHCP.qtUsados, poolDHCP.qtLivres), (2, 254))
+      self.assertIn('192.168.0.0', poolDHCP)
+      self.assertIn('192.168.0.255', poolDHCP)
+      self.assertEqual(poolDHCP.alocar(), '192.168.0.1')
+
+   def testRedes31E32(self):
+      for strRede, intCIDR, lstEsperado in (('10.0.0.0', 31, ['10.0.0.0', '10.0.0.1']), ('10.0.0.9', 32, ['10.0.0.9'])):
+         poolDHCP = PoolEnderecos(strRede, intCIDR)
+         with self.subTest(cidr=intCIDR):
+            self.assertEqual([poolDHCP.alocar() for _ in lstEsperado], lstEsperado)
+            self.assertEqual(poolDHCP.qtLivres, 0)
+
+   def testEsgotamento(self):
+      poolDHCP = PoolEnderecos('10.0.0.0', 29)
+      lstEnderecos = [poolDHCP.alocar() for _ in range(6)]
+      self.assertEqual(lstEnderecos, [f'10.0.0.{intHost}' for intHost in range(1, 7)])
+      with self.assertRaisesRegex(ValueError, '^ERRO...: Não há endereços livres'):
+         poolDHCP.alocar()
+
+   def testLiberarEReutilizar(self):
+      poolDHCP = PoolEnderecos('10.0.0.0', 28)
+      lstEnderecos = [poolDHCP.alocar() for _ in range(14)]
+      poolDHCP.liberar('10.0.0.5')
+      self.assertNotIn('10.0.0.5', poolDHCP)
+      self.assertEqual(poolDHCP.alocar(), '10.0.0.5')
+      self.assertEqual(len(poolDHCP), 16)
+      self.assertEqual(len(set(lstEnderecos)), 14)
+
+   def testLiberarDuasVezes(self):
+      poolDHCP = PoolEnderecos('10.0.0.0', 24)
+      strIP = poolDHCP.alocar()
+      poolDHCP.liberar(strIP)
+      with self.assertRaisesRegex(ValueError, 'não está emprestado'):
+         poolDHCP.liberar(strIP)
+      self.assertEqual(poolDHCP.qtUsados, 2)
+
+   def testReservados(self):
+      poolDHCP = PoolEnderecos('10.0.0.0', 24)
+      poolDHCP.reservar('10.0.0.1')
+      self.assertEqual(poolDHCP.alocar(), '10.0.0.2')
+      for strIP in ('10.0.0.0', '10.0.0.1', '10.0.0.255'):
+         with self.subTest(ip=strIP), self.assertRaisesRegex(ValueError, 'é reservado'):
+            poolDHCP.liberar(strIP)
+      with self.assertRaisesRegex(ValueError, 'já está em uso'):
+         poolDHCP.reservar('10.0.0.2')
+
+   def testForaDaRede(self):
+      poolDHCP = PoolEnderecos('10.0.0.0', 24)
+      for metodo in (poolDHCP.reservar, poolDHCP.liberar, poolDHCP.__contains__):
+         with self.subTest(metodo=metodo.__name__), self.assertRaisesRegex(ValueError, 'não pertence'):
+            metodo('10.0.1.0')
+
+   def testAleatorios(self):
+      # Compara com um conjunto Python: nenhum endereço é emprestado duas vezes
+      rndGerador = random.Random(2025)
+      poolDHCP = PoolEnderecos('172.16.0.0', 22)
+      intRede  = ip2int('172.16.0.0')
+      setEmprestados = set()
+      for _ in range(5000):
+         if setEmprestados and (rndGerador.random() < 0.4 or poolDHCP.qtLivres == 0):
+            intIP = rndGerador.choice(sorted(setEmprestados))
+            poolDHCP.liberar(intIP)
+            setEmprestados.remove(intIP)
+         else:
+            intIP = poolDHCP.alocarInt()
+            self.assertNotIn(intIP, setEmprestados)
+            self.assertTrue(intRede < intIP < intRede + 1023)
+            setEmprestados.add(intIP)
+         self.assertEqual(poolDHCP.qtUsados, len(setEmprestados) + 2)
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,69 @@
+'''
+   Testes de regressão do ip_calc_v2_roteamento.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_roteamento.py
+'''
+import ipaddress, random, unittest
+
+from ip_calc_v2_funcoes import int2ip
+from ip_calc_v2_roteamento import TabelaRoteamento
+
+
+# ----------------------------------------------------------------------
+def _buscarForcaBruta(redes: dict, ip: int, padrao = None):
+   """
+      Prefixo mais longo por busca em todas as redes (ipaddress).
+   """
+   endIP = ipaddress.IPv4Address(ip)
+   lstCandidatas = [r for r in redes if endIP in r]
+   return redes[max(lstCandidatas, key=lambda r: r.prefixlen)] if lstCandidatas else padrao
+
+
+# ----------------------------------------------------------------------
+class TesteTabelaRoteamento(unittest.TestCase):
+
+   def testSobrepostosMaisLongoVence(self):
+      tabRotas = TabelaRoteamento()
+      tabRotas.inserir('0.0.0.0', 0, 'padrao')
+      tabRotas.inserir('10.0.0.0', 8, 'eth0')
+      tabRotas.inserir('10.1.0.0', 16, 'eth1')
+      tabRotas.inserir('10.1.2.0', 24, 'eth2')
+      tabRotas.inserir('10.1.2.3', 32, 'host')
+      lstIPs = ['10.1.2.3', '10.1.2.4', '10.1.3.1', '10.2.0.1', '11.0.0.1']
+      lstEsperado = ['host', 'eth2', 'eth1', 'eth0', 'padrao']
+      self.assertEqual([tabRotas.buscar(ip) for ip in lstIPs], lstEsperado)
+      self.assertEqual(tabRotas.buscarLote(lstIPs).tolist(), lstEsperado)
+
+      tabRotas.remover('10.1.2.3', 32)
+      self.assertEqual(tabRotas.buscar('10.1.2.3'), 'eth2')
+      self.assertEqual(tabRotas.buscarLote(['10.1.2.3']).tolist(), ['eth2'])
+
+   def testSemRotaPadrao(self):
+      tabRotas = TabelaRoteamento()
+      tabRotas.inserir('192.168.0.0', 16, 'lan')
+      self.assertEqual(tabRotas.buscar('8.8.8.8', '-'), '-')
+      self.assertEqual(tabRotas.buscarLote(['8.8.8.8', '192.168.9.9'], '-').tolist(), ['-', 'lan'])
+      self.assertIsNone(tabRotas.buscarPrefixo('8.8.8.8'))
+
+   def testAleatorioContraIpaddress(self):
+      rndGerador = random.Random(2025)
+      for intRodada in range(20):
+         tabRotas, dictRedes = TabelaRoteamento(), {}
+         # Endereços em um espaço pequeno (10.0.0.0/20) para haver muita sobreposição
+         for intRota in range(rndGerador.randint(1, 60)):
+            intCIDR = rndGerador.choice([0, 8, 12, 16, 18, 20, 22, 24, 26, 28, 30, 31, 32])
+            intIP = 0x0A000000 | rndGerador.getrandbits(12)
+            redeIP = ipaddress.IPv4Network((intIP, intCIDR), strict=False)
+            tabRotas.inserir(int2ip(intIP), intCIDR, intRota)
+            dictRedes[redeIP] = intRota
+         lstIPs = [0x0A000000 | rndGerador.getrandbits(13) for _ in range(300)]
+         lstEsperado = [_buscarForcaBruta(dictRedes, ip) for ip in lstIPs]
+         with self.subTest(rodada=intRodada):
+            self.assertEqual([tabRotas.buscar(ip) for ip in lstIPs], lstEsperado)
+            self.assertEqual(tabRotas.buscarLote([int2ip(ip) for ip in lstIPs]).tolist(), lstEsperado)
+            self.assertEqual(len(tabRotas), len(dictRedes))
+
+
+if __name__ == '__main__':
+   unittest.main()
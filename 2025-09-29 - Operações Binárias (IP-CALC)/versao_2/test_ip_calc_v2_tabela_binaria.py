@@ -0,0 +1,51 @@
+'''
+   Testes de regressão do ip_calc_v2_tabela_binaria.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_tabela_binaria.py
+'''
+import os, tempfile, unittest
+
+from ip_calc_v2_tabela_binaria import TabelaPrefixosMapeada, gravarTabelaPrefixos
+
+
+# ----------------------------------------------------------------------
+class TesteTabelaPrefixosMapeada(unittest.TestCase):
+
+   def setUp(self):
+      self.dirTemp = tempfile.TemporaryDirectory()
+      self.strTabela = os.path.join(self.dirTemp.name, 'tabela.ipct')
+      gravarTabelaPrefixos(self.strTabela, ['10.0.0.0', '192.168.0.0'], [8, 16], [b'A', 'B'])
+
+   def tearDown(self):
+      self.dirTemp.cleanup()
+
+   def _gravar(self, conteudo: bytes) -> str:
+      strCaminho = os.path.join(self.dirTemp.name, 'invalida.ipct')
+      with open(strCaminho, 'wb') as arqTabela:
+         arqTabela.write(conteudo)
+      return strCaminho
+
+   def testBusca(self):
+      with TabelaPrefixosMapeada(self.strTabela) as tabPrefixos:
+         self.assertEqual(tabPrefixos.buscar('10.1.2.3'), b'A')
+         self.assertEqual(tabPrefixos.buscarLote(['192.168.9.9', '8.8.8.8'], b'-'), [b'B', b'-'])
+
+   def testFecharComColunaEmUso(self):
+      # Fechar com uma coluna ainda referenciada gerava BufferError
+      tabPrefixos = TabelaPrefixosMapeada(self.strTabela)
+      arrInicios = tabPrefixos.inicios
+      tabPrefixos.fechar()
+      self.assertEqual(arrInicios.size, 2)
+      self.assertIsNone(tabPrefixos.inicios)
+
+   def testCabecalhoInvalido(self):
+      with open(self.strTabela, 'rb') as arqTabela:
+         bytTabela = arqTabela.read()
+      for bytConteudo in (b'', b'IPCTAB', b'XXXXXXXX' + bytTabela[8:], bytTabela[:-1]):
+         with self.subTest(tamanho=len(bytConteudo)), self.assertRaises(ValueError):
+            TabelaPrefixosMapeada(self._gravar(bytConteudo))
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,92 @@
+'''
+   Testes de regressão do ip_calc_v2_varredura.py
+
+   Usa apenas endereços locais (127.0.0.0/8): nenhum pacote sai da máquina.
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_varredura.py
+'''
+import asyncio, socket, unittest
+
+from ip_calc_v2_varredura import testarPorta, varrerRede
+
+
+# ----------------------------------------------------------------------
+def _portaLivre() -> int:
+   """
+      Retorna uma porta local sem nenhum processo escutando.
+   """
+   with socket.socket() as sockTemp:
+      sockTemp.bind(('127.0.0.1', 0))
+      return sockTemp.getsockname()[1]
+
+
+# ----------------------------------------------------------------------
+class TesteTestarPorta(unittest.IsolatedAsyncioTestCase):
+
+   async def asyncSetUp(self):
+      self.servidor = await asyncio.start_server(lambda leitor, escritor: escritor.close(), '127.0.0.1', 0)
+      self.intPorta = self.servidor.sockets[0].getsockname()[1]
+
+   async def asyncTearDown(self):
+      self.servidor.close()
+      await self.servidor.wait_closed()
+
+   async def testAberta(self):
+      self.assertEqual((await testarPorta('127.0.0.1', self.intPorta, 2.0))[:2], ('127.0.0.1', 'ABERTA'))
+
+   async def testFechada(self):
+      self.assertEqual((await testarPorta('127.0.0.1', _portaLivre(), 2.0))[1], 'FECHADA')
+
+   async def testSemResposta(self):
+      # Um socket que escuta mas nunca aceita: com a fila (backlog) cheia,
+      # o kernel descarta os novos SYN e a conexão fica sem resposta
+      with socket.socket() as sockCheio:
+         sockCheio.bind(('127.0.0.1', 0))
+         sockCheio.listen(0)
+         intPorta = sockCheio.getsockname()[1]
+         lstEstados = [(await testarPorta('127.0.0.1', intPorta, 0.2))[1] for _ in range(4)]
+      self.assertIn('SEM RESPOSTA', lstEstados)
+      self.assertEqual(lstEstados[-1], 'SEM RESPOSTA')
+
+
+# ----------------------------------------------------------------------
+class TesteVarrerRede(unittest.IsolatedAsyncioTestCase):
+
+   async def _varrer(self, *args, **kwargs) -> list:
+      return [tuplaResultado async for tuplaResultado in varrerRede(*args, **kwargs)]
+
+   async def testEstados(self):
+      # 127.0.0.0/30 -> hosts 127.0.0.1 (escutando) e 127.0.0.2 (recusa)
+      servidor = await asyncio.start_server(lambda leitor, escritor: escritor.close(), '127.0.0.1', 0)
+      async with servidor:
+         intPorta = servidor.sockets[0].getsockname()[1]
+         lstResultados = await self._varrer('127.0.0.0', 30, intPorta, concorrencia=4, tempo_limite=2.0)
+      self.assertEqual(sorted(r[:2] for r in lstResultados), [('127.0.0.1', 'ABERTA'), ('127.0.0.2', 'FECHADA')])
+
+   async def testCadaHostUmaVez(self):
+      lstResultados = await self._varrer('127.0.1.0', 26, _portaLivre(), concorrencia=7, tempo_limite=2.0)
+      self.assertEqual(sorted(r[0] for r in lstResultados), sorted(f'127.0.1.{h}' for h in range(1, 63)))
+
+   async def testRedeSemHosts(self):
+      self.assertEqual(await self._varrer('127.0.0.1', 32, 80), [])
+
+   async def testParametrosInvalidos(self):
+      for intPorta, intConcorrencia in ((0, 10), (65536, 10), (-1, 10), (80, 0), (80, -5)):
+         with self.subTest(porta=intPorta, concorrencia=intConcorrencia):
+            with self.assertRaisesRegex(ValueError, '^ERRO...'):
+               await self._varrer('127.0.0.0', 30, intPorta, concorrencia=intConcorrencia)
+
+   async def testCancelaAoParar(self):
+      # O consumidor para no primeiro resultado: as tarefas de varredura
+      # ainda pendentes devem ser canceladas ao fechar o gerador
+      setAntes = asyncio.all_tasks()
+      geradorVarredura = varrerRede('127.0.2.0', 24, _portaLivre(), concorrencia=20, tempo_limite=2.0)
+      async for _ in geradorVarredura: break
+      self.assertGreater(len(asyncio.all_tasks() - setAntes), 0)
+      await geradorVarredura.aclose()
+      self.assertEqual(asyncio.all_tasks() - setAntes, set())
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,79 @@
+'''
+   Testes de regressão do ip_calc_v2_vetorizado.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_vetorizado.py
+'''
+import random, unittest
+
+import numpy as np
+
+from ip_calc_v2_funcoes import ip2int
+from ip_calc_v2_vetorizado import converterBufferIPs, ips2array
+
+
+# ----------------------------------------------------------------------
+class TesteIps2array(unittest.TestCase):
+
+   def testValidos(self):
+      lstIPs = ['0.0.0.0', '192.168.1.10', '255.255.255.255']
+      self.assertEqual(ips2array(lstIPs).tolist(), [ip2int(ip) for ip in lstIPs])
+
+   def testOctetosTrocadosEntreEnderecos(self):
+      # O total de octetos é 8, mas nenhum dos dois endereços tem 4
+      with self.assertRaises(ValueError):
+         ips2array(['1.2.3', '4.5.6.7.8'])
+
+   def testOctetosNaoNumericos(self):
+      for strIP in (' 1.2.3.4', '1.2.3.+4', '1..2.3', '1.2.3.²', '1.2.3.-0'):
+         with self.subTest(ip=strIP), self.assertRaises(ValueError):
+            ips2array([strIP])
+
+   def testForaDoIntervalo(self):
+      with self.assertRaises(ValueError):
+         ips2array(['1.2.3.256'])
+
+   def testArrayInteiros(self):
+      self.assertEqual(ips2array(np.array([1, 2], dtype=np.int64)).dtype, np.uint32)
+
+
+# ----------------------------------------------------------------------
+class TesteConverterBufferIPs(unittest.TestCase):
+
+   def _esperado(self, buffer: bytes) -> list:
+      lstLinhas = buffer.replace(b'\r', b'').split(b'\n')
+      if lstLinhas[-1] == b'': lstLinhas.pop()
+      lstEsperado = []
+      for bytLinha in lstLinhas:
+         try:
+            lstEsperado.append((ip2int(bytLinha), True))
+         except ValueError:
+            lstEsperado.append((0, False))
+      return lstEsperado
+
+   def _conferir(self, buffer: bytes):
+      arrIPs, arrValidos = converterBufferIPs(buffer)
+      self.assertEqual(list(zip(arrIPs.tolist(), arrValidos.tolist())), self._esperado(buffer), buffer)
+
+   def testValidos(self):
+      self._conferir(b'10.0.0.1\r\n192.168.1.10\n0010.0.0.1\n255.255.255.255')
+
+   def testBuffersCurtos(self):
+      # Menos de 4 octetos no buffer inteiro causavam IndexError
+      for bytBuffer in (b'\n', b'1.2\n', b'1.2.3\n', b'garbage\n', b'1.2.3', b'.\n', b'\n\n'):
+         with self.subTest(buffer=bytBuffer):
+            self._conferir(bytBuffer)
+
+   def testVazio(self):
+      arrIPs, arrValidos = converterBufferIPs(b'')
+      self.assertEqual((arrIPs.size, arrValidos.size), (0, 0))
+
+   def testAleatorios(self):
+      rndGerador = random.Random(2025)
+      for _ in range(2000):
+         bytBuffer = bytes(rndGerador.choice(b'0123456789..\n\n\r x') for _ in range(rndGerador.randint(0, 40)))
+         self._conferir(bytBuffer)
+
+
+if __name__ == '__main__':
+   unittest.main()
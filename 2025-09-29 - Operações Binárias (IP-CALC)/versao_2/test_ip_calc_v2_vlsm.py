@@ -0,0 +1,97 @@
+'''
+   Testes de regressão do ip_calc_v2_vlsm.py
+
+   Exemplo de uso:
+      python -m unittest test_ip_calc_v2_vlsm.py
+'''
+import ipaddress, random, unittest
+
+from ip_calc_v2_vlsm import PlanejadorVLSM, calcularCIDRHosts
+
+
+# ----------------------------------------------------------------------
+class TesteCalcularCIDRHosts(unittest.TestCase):
+
+   def testLimites(self):
+      for intHosts, intCIDR in ((1, 30), (2, 30), (3, 29), (6, 29), (7, 28), (254, 24), (255, 23), (2 ** 32 - 2, 0)):
+         with self.subTest(hosts=intHosts):
+            self.assertEqual(calcularCIDRHosts(intHosts), intCIDR)
+
+   def testInvalidos(self):
+      for qtHosts in (0, -1, 2 ** 32 - 1, 2.0, '10'):
+         with self.subTest(hosts=qtHosts), self.assertRaises(ValueError):
+            calcularCIDRHosts(qtHosts)
+
+
+# ----------------------------------------------------------------------
+class TestePlanejadorVLSM(unittest.TestCase):
+
+   def testMaioresPrimeiro(self):
+      # O plano volta na ordem recebida, mas a maior sub-rede fica no início
+      planVLSM = PlanejadorVLSM('192.168.0.0', 24)
+      self.assertEqual(planVLSM.planejar([2, 20, 100, 50]),
+                       [('192.168.0.224', 30), ('192.168.0.192', 27), ('192.168.0.0', 25), ('192.168.0.128', 26)])
+      self.assertEqual(planVLSM.alocados(), [('192.168.0.0', 25), ('192.168.0.128', 26),
+                                             ('192.168.0.192', 27), ('192.168.0.224', 30)])
+
+   def testAcimaDaCapacidade(self):
+      planVLSM = PlanejadorVLSM('192.168.0.0', 24)
+      with self.assertRaisesRegex(ValueError, '^ERRO...: Não há espaço livre'):
+         planVLSM.planejar([126, 126, 2])
+      # Nada fica alocado quando o plano não cabe
+      self.assertEqual(planVLSM.alocados(), [])
+      self.assertEqual(planVLSM.livres(), [('192.168.0.0', 24)])
+
+   def testMaiorQueAPai(self):
+      planVLSM = PlanejadorVLSM('192.168.0.0', 24)
+      with self.assertRaisesRegex(ValueError, 'não cabe na rede pai'):
+         planVLSM.alocar(300)
+
+   def testUniaoDosCompanheiros(self):
+      planVLSM = PlanejadorVLSM('10.0.0.0', 24)
+      lstRedes = [planVLSM.alocarBloco(26) for _ in range(4)]
+      self.assertEqual(planVLSM.qtEnderecosLivres(), 0)
+      planVLSM.liberar(lstRedes[0])
+      planVLSM.liberar(lstRedes[3])
+      # 0 e 3 não são companheiros: continuam separados
+      self.assertEqual(planVLSM.livres(), [('10.0.0.0', 26), ('10.0.0.192', 26)])
+      planVLSM.liberar(lstRedes[1])
+      self.assertEqual(planVLSM.livres(), [('10.0.0.0', 25), ('10.0.0.192', 26)])
+      planVLSM.liberar(lstRedes[2])
+      self.assertEqual(planVLSM.livres(), [('10.0.0.0', 24)])
+
+   def testLiberarDuasVezes(self):
+      planVLSM = PlanejadorVLSM('10.0.0.0', 24)
+      strRede, _ = planVLSM.alocar(10)
+      planVLSM.liberar(strRede)
+      with self.assertRaises(KeyError):
+         planVLSM.liberar(strRede)
+
+   def testAleatorios(self):
+      # As sub-redes alocadas nunca se sobrepõem e os endereços livres
+      # mais os alocados sempre somam a rede pai
+      rndGerador = random.Random(2025)
+      planVLSM = PlanejadorVLSM('10.0.0.0', 20)
+      dictAlocados = {}
+      for _ in range(2000):
+         if dictAlocados and rndGerador.random() < 0.4:
+            intRede = rndGerador.choice(sorted(dictAlocados))
+            planVLSM.liberar(intRede)
+            del dictAlocados[intRede]
+         else:
+            intCIDR = rndGerador.randint(22, 32)
+            try:
+               dictAlocados[planVLSM.alocarBloco(intCIDR)] = intCIDR
+            except ValueError:
+               pass
+         lstRedes = sorted(ipaddress.ip_network((intRede, intCIDR)) for intRede, intCIDR in dictAlocados.items())
+         for objAnterior, objProxima in zip(lstRedes, lstRedes[1:]):
+            self.assertFalse(objAnterior.overlaps(objProxima))
+         self.assertEqual(planVLSM.qtEnderecosLivres() + sum(o.num_addresses for o in lstRedes), 2 ** 12)
+      for intRede in list(dictAlocados):
+         planVLSM.liberar(intRede)
+      self.assertEqual(planVLSM.livres(), [('10.0.0.0', 20)])
+
+
+if __name__ == '__main__':
+   unittest.main()
@@ -0,0 +1,288 @@
+'''
+   Análise (Quebra) da Criptografia XOR com Chave Repetida
+
+   A cifra do criptografar_texto.py / criptografar_arquivo.py repete a
+   chave sobre o texto: o byte i é cifrado com chave[i % len(chave)].
+   Isso a torna fraca: todos os bytes de uma mesma "coluna" (mesma
+   posição dentro da chave) foram cifrados com o mesmo byte de chave, ou
+   seja, cada coluna é uma cifra de um único byte.
+
+   A quebra é feita em duas etapas, com NumPy sobre o arquivo inteiro:
+
+      1) Tamanho da chave: para cada tamanho candidato T são calculados
+         - a distância de Hamming normalizada entre o texto e ele mesmo
+           deslocado de T bytes (bits diferentes / bits comparados): se T
+           é múltiplo do tamanho da chave, a chave se cancela no XOR e
+           sobra a distância entre bytes do texto original (menor que a
+           de bytes aleatórios, ~0.5);
+         - o índice de coincidência (IC) médio das colunas, normalizado
+           (1.0 para bytes aleatórios): se T é múltiplo do tamanho da
+           chave, cada coluna tem a distribuição de um texto, bem menos
+           uniforme.
+         O tamanho escolhido é o menor com IC perto do maior encontrado
+         (os múltiplos da chave também têm IC alto).
+
+      2) Chave: as colunas são contadas de uma vez (np.bincount, matriz
+         T x 256) e multiplicadas por uma matriz 256 x 256 de pontuação
+         (log da frequência, em textos em português/inglês, do byte que
+         resulta de cada par byte cifrado / byte de chave). O melhor byte
+         de chave de cada coluna é o de maior pontuação. Se a chave
+         encontrada for uma repetição (ex: 'IFRNIFRN'), fica só 'IFRN'.
+
+   O texto_criptografado.txt do criptografar_texto.py pode ser analisado
+   diretamente quando texto e chave são ASCII (os bytes em UTF-8 são os
+   próprios caracteres).
+
+   Exemplos de uso:
+      python analise_xor.py config.xor
+      python analise_xor.py config.xor -o config.txt -m 64
+      python analise_xor.py config.xor -t 12
+'''
+import argparse, sys, time
+
+import numpy as np
+
+from funcoes_xor import xorBytes
+
+# ----------------------------------------------------------------------
+TAMANHO_MAXIMO_CHAVE = 40
+TAMANHO_AMOSTRA      = 1 << 20
+FATOR_IC             = 0.9
+
+# Frequência (%) das letras em textos em português e inglês (média)
+FREQUENCIAS_LETRAS = {
+   'a': 11.4, 'b': 1.3, 'c': 3.5, 'd': 4.5, 'e': 12.5, 'f': 1.6, 'g': 1.6,
+   'h': 3.7, 'i': 6.7, 'j': 0.3, 'k': 0.4, 'l': 3.3, 'm': 4.3, 'n': 6.0,
+   'o': 9.0, 'p': 2.3, 'q': 0.6, 'r': 6.3, 's': 7.1, 't': 7.2, 'u': 3.8,
+   'v': 1.3, 'w': 1.2, 'x': 0.2, 'y': 1.0, 'z': 0.3,
+}
+PONTUACAO_COMUM = b'.,;:!?-\'"()\n\r\t=/_'
+
+# Total de bits 1 de cada byte (popcount)
+ARR_BITS_BYTE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+# ----------------------------------------------------------------------
+def _montarPesos():
+   """
+      Log da probabilidade de cada byte em um texto: espaço e letras
+      minúsculas são os mais comuns; maiúsculas, dígitos e pontuação
+      aparecem menos; bytes >= 128 (acentos em UTF-8 ou latin-1) são
+      raros e os caracteres de controle praticamente não aparecem.
+   """
+   arrProb = np.full(256, 1e-6)
+   arrProb[0x80:] = 0.02 / 128
+   arrProb[0x21:0x7F] = 0.01 / 94
+   arrProb[list(PONTUACAO_COMUM)] = 0.04 / len(PONTUACAO_COMUM)
+   arrProb[list(b'0123456789')] = 0.01 / 10
+   fltTotal = sum(FREQUENCIAS_LETRAS.values())
+   for strLetra, fltFreq in FREQUENCIAS_LETRAS.items():
+      arrProb[ord(strLetra)] = 0.70 * fltFreq / fltTotal
+      arrProb[ord(strLetra.upper())] = 0.03 * fltFreq / fltTotal
+   arrProb[ord(' ')] = 0.15
+   return np.log(arrProb / arrProb.sum())
+
+
+ARR_PESOS = _montarPesos()
+
+# MATRIZ_PONTUACAO[k, c] = peso do byte c ^ k (byte c decifrado com a chave k)
+MATRIZ_PONTUACAO = ARR_PESOS[np.arange(256)[:, None] ^ np.arange(256)[None, :]]
+
+
+# ----------------------------------------------------------------------
+def _paraArray(dados):
+   """
+      Retorna os dados como array de bytes (sem cópia quando possível).
+   """
+   if isinstance(dados, np.ndarray): return dados.reshape(-1).view(np.uint8)
+   return np.frombuffer(dados, dtype=np.uint8)
+
+
+# ----------------------------------------------------------------------
+def contarColunas(dados, tamanho: int):
+   """
+      Conta os bytes de cada coluna (posição i % tamanho) em uma única
+      chamada de np.bincount.
+
+      Args:
+         dados (bytes | np.ndarray): O texto cifrado.
+         tamanho (int): O tamanho da chave (quantidade de colunas).
+
+      Returns:
+         np.ndarray: Matriz (tamanho x 256) com as contagens.
+   """
+   arrDados = _paraArray(dados)
+   # Cada byte vira o índice coluna * 256 + byte; o resto do arquivo
+   # (menos que uma linha completa) entra com as colunas iniciais
+   intLinhas = arrDados.size // tamanho
+   arrMatriz = arrDados[:intLinhas * tamanho].reshape(intLinhas, tamanho)
+   arrIndices = (arrMatriz + np.arange(tamanho, dtype=np.intp) * 256).ravel()
+   arrResto = arrDados[intLinhas * tamanho:] + np.arange(arrDados.size - intLinhas * tamanho, dtype=np.intp) * 256
+   arrIndices = np.concatenate((arrIndices, arrResto))
+   return np.bincount(arrIndices, minlength=tamanho * 256).reshape(tamanho, 256)
+
+
+# ----------------------------------------------------------------------
+def distanciaHamming(dados, tamanho: int) -> float:
+   """
+      Distância de Hamming normalizada entre os dados e eles mesmos
+      deslocados de 'tamanho' bytes (fração de bits diferentes: ~0.5
+      para bytes aleatórios, menor se 'tamanho' é múltiplo da chave).
+   """
+   arrDados = _paraArray(dados)
+   if arrDados.size <= tamanho: return float('nan')
+   arrXOR = np.bitwise_xor(arrDados[:-tamanho], arrDados[tamanho:])
+   return float(ARR_BITS_BYTE[arrXOR].sum() / (8 * arrXOR.size))
+
+
+# ----------------------------------------------------------------------
+def indiceCoincidencia(dados, tamanho: int) -> float:
+   """
+      Índice de coincidência médio das colunas, normalizado (x 256):
+      ~1.0 para bytes aleatórios, maior se as colunas foram cifradas com
+      um único byte de chave cada (tamanho múltiplo da chave).
+   """
+   arrContagens = contarColunas(dados, tamanho).astype(np.float64)
+   arrTotais = arrContagens.sum(axis=1)
+   arrValidas = arrTotais > 1
+   if not arrValidas.any(): return float('nan')
+   arrIC = (arrContagens * (arrContagens - 1)).sum(axis=1)[arrValidas] / (arrTotais * (arrTotais - 1))[arrValidas]
+   return float(arrIC.mean() * 256)
+
+
+# ----------------------------------------------------------------------
+def estimarTamanhoChave(dados, tamanho_maximo: int = TAMANHO_MAXIMO_CHAVE,
+                        amostra: int = TAMANHO_AMOSTRA) -> list:
+   """
+      Calcula, para cada tamanho de chave de 1 até 'tamanho_maximo', a
+      distância de Hamming e o IC sobre os primeiros 'amostra' bytes.
+
+      Returns:
+         list: Tuplas (tamanho, hamming, ic), do mais provável para o
+               menos provável (maior IC primeiro).
+   """
+   if tamanho_maximo < 1:
+      raise ValueError('\nERRO: O tamanho máximo da chave deve ser maior que zero...\n')
+   arrAmostra = _paraArray(dados)[:amostra]
+   if arrAmostra.size < 2:
+      raise ValueError('\nERRO: O texto cifrado é curto demais para a análise...\n')
+
+   lstCandidatos = []
+   for intTamanho in range(1, min(tamanho_maximo, arrAmostra.size // 2) + 1):
+      lstCandidatos.append((intTamanho, distanciaHamming(arrAmostra, intTamanho),
+                            indiceCoincidencia(arrAmostra, intTamanho)))
+   return sorted(lstCandidatos, key=lambda c: -c[2])
+
+
+# ----------------------------------------------------------------------
+def escolherTamanho(candidatos: list, fator: float = FATOR_IC) -> int:
+   """
+      Escolhe o menor tamanho com IC >= fator * maior IC (os múltiplos do
+      tamanho real têm IC parecido, mas o menor é a chave sem repetição).
+   """
+   fltMaior = max(c[2] for c in candidatos)
+   return min(t for t, _, ic in candidatos if ic >= fator * fltMaior)
+
+
+# ----------------------------------------------------------------------
+def recuperarChave(dados, tamanho: int) -> bytes:
+   """
+      Recupera a chave, coluna por coluna: a pontuação de cada byte de
+      chave candidato é a soma dos pesos dos bytes decifrados, calculada
+      para todas as colunas e todos os 256 candidatos com um único
+      produto de matrizes (contagens T x 256 @ pontuação 256 x 256).
+
+      Args:
+         dados (bytes | np.ndarray): O texto cifrado.
+         tamanho (int): O tamanho da chave.
+
+      Returns:
+         bytes: A chave.
+   """
+   arrContagens = contarColunas(dados, tamanho).astype(np.float64)
+   arrPontuacao = arrContagens @ MATRIZ_PONTUACAO.T
+   return np.argmax(arrPontuacao, axis=1).astype(np.uint8).tobytes()
+
+
+# ----------------------------------------------------------------------
+def reduzirPeriodo(chave: bytes) -> bytes:
+   """
+      Reduz a chave à menor parte que se repete (ex: b'IFRNIFRN' -> b'IFRN'),
+      o que acontece quando o tamanho estimado é múltiplo do real.
+   """
+   for intPeriodo in range(1, len(chave)):
+      if len(chave) % intPeriodo == 0 and chave == chave[:intPeriodo] * (len(chave) // intPeriodo):
+         return chave[:intPeriodo]
+   return chave
+
+
+# ----------------------------------------------------------------------
+def pontuarTexto(dados) -> float:
+   """
+      Pontuação média por byte (log da probabilidade) de um texto: quanto
+      mais perto de zero, mais parecido com texto comum.
+   """
+   arrDados = _paraArray(dados)
+   return float(ARR_PESOS[arrDados].mean()) if arrDados.size else float('nan')
+
+
+# ----------------------------------------------------------------------
+def quebrarXOR(dados, tamanho_maximo: int = TAMANHO_MAXIMO_CHAVE, amostra: int = TAMANHO_AMOSTRA,
+               tamanho: int = None) -> dict:
+   """
+      Estima o tamanho da chave (se não for informado) e recupera a chave.
+
+      Returns:
+         dict: {'chave', 'tamanho', 'candidatos', 'pontuacao'}, onde
+               'pontuacao' é a de pontuarTexto na amostra decifrada.
+   """
+   if tamanho is not None and tamanho < 1:
+      raise ValueError('\nERRO: O tamanho da chave deve ser maior que zero...\n')
+   lstCandidatos = [] if tamanho else estimarTamanhoChave(dados, tamanho_maximo, amostra)
+   bytChave = reduzirPeriodo(recuperarChave(dados, tamanho or escolherTamanho(lstCandidatos)))
+   bytAmostra = xorBytes(_paraArray(dados)[:amostra], bytChave)
+   return {'chave': bytChave, 'tamanho': len(bytChave), 'candidatos': lstCandidatos,
+           'pontuacao': pontuarTexto(bytAmostra)}
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Quebra a criptografia XOR com chave repetida (tamanho e chave).')
+   parser.add_argument('entrada', help='arquivo cifrado')
+   parser.add_argument('-o', '--saida', default=None, help='grava o arquivo decifrado')
+   parser.add_argument('-m', '--maximo', type=int, default=TAMANHO_MAXIMO_CHAVE, help='maior tamanho de chave testado')
+   parser.add_argument('-t', '--tamanho', type=int, default=None, help='tamanho da chave (pula a estimativa)')
+   parser.add_argument('-a', '--amostra', type=int, default=TAMANHO_AMOSTRA, help='bytes usados na estimativa do tamanho')
+   parser.add_argument('-n', '--candidatos', type=int, default=5, help='candidatos de tamanho exibidos')
+   args = parser.parse_args()
+
+   try:
+      fltInicio = time.perf_counter()
+      with open(args.entrada, 'rb') as arqEntrada:
+         bytCifrado = arqEntrada.read()
+      dictResultado = quebrarXOR(bytCifrado, args.maximo, args.amostra, args.tamanho)
+
+      if dictResultado['candidatos']:
+         print(f'{"Tamanho":>7} {"Hamming":>8} {"IC":>7}')
+         for intTamanho, fltHamming, fltIC in dictResultado['candidatos'][:args.candidatos]:
+            print(f'{intTamanho:>7} {fltHamming:>8.4f} {fltIC:>7.3f}')
+         print()
+
+      bytChave = dictResultado['chave']
+      print(f'Tamanho da chave.: {dictResultado["tamanho"]}')
+      print(f'Chave (texto)....: {bytChave.decode("utf-8", errors="replace")!r}')
+      print(f'Chave (hex)......: {bytChave.hex()}')
+      print(f'Pontuação........: {dictResultado["pontuacao"]:.3f}')
+
+      bytDecifrado = xorBytes(bytCifrado, bytChave)
+      if args.saida:
+         with open(args.saida, 'wb') as arqSaida:
+            arqSaida.write(bytDecifrado)
+      else:
+         print(f'\nInício do texto..:\n{bytDecifrado[:300].decode("utf-8", errors="replace")}')
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'\nTempo total: {time.perf_counter() - fltInicio:.2f} s', file=sys.stderr)
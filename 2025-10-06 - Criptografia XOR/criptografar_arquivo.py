@@ -0,0 +1,94 @@
+'''
+   Criptografia XOR de Arquivos (Modo Fluxo)
+
+   Versão para arquivos do criptografar_texto.py: em vez de ler um texto
+   com input() e gravar uma única string, o arquivo é lido em blocos de
+   tamanho fixo, cada bloco é cifrado com a chave na posição correta
+   (a chave continua de onde o bloco anterior parou) e gravado na saída.
+   A memória usada é constante, qualquer que seja o tamanho do arquivo.
+
+   Como a cifra é um XOR, executar de novo com a mesma chave decifra.
+   Use '-' como entrada ou saída para ler da entrada padrão ou gravar na
+   saída padrão (pipelines do shell).
+
+   Com --no-lugar, o próprio arquivo de entrada é sobrescrito: ele é
+   mapeado na memória (mmap) janela por janela e cifrado diretamente nas
+   páginas mapeadas, sem copiar o arquivo (útil para arquivos enormes).
+   Se a saída for o próprio arquivo de entrada (mesmo caminho, link
+   simbólico ou hard link), esse modo é usado automaticamente.
+
+   Com -p N, o arquivo é dividido em faixas cifradas por N processos em
+   paralelo (pread/pwrite nas posições de cada faixa), com o mesmo
+   resultado do modo fluxo.
+
+   Exemplos de uso:
+      python criptografar_arquivo.py backup.tar backup.tar.xor -k 'minha chave'
+      tar c pasta | python criptografar_arquivo.py - - -k 'minha chave' > pasta.tar.xor
+      python criptografar_arquivo.py backup.tar --no-lugar -k 'minha chave'
+      python criptografar_arquivo.py backup.tar backup.tar.xor -k 'minha chave' -p 8
+'''
+import argparse, os, sys, time
+
+from funcoes_xor import TAMANHO_BLOCO_FLUXO, TAMANHO_JANELA_MMAP, mesmoArquivo, xorArquivoNoLugar, xorArquivoParalelo, xorFluxo
+
+
+# ----------------------------------------------------------------------
+def lerChave(args) -> bytes:
+   """
+      Obtém a chave da linha de comando (texto, em UTF-8) ou de um arquivo
+      (bytes, como estão no arquivo).
+   """
+   if args.arquivo_chave:
+      with open(args.arquivo_chave, 'rb') as arqChave:
+         bytChave = arqChave.read()
+   else:
+      bytChave = (args.chave or '').encode('utf-8')
+   if not bytChave:
+      raise ValueError('Informe uma chave não vazia (-k ou -K)')
+   return bytChave
+
+
+# ----------------------------------------------------------------------
+if __name__ == '__main__':
+   parser = argparse.ArgumentParser(description='Criptografa (ou descriptografa) um arquivo com XOR e chave repetida.')
+   parser.add_argument('entrada', help="arquivo de entrada ('-' para stdin)")
+   parser.add_argument('saida', nargs='?', default=None, help="arquivo de saída ('-' para stdout)")
+   parser.add_argument('-k', '--chave', default=None, help='chave de criptografia (texto)')
+   parser.add_argument('-K', '--arquivo-chave', default=None, help='arquivo com a chave (bytes)')
+   parser.add_argument('-b', '--bloco', type=int, default=TAMANHO_BLOCO_FLUXO, help='tamanho do bloco em bytes')
+   parser.add_argument('-i', '--no-lugar', action='store_true', help='sobrescreve a entrada (mmap), sem arquivo de saída')
+   parser.add_argument('-j', '--janela', type=int, default=TAMANHO_JANELA_MMAP, help='tamanho da janela do mmap em bytes')
+   parser.add_argument('-p', '--processos', type=int, default=None, help='cifra com N processos em paralelo')
+   args = parser.parse_args()
+
+   if args.no_lugar and (args.saida is not None or args.entrada == '-'):
+      parser.error('--no-lugar exige um arquivo de entrada e nenhum arquivo de saída')
+   if not args.no_lugar and args.saida is None:
+      parser.error('informe o arquivo de saída (ou use --no-lugar)')
+   if args.bloco < 1:
+      parser.error('o tamanho do bloco (-b) deve ser maior que zero')
+   if args.processos is not None and '-' in (args.entrada, args.saida):
+      parser.error('o modo paralelo (-p) não aceita stdin/stdout')
+
+   try:
+      bytChave = lerChave(args)
+      if args.processos is not None:
+         fltInicio = time.perf_counter()
+         xorArquivoParalelo(args.entrada, args.saida or args.entrada, bytChave, args.processos, args.bloco)
+         intQtBytes = os.path.getsize(args.entrada)
+         fltTotal = max(time.perf_counter() - fltInicio, 1e-9)
+         print(f'Vazão: {intQtBytes / fltTotal / 2 ** 20:,.1f} MB/s', file=sys.stderr)
+      elif args.no_lugar or ('-' not in (args.entrada, args.saida) and mesmoArquivo(args.entrada, args.saida)):
+         # Abrir a saída com 'wb' apagaria a entrada antes da leitura
+         intQtBytes = xorArquivoNoLugar(args.entrada, bytChave, args.janela)
+      else:
+         arqEntrada = sys.stdin.buffer if args.entrada == '-' else open(args.entrada, 'rb')
+         arqSaida   = sys.stdout.buffer if args.saida == '-' else open(args.saida, 'wb')
+         with arqEntrada, arqSaida:
+            intQtBytes = xorFluxo(arqEntrada, arqSaida, bytChave, args.bloco)
+   except KeyboardInterrupt:
+      sys.exit('\nAVISO: Programa interrompido pelo usuário...\n')
+   except Exception as erro:
+      sys.exit(f'\nERRO INESPERADO: {erro}...\n')
+   else:
+      print(f'Bytes processados: {intQtBytes}', file=sys.stderr)
@@ -1,5 +1,7 @@
 # Operações bit a bit (bitwise) com strings em Python
-import os
+import os, sys
+
+from funcoes_xor import criptografarTexto
 
 strFrase = input('\nInforme o texto a ser criptografado: ')
 
@@ -8,16 +10,12 @@ strChave = input('\nInforme a chave de criptografia....: ')[:len(strFrase)].stri
 print(f'Texto p/ criptografar.: {strFrase}')
 print(f'Chave de criptografia.: {strChave}')
 
-intPosicao       = 0
-strCriptografado = ''
-
-for intPosicao in range(len(strFrase)):
-   # Pega o caractere da chave, repetindo-a se for menor que o texto
-   # O operador de módulo (%) garante que o índice sempre esteja dentro dos limites da chave
-   charChave = strChave[intPosicao % len(strChave)]   
-
-   xorResultado     = ord(strFrase[intPosicao]) ^ ord(charChave)
-   strCriptografado += chr(xorResultado)
+# O XOR de cada caractere com a chave (repetida se for menor que o texto)
+# é feito de uma só vez pelo motor em funcoes_xor.py
+try:
+   strCriptografado = criptografarTexto(strFrase, strChave)
+except ValueError as e:
+   sys.exit(f'{e}')
 
 # Escrevendo em um arquivo
 try:
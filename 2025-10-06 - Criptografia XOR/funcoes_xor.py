@@ -0,0 +1,296 @@
+'''
+   Motor de Criptografia XOR com Chave Repetida (Bytes)
+
+   O script criptografar_texto.py faz o XOR caractere por caractere,
+   com ord/chr, e monta o resultado concatenando strings. Aqui a mesma
+   cifra (chave repetida: o byte i usa chave[i % len(chave)]) é aplicada
+   a um buffer inteiro de uma só vez:
+
+      - Com NumPy: a chave é repetida em um bloco de ~64 KB (múltiplo do
+        tamanho da chave) e o buffer é visto como uma matriz de linhas do
+        tamanho do bloco; um único np.bitwise_xor processa tudo;
+      - Sem NumPy: o buffer é processado em pedaços, cada um convertido em
+        um único inteiro grande (int.from_bytes) e combinado com a chave
+        repetida por um único XOR de inteiros.
+
+   O 'deslocamento' indica a posição do primeiro byte do buffer dentro do
+   fluxo completo: assim, um arquivo pode ser cifrado em partes (blocos,
+   janelas de mmap, processos) com o mesmo resultado da cifra inteira.
+
+   Exemplo:
+      bytCifrado = xorBytes(b'Programacao', b'chave')
+      print(xorBytes(bytCifrado, b'chave'))            # -> b'Programacao'
+      print(criptografarTexto('Programação', 'IFRN'))
+'''
+import mmap, os, time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle
+
+try:
+   import numpy as np
+except ImportError:
+   np = None
+
+# ----------------------------------------------------------------------
+TAMANHO_BLOCO_CHAVE = 1 << 16
+TAMANHO_BLOCO_FLUXO = 1 << 20
+TAMANHO_JANELA_MMAP = 1 << 26
+PARTES_POR_PROCESSO = 4
+
+
+# ----------------------------------------------------------------------
+def _girarChave(chave: bytes, deslocamento: int) -> bytes:
+   """
+      Retorna a chave começando no byte usado na posição 'deslocamento'.
+   """
+   if not chave:
+      raise ValueError('\nERRO: A chave não pode ser vazia...\n')
+   intInicio = deslocamento % len(chave)
+   return chave[intInicio:] + chave[:intInicio]
+
+
+# ----------------------------------------------------------------------
+def xorBuffer(dados, chave: bytes, deslocamento: int = 0, saida = None):
+   """
+      Aplica o XOR com a chave repetida sobre 'dados', gravando o
+      resultado em 'saida' (que pode ser o próprio 'dados', para cifrar
+      no lugar, como um bytearray, memoryview ou mmap).
+
+      Args:
+         dados (bytes | bytearray | memoryview | mmap): O buffer de entrada.
+         chave (bytes): A chave.
+         deslocamento (int): Posição do primeiro byte de 'dados' no fluxo completo.
+         saida (bytearray | memoryview | mmap): Buffer gravável do mesmo tamanho
+            (padrão: o próprio 'dados').
+   """
+   if saida is None: saida = dados
+   bytChave = _girarChave(bytes(chave), deslocamento)
+   mvDados, mvSaida = memoryview(dados).cast('B'), memoryview(saida).cast('B')
+   intTamanho = len(mvDados)
+   if len(mvSaida) != intTamanho:
+      raise ValueError('\nERRO: A saída deve ter o mesmo tamanho dos dados...\n')
+
+   # Bloco com a chave repetida (tamanho múltiplo da chave): todo bloco
+   # do buffer começa no mesmo ponto da chave
+   intRepeticoes = max(1, TAMANHO_BLOCO_CHAVE // len(bytChave))
+   bytBloco = bytChave * intRepeticoes
+   intBloco = len(bytBloco)
+   intCheios = intTamanho - intTamanho % intBloco
+
+   if np is not None:
+      arrDados, arrSaida = np.frombuffer(mvDados, dtype=np.uint8), np.frombuffer(mvSaida, dtype=np.uint8)
+      arrBloco = np.frombuffer(bytBloco, dtype=np.uint8)
+      if intCheios:
+         np.bitwise_xor(arrDados[:intCheios].reshape(-1, intBloco), arrBloco,
+                        out=arrSaida[:intCheios].reshape(-1, intBloco))
+      np.bitwise_xor(arrDados[intCheios:], arrBloco[:intTamanho - intCheios], out=arrSaida[intCheios:])
+      return
+
+   intChaveBloco = int.from_bytes(bytBloco, 'little')
+   for intPos in range(0, intTamanho, intBloco):
+      intFim = min(intPos + intBloco, intTamanho)
+      intChave = intChaveBloco if intFim - intPos == intBloco else int.from_bytes(bytBloco[:intFim - intPos], 'little')
+      mvSaida[intPos:intFim] = (int.from_bytes(mvDados[intPos:intFim], 'little') ^ intChave).to_bytes(intFim - intPos, 'little')
+
+
+# ----------------------------------------------------------------------
+def xorBytes(dados, chave: bytes, deslocamento: int = 0) -> bytes:
+   """
+      Cifra (ou decifra) os dados com XOR e chave repetida.
+
+      Args:
+         dados (bytes | bytearray | memoryview): Os dados.
+         chave (bytes): A chave.
+         deslocamento (int): Posição do primeiro byte de 'dados' no fluxo completo.
+
+      Returns:
+         bytes: O resultado (aplicar de novo com a mesma chave desfaz a cifra).
+   """
+   bytResultado = bytearray(len(memoryview(dados).cast('B')))
+   xorBuffer(dados, chave, deslocamento, bytResultado)
+   return bytes(bytResultado)
+
+
+# ----------------------------------------------------------------------
+def xorFluxo(entrada, saida, chave: bytes, tamanho_bloco: int = TAMANHO_BLOCO_FLUXO,
+             deslocamento: int = 0) -> int:
+   """
+      Cifra (ou decifra) um fluxo binário inteiro com memória constante:
+      os blocos são lidos com readinto em um único bytearray reutilizado,
+      cifrados no lugar e gravados na saída.
+
+      Args:
+         entrada (BinaryIO): Arquivo binário de entrada (ou sys.stdin.buffer).
+         saida (BinaryIO): Arquivo binário de saída (ou sys.stdout.buffer).
+         chave (bytes): A chave.
+         tamanho_bloco (int): Tamanho do bloco lido por vez (bytes).
+         deslocamento (int): Posição do primeiro byte da entrada no fluxo completo.
+
+      Returns:
+         int: A quantidade de bytes processados.
+   """
+   if tamanho_bloco < 1:
+      raise ValueError('\nERRO: O tamanho do bloco deve ser maior que zero...\n')
+   bytBuffer = bytearray(tamanho_bloco)
+   mvBuffer  = memoryview(bytBuffer)
+   intPosicao = deslocamento
+   # readinto pode ler menos que o bloco (ex: pipes): a posição na chave
+   # acompanha a quantidade realmente lida
+   while intLidos := entrada.readinto(mvBuffer):
+      mvBloco = mvBuffer[:intLidos]
+      xorBuffer(mvBloco, chave, intPosicao)
+      saida.write(mvBloco)
+      intPosicao += intLidos
+   return intPosicao - deslocamento
+
+
+# ----------------------------------------------------------------------
+def mesmoArquivo(origem: str, destino: str) -> bool:
+   """
+      Verifica se os dois caminhos apontam para o mesmo arquivo (inclusive
+      por link simbólico ou hard link). Abrir o destino com 'wb' nesse
+      caso apagaria a origem antes da leitura.
+   """
+   try:
+      return os.path.samefile(origem, destino)
+   except OSError:
+      return False
+
+
+# ----------------------------------------------------------------------
+def xorArquivoNoLugar(caminho: str, chave: bytes, tamanho_janela: int = TAMANHO_JANELA_MMAP) -> int:
+   """
+      Cifra (ou decifra) um arquivo no próprio arquivo, sem cópia: o
+      arquivo é mapeado na memória (mmap) uma janela por vez e cada
+      janela é cifrada diretamente nas páginas mapeadas.
+
+      Args:
+         caminho (str): O arquivo (será sobrescrito).
+         chave (bytes): A chave.
+         tamanho_janela (int): Tamanho de cada janela mapeada (arredondado
+            para um múltiplo de mmap.ALLOCATIONGRANULARITY).
+
+      Returns:
+         int: A quantidade de bytes processados.
+   """
+   # O início de cada janela (offset do mmap) deve ser múltiplo da
+   # granularidade de alocação do sistema
+   intGranularidade = mmap.ALLOCATIONGRANULARITY
+   intJanela = max(intGranularidade, tamanho_janela - tamanho_janela % intGranularidade)
+
+   with open(caminho, 'r+b') as arqDados:
+      intTamanho = os.fstat(arqDados.fileno()).st_size
+      for intPosicao in range(0, intTamanho, intJanela):
+         intComprimento = min(intJanela, intTamanho - intPosicao)
+         with mmap.mmap(arqDados.fileno(), intComprimento, offset=intPosicao) as mmJanela:
+            xorBuffer(mmJanela, chave, intPosicao)
+            mmJanela.flush()
+   return intTamanho
+
+
+# ----------------------------------------------------------------------
+def _xorFaixa(origem: str, destino: str, chave: bytes, inicio: int, fim: int,
+              tamanho_bloco: int = TAMANHO_BLOCO_FLUXO) -> tuple:
+   """
+      Cifra a faixa [inicio, fim) da origem e grava na mesma posição do
+      destino (executado em cada processo). As leituras e gravações usam
+      pread/pwrite, que informam a posição e não dependem do cursor do
+      arquivo, então vários processos trabalham no mesmo arquivo.
+
+      Returns:
+         tuple: (bytes processados, segundos).
+   """
+   fltInicio = time.perf_counter()
+   bytBuffer = bytearray(tamanho_bloco)
+   mvBuffer  = memoryview(bytBuffer)
+   intOrigem  = os.open(origem, os.O_RDONLY)
+   intDestino = os.open(destino, os.O_WRONLY)
+   try:
+      intPosicao = inicio
+      while intPosicao < fim:
+         intLidos = os.preadv(intOrigem, [mvBuffer[:min(tamanho_bloco, fim - intPosicao)]], intPosicao)
+         if not intLidos:
+            raise EOFError(f'\nERRO: O arquivo {origem} terminou antes do esperado...\n')
+         mvBloco = mvBuffer[:intLidos]
+         # A chave começa em intPosicao % len(chave), como na cifra inteira
+         xorBuffer(mvBloco, chave, intPosicao)
+         intGravados = 0
+         while intGravados < intLidos:
+            intGravados += os.pwrite(intDestino, mvBloco[intGravados:], intPosicao + intGravados)
+         intPosicao += intLidos
+   finally:
+      os.close(intOrigem)
+      os.close(intDestino)
+   return fim - inicio, time.perf_counter() - fltInicio
+
+
+# ----------------------------------------------------------------------
+def xorArquivoParalelo(origem: str, destino: str, chave: bytes, processos: int = None,
+                       tamanho_bloco: int = TAMANHO_BLOCO_FLUXO) -> list:
+   """
+      Cifra (ou decifra) um arquivo com vários processos. O arquivo é
+      dividido em faixas alinhadas ao tamanho do bloco e cada faixa é
+      cifrada por um processo, que grava o resultado na posição correta
+      do destino (já criado com o tamanho final). O resultado é idêntico
+      ao de xorFluxo/xorBytes. O destino pode ser a própria origem.
+
+      Args:
+         origem (str): O arquivo de entrada.
+         destino (str): O arquivo de saída (pode ser a origem ou um link para ela).
+         chave (bytes): A chave.
+         processos (int): Quantidade de processos (padrão: núcleos da máquina).
+         tamanho_bloco (int): Tamanho do bloco lido por vez (bytes).
+
+      Returns:
+         list: Tuplas (início, fim, segundos) de cada faixa processada.
+   """
+   if not chave:
+      raise ValueError('\nERRO: A chave não pode ser vazia...\n')
+   if tamanho_bloco < 1:
+      raise ValueError('\nERRO: O tamanho do bloco deve ser maior que zero...\n')
+   intTamanho = os.path.getsize(origem)
+   # Destino igual à origem (inclusive por link): cifra no lugar, sem o
+   # 'wb', que apagaria a origem antes da leitura
+   if not mesmoArquivo(origem, destino):
+      with open(destino, 'wb') as arqDestino:
+         arqDestino.truncate(intTamanho)
+   if not intTamanho: return []
+
+   # Faixas de tamanho parecido, com os limites em múltiplos do bloco
+   intQtProcessos = processos or os.cpu_count() or 1
+   intQtBlocos = -(-intTamanho // tamanho_bloco)
+   intQtPartes = min(intQtBlocos, intQtProcessos * PARTES_POR_PROCESSO)
+   lstLimites  = [min(intTamanho, intQtBlocos * i // intQtPartes * tamanho_bloco) for i in range(intQtPartes + 1)]
+   lstFaixas   = [(i, f) for i, f in zip(lstLimites, lstLimites[1:]) if f > i]
+
+   with ProcessPoolExecutor(max_workers=intQtProcessos) as executor:
+      lstFuturos = [executor.submit(_xorFaixa, origem, destino, bytes(chave), i, f, tamanho_bloco) for i, f in lstFaixas]
+      return [(i, f, futuro.result()[1]) for (i, f), futuro in zip(lstFaixas, lstFuturos)]
+
+
+# ----------------------------------------------------------------------
+def criptografarTexto(texto: str, chave: str) -> str:
+   """
+      Cifra um texto com a mesma regra do criptografar_texto.py: o código
+      de cada caractere (ord) é combinado com o da chave, repetida.
+
+      Quando todos os caracteres cabem em 1 byte (código até 255), o texto
+      é convertido para bytes (latin-1) e cifrado de uma só vez com
+      xorBytes; caso contrário, o XOR é feito por caractere e o resultado
+      é montado com join (sem concatenar strings).
+
+      Args:
+         texto (str): O texto.
+         chave (str): A chave.
+
+      Returns:
+         str: O texto cifrado (aplicar de novo com a mesma chave desfaz a cifra).
+   """
+   # Texto vazio não usa a chave (o script corta a chave no tamanho do texto)
+   if not texto: return ''
+   if not chave:
+      raise ValueError('\nERRO: A chave não pode ser vazia...\n')
+   try:
+      return xorBytes(texto.encode('latin-1'), chave.encode('latin-1')).decode('latin-1')
+   except UnicodeEncodeError:
+      return ''.join([chr(ord(c) ^ ord(k)) for c, k in zip(texto, cycle(chave))])
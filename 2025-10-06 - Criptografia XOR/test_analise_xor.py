@@ -0,0 +1,63 @@
+'''
+   Testes de regressão do analise_xor.py
+
+   Exemplo de uso:
+      python -m unittest test_analise_xor.py
+'''
+import random, unittest
+
+from analise_xor import quebrarXOR, reduzirPeriodo
+from funcoes_xor import xorBytes
+
+
+# ----------------------------------------------------------------------
+def _gerarTexto(tamanho: int, semente: int = 2025) -> bytes:
+   lstPalavras = ('o servidor de rede usa a porta padrão para conexão com o banco de dados e the quick '
+                  'brown fox jumps over the lazy dog while configuration files store password host').split()
+   rndGerador = random.Random(semente)
+   lstLinhas, intTotal = [], 0
+   while intTotal < tamanho:
+      strLinha = ' '.join(rndGerador.choice(lstPalavras) for _ in range(rndGerador.randint(3, 12)))
+      if rndGerador.random() < 0.3: strLinha = f'chave_{rndGerador.randint(0, 999)} = {strLinha}'
+      lstLinhas.append(strLinha)
+      intTotal += len(strLinha) + 1
+   return '\n'.join(lstLinhas).encode('utf-8')
+
+
+# ----------------------------------------------------------------------
+class TesteQuebrarXOR(unittest.TestCase):
+
+   def testRecuperaChave(self):
+      bytTexto = _gerarTexto(200_000)
+      for bytChave in (b'x', b'IFRN', b'Segredo-Legado#2025', b'uma chave bem mais longa 123'):
+         with self.subTest(chave=bytChave):
+            dictResultado = quebrarXOR(xorBytes(bytTexto, bytChave))
+            self.assertEqual(dictResultado['chave'], bytChave)
+            self.assertEqual(xorBytes(xorBytes(bytTexto, bytChave), dictResultado['chave']), bytTexto)
+
+   def testTextoCurto(self):
+      # Em textos curtos o tamanho estimado pode ser um múltiplo do real
+      self.assertEqual(quebrarXOR(xorBytes(_gerarTexto(300), b'IFRN'))['chave'], b'IFRN')
+
+   def testTamanhoInformado(self):
+      self.assertEqual(quebrarXOR(xorBytes(_gerarTexto(50_000), b'IFRN'), tamanho=8)['chave'], b'IFRN')
+
+   def testTamanhoInvalido(self):
+      # tamanho=0 era tratado como "não informado" e os negativos chegavam a recuperarChave
+      bytCifrado = xorBytes(_gerarTexto(1000), b'IFRN')
+      for intTamanho in (0, -1, -4):
+         with self.subTest(tamanho=intTamanho), self.assertRaisesRegex(ValueError, 'tamanho da chave deve ser maior que zero'):
+            quebrarXOR(bytCifrado, tamanho=intTamanho)
+
+   def testMuitoCurto(self):
+      with self.assertRaises(ValueError):
+         quebrarXOR(b'a')
+
+   def testReduzirPeriodo(self):
+      self.assertEqual(reduzirPeriodo(b'IFRNIFRN'), b'IFRN')
+      self.assertEqual(reduzirPeriodo(b'aaaa'), b'a')
+      self.assertEqual(reduzirPeriodo(b'abcab'), b'abcab')
+
+
+if __name__ == '__main__':
+   unittest.main()
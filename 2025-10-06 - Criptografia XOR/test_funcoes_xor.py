@@ -0,0 +1,142 @@
+'''
+   Testes de regressão do funcoes_xor.py
+
+   Exemplo de uso:
+      python -m unittest test_funcoes_xor.py
+'''
+import io, mmap, os, subprocess, sys, tempfile, unittest
+from itertools import cycle
+
+from funcoes_xor import criptografarTexto, mesmoArquivo, xorArquivoNoLugar, xorArquivoParalelo, xorBytes, xorFluxo
+
+DIR_SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+
+
+# ----------------------------------------------------------------------
+def _xorReferencia(dados: bytes, chave: bytes) -> bytes:
+   return bytes(d ^ k for d, k in zip(dados, cycle(chave)))
+
+
+# ----------------------------------------------------------------------
+class TesteCriptografarTexto(unittest.TestCase):
+
+   def testTextoVazio(self):
+      # O script corta a chave no tamanho do texto: texto vazio -> chave vazia
+      self.assertEqual(criptografarTexto('', ''), '')
+
+   def testChaveVazia(self):
+      with self.assertRaises(ValueError):
+         criptografarTexto('abc', '')
+
+   def testIdaEVolta(self):
+      for strTexto in ('Programação', 'IFRN 2025', 'emoji 🙂 fora do latin-1'):
+         with self.subTest(texto=strTexto):
+            self.assertEqual(criptografarTexto(criptografarTexto(strTexto, 'IFRN'), 'IFRN'), strTexto)
+
+
+# ----------------------------------------------------------------------
+class TesteXorBytes(unittest.TestCase):
+
+   def testReferencia(self):
+      bytDados = bytes(range(256)) * 300
+      for bytChave in (b'k', b'IFRN', bytes(range(7)) * 11):
+         with self.subTest(chave=len(bytChave)):
+            self.assertEqual(xorBytes(bytDados, bytChave), _xorReferencia(bytDados, bytChave))
+
+   def testDeslocamento(self):
+      bytDados = bytes(range(100))
+      self.assertEqual(xorBytes(bytDados[37:], b'chave', 37), _xorReferencia(bytDados, b'chave')[37:])
+
+
+# ----------------------------------------------------------------------
+class TesteXorFluxo(unittest.TestCase):
+
+   def testBlocosPequenos(self):
+      bytDados = os.urandom(10_007)
+      arqSaida = io.BytesIO()
+      self.assertEqual(xorFluxo(io.BytesIO(bytDados), arqSaida, b'chave', 333), len(bytDados))
+      self.assertEqual(arqSaida.getvalue(), _xorReferencia(bytDados, b'chave'))
+
+   def testBlocoInvalido(self):
+      # Com bloco 0, nada era lido e o resultado era um arquivo vazio
+      with self.assertRaises(ValueError):
+         xorFluxo(io.BytesIO(b'abc'), io.BytesIO(), b'k', 0)
+
+
+# ----------------------------------------------------------------------
+class TesteMesmoArquivo(unittest.TestCase):
+
+   def setUp(self):
+      self.dirTemp = tempfile.TemporaryDirectory()
+      self.bytDados = os.urandom(100_003)
+      self.bytEsperado = _xorReferencia(self.bytDados, b'abc')
+      self.strOrigem = os.path.join(self.dirTemp.name, 'origem.bin')
+      with open(self.strOrigem, 'wb') as arqOrigem:
+         arqOrigem.write(self.bytDados)
+
+   def tearDown(self):
+      self.dirTemp.cleanup()
+
+   def _ler(self, caminho: str) -> bytes:
+      with open(caminho, 'rb') as arqDados:
+         return arqDados.read()
+
+   def _executar(self, *args) -> subprocess.CompletedProcess:
+      return subprocess.run([sys.executable, os.path.join(DIR_SCRIPTS, 'criptografar_arquivo.py'), *args],
+                            capture_output=True, text=True)
+
+   def testLinks(self):
+      strSimbolico = os.path.join(self.dirTemp.name, 'simbolico.bin')
+      strFisico = os.path.join(self.dirTemp.name, 'fisico.bin')
+      os.symlink(self.strOrigem, strSimbolico)
+      os.link(self.strOrigem, strFisico)
+      self.assertTrue(mesmoArquivo(self.strOrigem, self.strOrigem))
+      self.assertTrue(mesmoArquivo(self.strOrigem, strSimbolico))
+      self.assertTrue(mesmoArquivo(strFisico, self.strOrigem))
+      self.assertFalse(mesmoArquivo(self.strOrigem, os.path.join(self.dirTemp.name, 'inexistente.bin')))
+
+   def testScriptMesmoArquivo(self):
+      # A saída aberta com 'wb' apagava a entrada: o resultado era vazio
+      strSimbolico = os.path.join(self.dirTemp.name, 'simbolico.bin')
+      os.symlink(self.strOrigem, strSimbolico)
+      for strSaida in (self.strOrigem, strSimbolico):
+         with self.subTest(saida=os.path.basename(strSaida)):
+            with open(self.strOrigem, 'wb') as arqOrigem:
+               arqOrigem.write(self.bytDados)
+            self.assertEqual(self._executar(self.strOrigem, strSaida, '-k', 'abc').returncode, 0)
+            self.assertEqual(self._ler(self.strOrigem), self.bytEsperado)
+
+   def testNoLugarVariasJanelas(self):
+      # Janela mínima: o arquivo (~100 KB) passa por várias janelas do mmap
+      self.assertEqual(xorArquivoNoLugar(self.strOrigem, b'abc', mmap.ALLOCATIONGRANULARITY), len(self.bytDados))
+      self.assertEqual(self._ler(self.strOrigem), self.bytEsperado)
+      xorArquivoNoLugar(self.strOrigem, b'abc')
+      self.assertEqual(self._ler(self.strOrigem), self.bytDados)
+
+   def testParaleloLinks(self):
+      # Com destino = link para a origem, a origem era truncada antes da leitura
+      strSimbolico = os.path.join(self.dirTemp.name, 'simbolico.bin')
+      strFisico = os.path.join(self.dirTemp.name, 'fisico.bin')
+      os.symlink(self.strOrigem, strSimbolico)
+      os.link(self.strOrigem, strFisico)
+      for strDestino in (self.strOrigem, strSimbolico, strFisico):
+         with self.subTest(destino=os.path.basename(strDestino)):
+            with open(self.strOrigem, 'wb') as arqOrigem:
+               arqOrigem.write(self.bytDados)
+            xorArquivoParalelo(self.strOrigem, strDestino, b'abc', 2, 4096)
+            self.assertEqual(self._ler(self.strOrigem), self.bytEsperado)
+
+   def testParaleloOutroArquivo(self):
+      strDestino = os.path.join(self.dirTemp.name, 'destino.bin')
+      xorArquivoParalelo(self.strOrigem, strDestino, b'abc', 3, 1000)
+      self.assertEqual(self._ler(strDestino), self.bytEsperado)
+      with self.assertRaises(ValueError):
+         xorArquivoParalelo(self.strOrigem, strDestino, b'abc', 2, 0)
+
+   def testScriptBlocoInvalido(self):
+      strSaida = os.path.join(self.dirTemp.name, 'saida.bin')
+      self.assertNotEqual(self._executar(self.strOrigem, strSaida, '-k', 'abc', '-b', '0').returncode, 0)
+
+
+if __name__ == '__main__':
+   unittest.main()